@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for API response serialization.
+
+Compares the previous path (payload builders copying documents and converting
+datetimes to ISO strings key by key, then Flask's default ``jsonify``) with
+the current one (single-pass builders, encoded by ``FastJSONProvider``) for a
+page of vocab cards and a full exercise catalog. Both produce the same JSON.
+
+Usage:
+    uv run python scripts/bench_json_responses.py
+    uv run python scripts/bench_json_responses.py --cards 100 500 --catalog 2000
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from bson import ObjectId
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+from src.api.web.vocab import _mongo_card_to_web
+from src.domain.services.exercise_catalog import ExerciseCatalogItem
+from src.domain.vocabulary_mongo import serialize_vocab_card
+from src.utils.json_encoding import FastJSONProvider, use_orjson
+
+CARD_DATETIME_KEYS = (
+    "created_at",
+    "updated_at",
+    "next_due_at",
+    "last_reviewed_at",
+    "deleted_at",
+)
+
+
+def legacy_serialize_vocab_card(doc):
+    payload = dict(doc)
+    payload["_id"] = str(payload["_id"])
+    for key in CARD_DATETIME_KEYS:
+        if isinstance(payload.get(key), datetime):
+            payload[key] = payload[key].isoformat()
+    return payload
+
+
+def legacy_json_time(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if value is None:
+        return None
+    return str(value)
+
+
+def legacy_catalog_to_dict(item):
+    payload = item.to_dict()
+    payload["last_opened_at"] = legacy_json_time(payload["last_opened_at"])
+    payload["completed_at"] = legacy_json_time(payload["completed_at"])
+    return payload
+
+
+def make_cards(count):
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "_id": ObjectId(),
+            "user_id": "user-1",
+            "language": "fr",
+            "text": f"mot {i}",
+            "text_normalized": f"mot {i}",
+            "item_type": "word",
+            "translation": f"word {i}",
+            "notes": ["note"],
+            "examples": [{"text": f"Un exemple avec mot {i}.", "translation": "ex"}],
+            "tags": ["delf", "b1"],
+            "level": "B1",
+            "source_context": {"exercise_id": f"ex-{i % 20}", "section": "CO"},
+            "status": "review",
+            "next_due_at": now + timedelta(days=i % 30),
+            "last_reviewed_at": now - timedelta(days=1),
+            "interval_days": 3.5,
+            "ease": 2.5,
+            "reps": 4,
+            "lapses": 1,
+            "streak_correct": 3,
+            "last_grade": "good",
+            "created_at": now - timedelta(days=60),
+            "updated_at": now,
+            "extra": {},
+        }
+        for i in range(count)
+    ]
+
+
+def make_catalog(count):
+    now = datetime.now(timezone.utc)
+    return [
+        ExerciseCatalogItem(
+            exercise_id=f"ex-{i}",
+            section=("CO", "CE", "PO", "PE")[i % 4],
+            source_type="delf",
+            title=f"Exercise {i}",
+            level="B1",
+            duration_seconds=180,
+            topic="travail",
+            route=f"/practice/{i}",
+            detail_endpoint=f"/api/web/exercises/{i}",
+            metadata={"tags": ["delf"], "variant": "tout-public"},
+            progress={
+                "status": "completed",
+                "score": 80.0,
+                "accuracy": 75.0,
+                "last_opened_at": now,
+                "completed_at": now,
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def time_us(fn, repeat):
+    return min(timeit.repeat(fn, number=repeat, repeat=3)) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--cards", type=int, nargs="+", default=[100])
+    parser.add_argument("--catalog", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    legacy_app = Flask("legacy")
+    legacy_app.json = DefaultJSONProvider(legacy_app)
+    fast_app = Flask("fast")
+    fast_app.json = FastJSONProvider(fast_app)
+
+    def build_response(app, data):
+        with app.app_context():
+            return jsonify({"status": "success", "message": "Success", "data": data})
+
+    print(f"encoder: {'orjson' if use_orjson() else 'stdlib'}")
+    print(f"{'payload':>16} {'before (us)':>12} {'after (us)':>11} {'speedup':>9}")
+
+    for count in args.cards:
+        cards = make_cards(count)
+
+        def before():
+            items = [_mongo_card_to_web(legacy_serialize_vocab_card(c)) for c in cards]
+            build_response(legacy_app, {"items": items, "total": count})
+
+        def after():
+            items = [_mongo_card_to_web(serialize_vocab_card(c)) for c in cards]
+            build_response(fast_app, {"items": items, "total": count})
+
+        before_us, after_us = time_us(before, args.repeat), time_us(after, args.repeat)
+        label = f"{count} cards"
+        print(
+            f"{label:>16} {before_us:>12.1f} {after_us:>11.1f} "
+            f"{before_us / after_us:>8.1f}x"
+        )
+
+    catalog = make_catalog(args.catalog)
+
+    def catalog_before():
+        items = [legacy_catalog_to_dict(item) for item in catalog]
+        build_response(legacy_app, {"items": items, "total": len(items)})
+
+    def catalog_after():
+        items = [item.to_dict() for item in catalog]
+        build_response(fast_app, {"items": items, "total": len(items)})
+
+    repeat = max(args.repeat // 10, 1)
+    before_us = time_us(catalog_before, repeat)
+    after_us = time_us(catalog_after, repeat)
+    label = f"{args.catalog} catalog"
+    print(
+        f"{label:>16} {before_us:>12.1f} {after_us:>11.1f} "
+        f"{before_us / after_us:>8.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
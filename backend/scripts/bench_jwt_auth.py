@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for per-request JWT authentication overhead.
+
+Simulates extension polling: a pool of users, each re-sending the same bearer
+token, is authenticated the way ``require_auth`` does it (plus a second decode
+for handlers that also call ``get_current_user``). Compares the previous
+decode (fresh HMAC key per call, no cache) with the pre-keyed signer alone and
+with the verified-token cache used by ``decode_jwt``.
+
+Usage:
+    uv run python scripts/bench_jwt_auth.py
+    uv run python scripts/bench_jwt_auth.py --users 10 1000 --decodes-per-request 1
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import random
+import sys
+import time
+import timeit
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.infra.auth import jwt as jwt_module
+from src.infra.auth.jwt import (
+    JWT_ISS,
+    JWT_SECRET,
+    _b64url_decode,
+    _verify_jwt,
+    create_jwt,
+    decode_jwt,
+)
+
+
+def legacy_decode(token):
+    """The decode used before the signer/cache change."""
+    try:
+        header_b64, payload_b64, sig_b64 = token.split(".")
+    except ValueError:
+        return None
+    signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
+    expected_sig = hmac.new(
+        JWT_SECRET.encode("utf-8"), signing_input, hashlib.sha256
+    ).digest()
+    try:
+        sig = _b64url_decode(sig_b64)
+    except Exception:
+        return None
+    if not hmac.compare_digest(sig, expected_sig):
+        return None
+    try:
+        payload = json.loads(_b64url_decode(payload_b64).decode("utf-8"))
+    except Exception:
+        return None
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)) and int(time.time()) > int(exp):
+        return None
+    iss = payload.get("iss")
+    if iss and iss != JWT_ISS:
+        return None
+    return payload
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--users", type=int, nargs="+", default=[10, 100, 1_000])
+    parser.add_argument("--decodes-per-request", type=int, default=2)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    variants = {
+        "legacy": legacy_decode,
+        "pre-keyed": _verify_jwt,
+        "cached": decode_jwt,
+    }
+
+    print(
+        f"{'users':>7} {'legacy (us)':>12} {'pre-keyed (us)':>15} "
+        f"{'cached (us)':>12} {'speedup':>9}"
+    )
+    for users in args.users:
+        tokens = [
+            create_jwt(
+                {
+                    "sub": f"user-{i}",
+                    "email": f"user-{i}@example.com",
+                    "name": f"User {i}",
+                    "picture": "https://example.com/avatar.png",
+                }
+            )
+            for i in range(users)
+        ]
+        traffic = [rng.choice(tokens) for _ in range(args.requests)]
+        jwt_module._token_cache.clear()
+
+        results = {}
+        for name, decode in variants.items():
+
+            def run():
+                for token in traffic:
+                    for _ in range(args.decodes_per_request):
+                        decode(token)
+
+            seconds = min(timeit.repeat(run, number=1, repeat=3))
+            results[name] = seconds / args.requests * 1e6
+
+        print(
+            f"{users:>7} {results['legacy']:>12.2f} {results['pre-keyed']:>15.2f} "
+            f"{results['cached']:>12.2f} "
+            f"{results['legacy'] / results['cached']:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
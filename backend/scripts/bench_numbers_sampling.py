@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for Numbers Dictation session creation.
+
+Compares the previous scan-and-sample path (filter the whole manifest, then
+``rng.sample`` the merged list) with the indexed bucket sampling used by
+``GitHubNumbersExerciseRepository`` as the manifest grows.
+
+Usage:
+    uv run python scripts/bench_numbers_sampling.py
+    uv run python scripts/bench_numbers_sampling.py --sizes 1000 100000 --count 10
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.shared.numbers.blueprints import NumberType
+from src.shared.numbers.repository.github_repo import (
+    GitHubNumbersExerciseRepository,
+)
+from src.shared.numbers.repository.manifest_cache import NumbersManifestCache
+
+
+class SyntheticManifestCache(NumbersManifestCache):
+    """Manifest cache fed with a generated manifest instead of HTTP."""
+
+    def __init__(self, size: int) -> None:
+        super().__init__(base_url="https://example.invalid")
+        self.size = size
+
+    def _fetch(self, version: str, etag: str | None) -> tuple[dict, str | None]:
+        types = list(NumberType)
+        manifest = {
+            "exercises": [
+                {
+                    "id": f"ex-{i}",
+                    "number_type": types[i % len(types)].value,
+                    "digits": str(i),
+                    "spoken_chunks": [str(i)],
+                    "sentence": str(i),
+                    "audio_ref": f"audio/{i}.mp3",
+                    "blueprint_id": "bench",
+                    "version_tag": "bench",
+                    "guest_preview": i % 10 == 0,
+                    "voice": "fr-FR-DeniseNeural",
+                }
+                for i in range(self.size)
+            ]
+        }
+        return manifest, None
+
+
+def scan_and_sample(repo, types, count, rng, guest_mode):
+    wanted = set(types)
+    available = [
+        ex
+        for ex in repo._load_all_exercises()
+        if ex.number_type in wanted and (not guest_mode or ex.guest_preview)
+    ]
+    return rng.sample(available, k=count)
+
+
+def indexed_sample(repo, types, count, rng, guest_mode):
+    repo.count_by_types(types, guest_preview_only=guest_mode)
+    return repo.sample_by_types(types, count, rng, guest_preview_only=guest_mode)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--count", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--guest", action="store_true")
+    args = parser.parse_args()
+
+    types = [NumberType.PHONE, NumberType.YEAR, NumberType.PRICE, NumberType.TIME]
+    rng = random.Random(42)
+
+    print(f"{'manifest':>10} {'scan (us)':>12} {'indexed (us)':>14} {'speedup':>9}")
+    for size in args.sizes:
+        repo = GitHubNumbersExerciseRepository(
+            base_url="https://example.invalid",
+            version="bench",
+            manifest_cache=SyntheticManifestCache(size),
+        )
+        repo._load_all_exercises()  # manifest load/index is one-off, not timed
+        results = []
+        for fn in (scan_and_sample, indexed_sample):
+            seconds = min(
+                timeit.repeat(
+                    lambda: fn(repo, types, args.count, rng, args.guest),
+                    number=args.repeat,
+                    repeat=3,
+                )
+            )
+            results.append(seconds / args.repeat * 1e6)
+        scan_us, indexed_us = results
+        print(
+            f"{size:>10} {scan_us:>12.1f} {indexed_us:>14.1f} "
+            f"{scan_us / indexed_us:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
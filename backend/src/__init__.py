@@ -7,12 +7,15 @@ Clean architecture with:
 - JWT authentication
 """
 
+import hmac
 import time
 import os
 from flask import Flask, request, Response
 
 from src.extensions import cors, logger
 from src.config import LearningConfig
+from src.infra.metrics import observe_request, refresh_gauges, render_metrics
+from src.utils.json_encoding import FastJSONProvider
 from src.utils.response_builder import ResponseBuilder
 
 METRICS_TOKEN = os.getenv("METRICS_TOKEN")
@@ -27,6 +30,7 @@ def create_app(config_object: type[LearningConfig] | None = None) -> Flask:
     """Create and configure the Learning Flask application."""
     app = Flask(__name__)
     app.config.from_object(config_object or LearningConfig())
+    app.json = FastJSONProvider(app)
 
     # ---------- CORS ----------
     default_origins = [
@@ -63,6 +67,23 @@ def create_app(config_object: type[LearningConfig] | None = None) -> Flask:
     def health():
         return ResponseBuilder().success(message="OK").build()
 
+    # ---------- Metrics ----------
+    # Prometheus scrape target; only served when METRICS_TOKEN is configured.
+    @app.get("/api/metrics")
+    def metrics():
+        if not METRICS_TOKEN:
+            return ResponseBuilder().error(message="Not found", status_code=404).build()
+        auth_header = request.headers.get("Authorization", "")
+        provided = auth_header[7:] if auth_header.startswith("Bearer ") else ""
+        if not hmac.compare_digest(provided.encode(), METRICS_TOKEN.encode()):
+            return (
+                ResponseBuilder()
+                .error(message="Invalid metrics token", status_code=403)
+                .build()
+            )
+        payload, content_type = render_metrics()
+        return Response(payload, content_type=content_type)
+
     # ---------- Request Timing ----------
     @app.before_request
     def _start_timer():
@@ -72,6 +93,8 @@ def create_app(config_object: type[LearningConfig] | None = None) -> Flask:
     def _track_latency(response):
         duration = time.time() - getattr(request, "_start_time", time.time())
         response.headers["X-Response-Time"] = f"{duration:.3f}s"
+        observe_request(request, response, duration)
+        refresh_gauges()
         return response
 
     # ---------- API BLUEPRINT ----------
@@ -84,11 +107,19 @@ def create_app(config_object: type[LearningConfig] | None = None) -> Flask:
     # Keep the vocab index definitions in sync with the live database so a stale
     # index (e.g. the old sparse uq_vocab_cards_user_legacy_sql_id) can't cause
     # duplicate-key errors on inserts.
-    from src.infra.mongo import ensure_vocabulary_indexes
+    from src.infra.mongo import ensure_vocabulary_indexes, warm_mongo_pool
 
     try:
         ensure_vocabulary_indexes()
     except Exception:  # pragma: no cover - never block app startup on indexing
         logger.exception("Failed to ensure vocabulary indexes")
 
+    # ---------- Mongo Pool Warmup ----------
+    # Open the pool's minimum connections before the first requests need them.
+    if app.config.get("MONGO_WARMUP") and os.getenv("MONGO_URI"):
+        try:
+            warm_mongo_pool()
+        except Exception:  # pragma: no cover - never block app startup on warmup
+            logger.exception("Failed to warm up the Mongo connection pool")
+
     return app
@@ -12,7 +12,7 @@ from sqlalchemy.orm import Session
 from src.api.errors import ForbiddenError, UnauthorizedError
 from src.config import Config
 from src.infra.auth.jwt import decode_jwt
-from src.infra.db.connection import db_session, get_db
+from src.infra.db.connection import get_db, lazy_db_session
 
 
 def get_bearer_token() -> str | None:
@@ -76,15 +76,16 @@ def require_auth(func):
 def with_db(func):
     """
     Decorator to inject database session.
-    Automatically commits on success, rolls back on error.
+    The session is created on first use; commits on success only if it did
+    any work, rolls back on error.
     """
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        with db_session() as db:
+        with lazy_db_session() as db:
             kwargs["db"] = db
             result = func(*args, **kwargs)
-            db.commit()
+            db.commit_if_needed()
             return result
 
     return wrapper
@@ -63,6 +63,18 @@ def _get_int_query(name: str, default: int) -> int:
         raise BadRequestError(f"{name} must be an integer") from exc
 
 
+def _get_optional_bool_query(name: str) -> bool | None:
+    raw = request.args.get(name)
+    if raw is None:
+        return None
+    value = raw.strip().lower()
+    if value in ("1", "true", "yes"):
+        return True
+    if value in ("0", "false", "no"):
+        return False
+    raise BadRequestError(f"{name} must be a boolean")
+
+
 @require_auth
 def ext_vocab_list(user_id: str):
     """GET /ext/vocab - List vocabulary cards."""
@@ -71,6 +83,8 @@ def ext_vocab_list(user_id: str):
         language=request.args.get("language", "").strip() or None,
         limit=_get_int_query("limit", 50),
         offset=_get_int_query("offset", 0),
+        cursor=request.args.get("cursor"),
+        include_total=_get_optional_bool_query("include_total"),
     )
     data = {**page, "items": [_mongo_card_to_ext(card) for card in page["items"]]}
 
@@ -31,6 +31,8 @@ from src.api.web.ai import (
     ai_generate_examples,
     ai_grammar_check,
     ai_create_mnemonic,
+    ai_job_status,
+    ai_job_events,
 )
 from src.api.web.numbers import (
     numbers_create_session,
@@ -176,6 +178,16 @@ web_bp.add_url_rule(
     view_func=ai_create_mnemonic,
     methods=["POST"],
 )
+web_bp.add_url_rule(
+    "/ai/jobs/<job_id>",
+    view_func=ai_job_status,
+    methods=["GET"],
+)
+web_bp.add_url_rule(
+    "/ai/jobs/<job_id>/events",
+    view_func=ai_job_events,
+    methods=["GET"],
+)
 
 # ==================== Numbers Dictation ====================
 web_bp.add_url_rule(
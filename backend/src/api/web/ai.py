@@ -1,9 +1,9 @@
 """AI API endpoints for Web."""
 
-from flask import request
+from flask import Response, request, url_for
 
 from src.api.decorators import require_auth
-from src.api.errors import BadRequestError
+from src.api.errors import BadRequestError, NotFoundError
 from src.api.schemas import (
     AIChatRequest,
     ExplainTextInput,
@@ -13,25 +13,108 @@ from src.api.schemas import (
     GrammarCheckRequest,
     MnemonicRequest,
 )
-from src.shared.ai import AIService, enforce_rate_limit
+from src.shared.ai import (
+    AIJobQueueFull,
+    AIRateLimitExceeded,
+    AIService,
+    enforce_rate_limit,
+    get_ai_job,
+    iter_ai_job_events,
+    require_global_quota,
+    submit_ai_job,
+)
 from src.utils.response_builder import ResponseBuilder
 
 
-def _check_rate_limit(user_id: str):
+def _rate_limit_response(rate_info: dict):
+    return (
+        ResponseBuilder()
+        .error(
+            message=f"Rate limit exceeded: {rate_info['scope']}",
+            error=rate_info,
+            status_code=429,
+        )
+        .with_headers({"Retry-After": str(rate_info.get("retry_after", 60))})
+        .build()
+    )
+
+
+def _check_rate_limit(user_id: str, *, include_global: bool = True):
     """Check rate limit and return error response if exceeded, else None."""
-    rate_info = enforce_rate_limit(user_id)
+    rate_info = enforce_rate_limit(user_id, include_global=include_global)
     if rate_info:
+        return _rate_limit_response(rate_info)
+    return None
+
+
+def _wants_async() -> bool:
+    """Clients opt into background execution with ``?async=true``."""
+    return request.args.get("async", "").strip().lower() in ("1", "true")
+
+
+def _submit_job(user_id: str, task: str, run):
+    """
+    Queue ``run`` as a background job and answer 202 with its id, or return
+    None when jobs are unavailable and the request should run inline.
+    """
+    try:
+        job = submit_ai_job(user_id, task, run)
+    except AIRateLimitExceeded as e:
+        return _rate_limit_response(e.info)
+    except AIJobQueueFull:
         return (
             ResponseBuilder()
-            .error(
-                message=f"Rate limit exceeded: {rate_info['scope']}",
-                error=rate_info,
-                status_code=429,
-            )
-            .with_headers({"Retry-After": str(rate_info.get("retry_after", 60))})
+            .error(message="AI job queue is full, retry shortly", status_code=503)
+            .with_headers({"Retry-After": "5"})
             .build()
         )
-    return None
+    if job is None:
+        return None
+
+    job["poll_url"] = url_for("api.web.ai_job_status", job_id=job["job_id"])
+    job["stream_url"] = url_for("api.web.ai_job_events", job_id=job["job_id"])
+    return (
+        ResponseBuilder()
+        .success(message="Accepted", data=job, status_code=202)
+        .with_headers({"Location": job["poll_url"]})
+        .build()
+    )
+
+
+def _run_task(user_id: str, task: str, run):
+    """Run an AI task inline, or as a background job when requested."""
+    rate_resp = _check_rate_limit(user_id)
+    if rate_resp:
+        return rate_resp
+
+    if _wants_async():
+        job_resp = _submit_job(user_id, task, run)
+        if job_resp is not None:
+            return job_resp
+
+    return ResponseBuilder().success(data=run()).build()
+
+
+def _run_cacheable_task(user_id: str, task: str, run):
+    """
+    Run a cacheable learning task. The user's own limits always apply; the
+    global bucket is only charged when the answer is not cached and the model
+    is actually called.
+    """
+    rate_resp = _check_rate_limit(user_id, include_global=False)
+    if rate_resp:
+        return rate_resp
+
+    if _wants_async():
+        job_resp = _submit_job(user_id, task, lambda: run(require_global_quota))
+        if job_resp is not None:
+            return job_resp
+
+    try:
+        result = run(require_global_quota)
+    except AIRateLimitExceeded as e:
+        return _rate_limit_response(e.info)
+    return ResponseBuilder().success(data=result).build()
 
 
 @require_auth
@@ -44,20 +127,17 @@ def ai_chat(user_id: str):
     except Exception as e:
         raise BadRequestError(str(e))
 
-    rate_resp = _check_rate_limit(user_id)
-    if rate_resp:
-        return rate_resp
-
-    ai_service = AIService()
-    result = ai_service.chat(
-        user_id=user_id,
-        message=req.message,
-        language=req.language,
-        conversation_id=req.conversation_id,
+    return _run_task(
+        user_id,
+        "chat",
+        lambda: AIService().chat(
+            user_id=user_id,
+            message=req.message,
+            language=req.language,
+            conversation_id=req.conversation_id,
+        ),
     )
 
-    return ResponseBuilder().success(data=result).build()
-
 
 @require_auth
 def web_ai_assist(user_id: str):
@@ -69,23 +149,20 @@ def web_ai_assist(user_id: str):
     except Exception as e:
         raise BadRequestError(str(e))
 
-    rate_resp = _check_rate_limit(user_id)
-    if rate_resp:
-        return rate_resp
-
-    ai_service = AIService()
-    result = ai_service.explain_text_structured(
-        text=req.text,
-        learning_lang=req.learning_lang,
-        native_lang=req.native_lang,
-        level=req.level,
-        target_langs=req.target_langs,
-        include_synonyms=req.include_synonyms,
-        include_examples=req.include_examples,
+    return _run_task(
+        user_id,
+        "assist",
+        lambda: AIService().explain_text_structured(
+            text=req.text,
+            learning_lang=req.learning_lang,
+            native_lang=req.native_lang,
+            level=req.level,
+            target_langs=req.target_langs,
+            include_synonyms=req.include_synonyms,
+            include_examples=req.include_examples,
+        ),
     )
 
-    return ResponseBuilder().success(data=result).build()
-
 
 @require_auth
 def ai_quick_explain(user_id: str):
@@ -97,16 +174,16 @@ def ai_quick_explain(user_id: str):
     except Exception as e:
         raise BadRequestError(str(e))
 
-    rate_resp = _check_rate_limit(user_id)
-    if rate_resp:
-        return rate_resp
-
-    result = AIService().quick_explain(
-        text=req.text,
-        learning_lang=req.learning_lang,
-        native_lang=req.native_lang,
+    return _run_cacheable_task(
+        user_id,
+        "quick_explain",
+        lambda before_generate: AIService().quick_explain(
+            text=req.text,
+            learning_lang=req.learning_lang,
+            native_lang=req.native_lang,
+            before_generate=before_generate,
+        ),
     )
-    return ResponseBuilder().success(data=result).build()
 
 
 @require_auth
@@ -119,17 +196,17 @@ def ai_deep_breakdown(user_id: str):
     except Exception as e:
         raise BadRequestError(str(e))
 
-    rate_resp = _check_rate_limit(user_id)
-    if rate_resp:
-        return rate_resp
-
-    result = AIService().deep_breakdown(
-        text=req.text,
-        learning_lang=req.learning_lang,
-        native_lang=req.native_lang,
-        level=req.level,
+    return _run_cacheable_task(
+        user_id,
+        "deep_breakdown",
+        lambda before_generate: AIService().deep_breakdown(
+            text=req.text,
+            learning_lang=req.learning_lang,
+            native_lang=req.native_lang,
+            level=req.level,
+            before_generate=before_generate,
+        ),
     )
-    return ResponseBuilder().success(data=result).build()
 
 
 @require_auth
@@ -142,18 +219,18 @@ def ai_generate_examples(user_id: str):
     except Exception as e:
         raise BadRequestError(str(e))
 
-    rate_resp = _check_rate_limit(user_id)
-    if rate_resp:
-        return rate_resp
-
-    result = AIService().generate_examples(
-        text=req.text,
-        learning_lang=req.learning_lang,
-        native_lang=req.native_lang,
-        level=req.level,
-        count=req.count,
+    return _run_cacheable_task(
+        user_id,
+        "generate_examples",
+        lambda before_generate: AIService().generate_examples(
+            text=req.text,
+            learning_lang=req.learning_lang,
+            native_lang=req.native_lang,
+            level=req.level,
+            count=req.count,
+            before_generate=before_generate,
+        ),
     )
-    return ResponseBuilder().success(data=result).build()
 
 
 @require_auth
@@ -166,16 +243,15 @@ def ai_grammar_check(user_id: str):
     except Exception as e:
         raise BadRequestError(str(e))
 
-    rate_resp = _check_rate_limit(user_id)
-    if rate_resp:
-        return rate_resp
-
-    result = AIService().grammar_check(
-        text=req.text,
-        learning_lang=req.learning_lang,
-        native_lang=req.native_lang,
+    return _run_task(
+        user_id,
+        "grammar_check",
+        lambda: AIService().grammar_check(
+            text=req.text,
+            learning_lang=req.learning_lang,
+            native_lang=req.native_lang,
+        ),
     )
-    return ResponseBuilder().success(data=result).build()
 
 
 @require_auth
@@ -188,13 +264,41 @@ def ai_create_mnemonic(user_id: str):
     except Exception as e:
         raise BadRequestError(str(e))
 
-    rate_resp = _check_rate_limit(user_id)
-    if rate_resp:
-        return rate_resp
+    return _run_cacheable_task(
+        user_id,
+        "create_mnemonic",
+        lambda before_generate: AIService().create_mnemonic(
+            text=req.text,
+            learning_lang=req.learning_lang,
+            native_lang=req.native_lang,
+            before_generate=before_generate,
+        ),
+    )
+
+
+@require_auth
+def ai_job_status(user_id: str, job_id: str):
+    """GET /web/ai/jobs/<job_id> - Poll a background AI job."""
+    job = get_ai_job(job_id, user_id)
+    if job is None:
+        raise NotFoundError("AI job not found")
+    return ResponseBuilder().success(data=job).build()
+
 
-    result = AIService().create_mnemonic(
-        text=req.text,
-        learning_lang=req.learning_lang,
-        native_lang=req.native_lang,
+@require_auth
+def ai_job_events(user_id: str, job_id: str):
+    """
+    GET /web/ai/jobs/<job_id>/events - Stream job progress as Server-Sent Events.
+
+    Each stream lasts at most AI_JOB_STREAM_TIMEOUT_SECONDS and holds a worker
+    meanwhile. Authenticated like every route (Authorization header), so
+    clients read it with ``fetch`` and request it again after ``timeout``
+    until the ``result`` event arrives.
+    """
+    if get_ai_job(job_id, user_id) is None:
+        raise NotFoundError("AI job not found")
+    return Response(
+        iter_ai_job_events(job_id, user_id),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    return ResponseBuilder().success(data=result).build()
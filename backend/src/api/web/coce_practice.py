@@ -21,10 +21,20 @@ from flask import request
 
 from src.api.decorators import require_auth
 from src.api.errors import BadRequestError, NotFoundError
+from src.domain.services.exercise_catalog import invalidate_exercise_catalog
+from src.extensions import logger
+from src.shared.coce_practice.content_service import (
+    invalidate_coce_content_cache,
+    resolve_coce_questions,
+    resolve_coce_transcript,
+    set_cached_coce_questions,
+    set_cached_coce_transcript,
+)
 from src.shared.coce_practice.exercise_repository import CoCeExerciseRepository
 from src.shared.coce_practice.github_manager import GitHubCoCeManager
 from src.shared.coce_practice.repository import GitHubCoCePracticeRepository
 from src.shared.coce_practice.schemas import (
+    CoCeTranscript,
     CreateExerciseRequest,
     ExerciseDetail,
     ExerciseResponse,
@@ -198,7 +208,7 @@ def coce_get_transcript(exercise_id: str):
     """
     GET /web/coce/exercises/<exercise_id>/transcript
 
-    Returns transcript.json content for an exercise (fetched from GitHub).
+    Returns transcript.json content for an exercise (Redis-cached, GitHub on miss).
     """
     exercise_repo = CoCeExerciseRepository()
     ex = exercise_repo.get_by_id(exercise_id)
@@ -213,10 +223,8 @@ def coce_get_transcript(exercise_id: str):
     ):
         raise NotFoundError("Transcript not available in guest mode")
 
-    github_repo = GitHubCoCePracticeRepository(level=ex.level)
-
     try:
-        transcript = github_repo.fetch_transcript(ex.media_id)
+        transcript = resolve_coce_transcript(exercise=ex)
     except Exception as e:
         raise NotFoundError(f"Transcript not found: {e}")
 
@@ -227,7 +235,8 @@ def coce_get_questions(exercise_id: str):
     """
     GET /web/coce/exercises/<exercise_id>/questions?type=co|ce
 
-    Returns questions_co.json or questions_ce.json content (fetched from GitHub).
+    Returns questions_co.json or questions_ce.json content (Redis-cached, GitHub
+    on miss).
     """
     variant = (
         (request.args.get("type") or request.args.get("variant") or "").strip().lower()
@@ -248,10 +257,8 @@ def coce_get_questions(exercise_id: str):
     ):
         raise NotFoundError("Questions not available in guest mode")
 
-    github_repo = GitHubCoCePracticeRepository(level=ex.level)
-
     try:
-        questions = github_repo.fetch_questions(ex.media_id, variant=variant)
+        questions = resolve_coce_questions(exercise=ex, variant=variant)
     except Exception as e:
         raise NotFoundError(f"Questions file not found: {e}")
 
@@ -305,6 +312,7 @@ def admin_create_exercise(user_id: str):
         ce_path=paths["ce_path"],
         transcript_path=paths["transcript_path"],
     )
+    invalidate_exercise_catalog()
 
     return (
         ResponseBuilder()
@@ -342,6 +350,9 @@ def admin_update_exercise(user_id: str, exercise_id: str):
 
     if not exercise:
         raise NotFoundError("Exercise not found")
+    invalidate_exercise_catalog()
+    if "level" in updates or "media_id" in updates:
+        invalidate_coce_content_cache(exercise_id)
 
     return (
         ResponseBuilder()
@@ -362,6 +373,8 @@ def admin_delete_exercise(user_id: str, exercise_id: str):
 
     if not success:
         raise NotFoundError("Exercise not found")
+    invalidate_exercise_catalog()
+    invalidate_coce_content_cache(exercise_id)
 
     return (
         ResponseBuilder()
@@ -419,6 +432,7 @@ def admin_save_qcm(user_id: str):
         content=content,
         commit_message=f"chore: update {req.variant.upper()} questions for exercise {exercise.name}",
     )
+    set_cached_coce_questions(exercise.id, req.variant, req.qcm_data)
 
     return (
         ResponseBuilder()
@@ -471,6 +485,7 @@ def admin_save_transcript(user_id: str):
         content=content,
         commit_message=f"chore: update transcript for exercise {exercise.name}",
     )
+    set_cached_coce_transcript(exercise.id, req.transcript_data)
 
     return (
         ResponseBuilder()
@@ -544,6 +559,7 @@ def admin_generate_youtube_transcript(user_id: str):
         exercise_repo.update_exercise(
             exercise_id, duration_seconds=yt_data["duration_seconds"]
         )
+        invalidate_exercise_catalog()
 
     github_mgr = GitHubCoCeManager()
     content = json.dumps(transcript_data, indent=2, ensure_ascii=False)
@@ -553,6 +569,13 @@ def admin_generate_youtube_transcript(user_id: str):
         content=content,
         commit_message=f"chore: add auto-generated transcript from YouTube for {exercise.name}",
     )
+    try:
+        set_cached_coce_transcript(
+            exercise.id, CoCeTranscript.model_validate(transcript_data)
+        )
+    except ValueError as e:
+        logger.warning(f"[COCE] Generated transcript not cacheable: {e}")
+        invalidate_coce_content_cache(exercise.id)
 
     return (
         ResponseBuilder()
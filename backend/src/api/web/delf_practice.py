@@ -24,12 +24,18 @@ from flask import request, Response
 from src.api.decorators import require_auth
 from src.api.errors import BadRequestError, NotFoundError, ForbiddenError
 from src.config import Config
+from src.domain.services.exercise_catalog import invalidate_exercise_catalog
+from src.infra.http import iter_response_chunks
 from src.shared.delf_practice.content_service import (
     invalidate_delf_content_cache,
     resolve_delf_content,
 )
 from src.shared.delf_practice.github_manager import GitHubDelfManager
 from src.shared.delf_practice.github_repository import GitHubDelfRepository
+from src.shared.delf_practice.media_cache import (
+    fetch_delf_media,
+    invalidate_delf_media,
+)
 from src.shared.delf_practice.asset_paths import (
     image_upload_path,
     legacy_flat_image_ref_to_nested,
@@ -42,6 +48,7 @@ from src.shared.delf_practice.local_asset_service import (
     parse_crop_box,
 )
 from src.shared.delf_practice.test_paper_repository import DelfTestPaperRepository
+from src.shared.media_cache import get_media_cache, send_media
 from src.shared.delf_practice.schemas import (
     CreateDelfTestPaperRequest,
     UpdateDelfTestPaperRequest,
@@ -289,15 +296,70 @@ def _build_delf_test_detail(
     return ResponseBuilder().success(data=result.model_dump(mode="json")).build()
 
 
+def _serve_delf_media(
+    github_path: str,
+    *,
+    default_content_type: str,
+    not_found_message: str,
+):
+    """Serve a DELF file from the local media cache, filling it on a miss."""
+    github_repo = GitHubDelfRepository()
+    cache = get_media_cache()
+    if cache is None:
+        return _proxy_delf_media(
+            github_path,
+            github_repo=github_repo,
+            default_content_type=default_content_type,
+            not_found_message=not_found_message,
+        )
+
+    def load():
+        return fetch_delf_media(github_path, cache=cache, github_repo=github_repo)
+
+    try:
+        blob = load()
+    except Exception:
+        raise NotFoundError(not_found_message)
+
+    return send_media(blob, default_content_type=default_content_type, refill=load)
+
+
+def _proxy_delf_media(
+    github_path: str,
+    *,
+    github_repo: GitHubDelfRepository,
+    default_content_type: str,
+    not_found_message: str,
+):
+    """Stream a DELF file straight from GitHub (media cache disabled)."""
+    url = f"{github_repo.base_url}/{github_path}"
+
+    try:
+        resp = github_repo.fetch_raw(url)
+    except Exception:
+        try:
+            resp = GitHubDelfManager().open_file_stream(github_path)
+        except Exception:
+            raise NotFoundError(not_found_message)
+        content_type = mimetypes.guess_type(github_path)[0] or default_content_type
+    else:
+        content_type = resp.headers.get("Content-Type", default_content_type)
+
+    return Response(
+        iter_response_chunks(resp),
+        content_type=content_type,
+        headers={"Cache-Control": "public, max-age=86400"},
+    )
+
+
 def delf_proxy_audio(audio_path: str):
     """
     GET /web/delf/audio/<path:audio_path>
 
-    Proxy audio file from GitHub.
+    Proxy audio file from GitHub (served from the local media cache).
     Path format: <level>/<variant>/<section>/<filename>
     or legacy/internal: <level>/<variant>/<section>/audio/<filename>
     """
-    github_repo = GitHubDelfRepository()
     path_parts = audio_path.strip("/").split("/")
     if len(path_parts) >= 4:
         level, variant, section, *rest = path_parts
@@ -305,30 +367,11 @@ def delf_proxy_audio(audio_path: str):
             rest.pop(0)
         path_parts = [level, variant, section, "audio", *rest]
     github_path = f"delf/{'/'.join(path_parts)}"
-    url = f"{github_repo.base_url}/{github_path}"
-
-    try:
-        resp = github_repo.fetch_raw(url)
-    except Exception:
-        try:
-            content = GitHubDelfManager().read_file(github_path)
-        except Exception:
-            raise NotFoundError("Audio file not found")
-
-        content_type = mimetypes.guess_type(audio_path)[0] or "audio/mpeg"
-        return Response(
-            content,
-            content_type=content_type,
-            headers={"Cache-Control": "public, max-age=86400"},
-        )
-
-    # Determine content type
-    content_type = resp.headers.get("Content-Type", "audio/mpeg")
 
-    return Response(
-        resp.iter_content(chunk_size=8192),
-        content_type=content_type,
-        headers={"Cache-Control": "public, max-age=86400"},
+    return _serve_delf_media(
+        github_path,
+        default_content_type="audio/mpeg",
+        not_found_message="Audio file not found",
     )
 
 
@@ -336,10 +379,9 @@ def delf_proxy_asset(asset_path: str):
     """
     GET /web/delf/assets/<path:asset_path>
 
-    Proxy image asset from GitHub.
+    Proxy image asset from GitHub (served from the local media cache).
     Path format: <level>/<variant>/<section>/assets/<filename-or-nested-path>
     """
-    github_repo = GitHubDelfRepository()
     path_parts = asset_path.strip("/").split("/")
     if len(path_parts) >= 5:
         level, variant, section, assets_segment, *rest = path_parts
@@ -348,29 +390,11 @@ def delf_proxy_asset(asset_path: str):
             if normalized is not None:
                 path_parts = [level, variant, section, *normalized.split("/")]
     github_path = f"delf/{'/'.join(path_parts)}"
-    url = f"{github_repo.base_url}/{github_path}"
-
-    try:
-        resp = github_repo.fetch_raw(url)
-    except Exception:
-        try:
-            content = GitHubDelfManager().read_file(github_path)
-        except Exception:
-            raise NotFoundError("Asset not found")
-
-        content_type = mimetypes.guess_type(asset_path)[0] or "image/webp"
-        return Response(
-            content,
-            content_type=content_type,
-            headers={"Cache-Control": "public, max-age=86400"},
-        )
-
-    content_type = resp.headers.get("Content-Type", "image/webp")
 
-    return Response(
-        resp.iter_content(chunk_size=8192),
-        content_type=content_type,
-        headers={"Cache-Control": "public, max-age=86400"},
+    return _serve_delf_media(
+        github_path,
+        default_content_type="image/webp",
+        not_found_message="Asset not found",
     )
 
 
@@ -427,6 +451,7 @@ def delf_admin_create_test(user_id: str):
         audio_filename=req.audio_filename,
         status=req.status,
     )
+    invalidate_exercise_catalog()
 
     return (
         ResponseBuilder()
@@ -463,6 +488,7 @@ def delf_admin_update_test(user_id: str, test_paper_id: str):
 
     if not paper:
         raise NotFoundError("Test paper not found")
+    invalidate_exercise_catalog()
 
     return (
         ResponseBuilder()
@@ -488,6 +514,7 @@ def delf_admin_delete_test(user_id: str, test_paper_id: str):
     if not success:
         raise NotFoundError("Test paper not found")
 
+    invalidate_exercise_catalog()
     invalidate_delf_content_cache(
         level=paper.level,
         variant=paper.variant,
@@ -595,6 +622,7 @@ def delf_admin_save_test_content(user_id: str):
     else:
         repo.update(paper.id, **update_fields)
 
+    invalidate_exercise_catalog()
     invalidate_delf_content_cache(
         level=paper.level,
         variant=paper.variant,
@@ -664,9 +692,11 @@ def delf_admin_upload_file(user_id: str):
         content=content_bytes,
         commit_message=f"chore: upload DELF {req.folder} file for {paper.test_id} ({filename})",
     )
+    invalidate_delf_media(file_path)
 
     if req.folder == "audio" and req.update_audio_filename:
         repo.update(req.test_paper_id, audio_filename=filename)
+        invalidate_exercise_catalog()
 
     invalidate_delf_content_cache(
         level=paper.level,
@@ -795,6 +825,7 @@ def delf_admin_upload_screenshot_assets(user_id: str):
                     f"(q{question.question_number} {option.label.lower()})"
                 ),
             )
+            invalidate_delf_media(path.github_path)
             uploaded_assets.append(
                 {
                     "question_number": question.question_number,
@@ -1,7 +1,7 @@
 """Numbers Dictation API endpoints for Web.
 
 Runtime flow (no DB persistence):
-- Sessions are in-memory
+- Sessions live in the Numbers session store (Redis, or in-process LRU)
 - Exercises are sampled from a pre-generated dataset (GitHub-backed by default)
 
 Admin dataset generation is exposed separately under /web/numbers/admin/*.
@@ -9,14 +9,17 @@ Admin dataset generation is exposed separately under /web/numbers/admin/*.
 
 from __future__ import annotations
 
+import requests
 from flask import redirect, request
 
 from src.api.errors import BadRequestError, NotFoundError
 from src.config import Config
+from src.extensions import logger
 from src.shared.numbers.controllers import (
     build_audio_url,
     get_generator,
     parse_number_types,
+    resolve_data_version,
 )
 from src.shared.numbers.session_engine import (
     apply_answer,
@@ -25,6 +28,12 @@ from src.shared.numbers.session_engine import (
     get_session,
     save_session,
 )
+from src.shared.media_cache import (
+    fetch_media,
+    get_media_cache,
+    open_media_stream,
+    send_media,
+)
 from src.utils.response_builder import ResponseBuilder
 
 
@@ -34,6 +43,8 @@ def numbers_create_session():
     Preferred body:
     { \"types\": [\"PHONE\", \"YEAR\"], \"count\": 5 }
 
+    Optional: \"version\" pins a served dataset version (defaults to the current one).
+
     Back-compat (best-effort):
     { \"difficulty\": \"medium\", \"count\": 10 }
     """
@@ -65,9 +76,16 @@ def numbers_create_session():
         except ValueError as e:
             raise BadRequestError(str(e))
 
+    try:
+        version = resolve_data_version(payload.get("version"))
+    except ValueError as e:
+        raise BadRequestError(str(e))
+
     try:
         generator = get_generator()
-        session = generator.create_session(types, count, guest_mode=guest_mode)
+        session = generator.create_session(
+            types, count, guest_mode=guest_mode, version=version
+        )
         save_session(session)
     except Exception as e:
         raise BadRequestError(str(e))
@@ -80,6 +98,7 @@ def numbers_create_session():
                 "types": [t.value for t in types],
                 "count": count,
                 "guest_mode": guest_mode,
+                "version": version,
             },
             status_code=201,
         )
@@ -168,7 +187,10 @@ def numbers_get_summary(session_id: str):
 def numbers_audio_stream(audio_ref: str):
     """GET /web/numbers/audio/{audio_ref}
 
-    - If `audio_ref` is a Git-backed path (contains '/'): redirect to NUMBERS_AUDIO_BASE_URL/audio_ref
+    - If `audio_ref` is a Git-backed path (contains '/'): serve it from the local
+      media cache (Range / conditional GET aware), filling from
+      NUMBERS_AUDIO_BASE_URL/audio_ref on a miss. Without a usable cache, or if
+      the upstream fetch fails for reasons other than 404, redirect there.
     - Legacy Drive file IDs are no longer supported.
     """
     if "/" in audio_ref:
@@ -182,7 +204,28 @@ def numbers_audio_stream(audio_ref: str):
                 )
                 .build()
             )
-        return redirect(f"{base_url.rstrip('/')}/{audio_ref.lstrip('/')}")
+        audio_path = audio_ref.lstrip("/")
+        audio_url = f"{base_url.rstrip('/')}/{audio_path}"
+        cache = get_media_cache()
+        if cache is None:
+            return redirect(audio_url)
+
+        def load():
+            return fetch_media(
+                audio_path, lambda: open_media_stream(audio_url), cache=cache
+            )
+
+        try:
+            blob = load()
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                raise NotFoundError("Audio file not found")
+            logger.warning(f"[NUMBERS] Audio cache fill failed for {audio_path}: {e}")
+            return redirect(audio_url)
+        except requests.RequestException as e:
+            logger.warning(f"[NUMBERS] Audio cache fill failed for {audio_path}: {e}")
+            return redirect(audio_url)
+        return send_media(blob, default_content_type="audio/mpeg", refill=load)
 
     return (
         ResponseBuilder()
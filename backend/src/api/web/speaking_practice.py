@@ -15,6 +15,15 @@ from flask import request, Response
 from src.api.decorators import require_auth
 from src.api.errors import BadRequestError, NotFoundError
 from src.shared.github_manager import GitHubContentManager
+from src.shared.media_cache import fetch_media, get_media_cache, send_media
+from src.shared.speaking_practice_content_service import (
+    resolve_speaking_content,
+    resolve_speaking_manifest,
+    resolve_speaking_manifests,
+    resolve_speaking_topics,
+    set_cached_speaking_content,
+    set_cached_speaking_manifest,
+)
 from src.shared.speaking_practice_repo import SpeakingPracticeRepository
 from src.utils.response_builder import ResponseBuilder
 from src.config import Config
@@ -68,7 +77,7 @@ def _resolve_allowed_guest_content_paths(
     topic_id: str,
     limit: int = 2,
 ) -> set[str]:
-    manifest = repo.get_manifest(topic_id)
+    manifest = resolve_speaking_manifest(topic_id, repo)
     subtopics = manifest.get("subtopics", [])
     if not isinstance(subtopics, list):
         raise BadRequestError("Invalid manifest: subtopics must be a list")
@@ -85,26 +94,18 @@ def _resolve_guest_topic_access(
     repo: SpeakingPracticeRepository,
     limit: int = 2,
 ) -> tuple[dict[str, dict[str, Any]], bool]:
-    topic_ids = repo.list_topics()
-    manifests: dict[str, dict[str, Any]] = {}
+    topic_ids = resolve_speaking_topics(repo)
+    manifests = resolve_speaking_manifests(topic_ids, repo)
     explicit_guest_preview_exists = False
 
-    for topic_id in topic_ids:
-        try:
-            manifest = repo.get_manifest(topic_id)
-        except Exception as e:
-            logger.warning(
-                f"[SPEAKING-PRACTICE] Could not fetch manifest for {topic_id}: {e}"
-            )
-            continue
-
+    for manifest in manifests.values():
         subtopics = manifest.get("subtopics", [])
         if isinstance(subtopics, list) and any(
             isinstance(subtopic, dict) and subtopic.get("guest_preview")
             for subtopic in subtopics
         ):
             explicit_guest_preview_exists = True
-        manifests[topic_id] = manifest
+            break
 
     guest_access: dict[str, dict[str, Any]] = {}
     for topic_id, manifest in manifests.items():
@@ -158,45 +159,31 @@ def speaking_practice_list_topics():
     """
     GET /web/speaking-practice/topics
 
-    List all available speaking practice topics from GitHub.
+    List all available speaking practice topics from GitHub (Redis-cached;
+    missing manifests are fetched in parallel).
     No authentication required (public content).
     """
     repo = SpeakingPracticeRepository(base_url=Config.NUMBERS_AUDIO_BASE_URL)
 
     try:
-        guest_access = None
         if _is_guest_mode():
             guest_access, _ = _resolve_guest_topic_access(repo)
-
-        topic_ids = (
-            list(guest_access.keys())
-            if guest_access is not None
-            else repo.list_topics()
-        )
+            manifests = {
+                topic_id: entry["manifest"] for topic_id, entry in guest_access.items()
+            }
+        else:
+            manifests = resolve_speaking_manifests(resolve_speaking_topics(repo), repo)
 
         topics = []
-        for topic_id in topic_ids:
-            try:
-                manifest = (
-                    guest_access[topic_id]["manifest"]
-                    if guest_access is not None
-                    else repo.get_manifest(topic_id)
-                )
-                subtopics = manifest.get("subtopics", [])
-                topics.append(
-                    {
-                        "id": topic_id,
-                        "title": manifest.get(
-                            "title", topic_id.replace("_", " ").title()
-                        ),
-                        "subtopics_count": len(subtopics),
-                    }
-                )
-            except Exception as e:
-                logger.warning(
-                    f"[SPEAKING-PRACTICE] Could not fetch manifest for {topic_id}: {e}"
-                )
-                continue
+        for topic_id, manifest in manifests.items():
+            subtopics = manifest.get("subtopics", [])
+            topics.append(
+                {
+                    "id": topic_id,
+                    "title": manifest.get("title", topic_id.replace("_", " ").title()),
+                    "subtopics_count": len(subtopics),
+                }
+            )
 
         return ResponseBuilder().success(data={"topics": topics}).build()
 
@@ -221,7 +208,7 @@ def speaking_practice_get_manifest(topic_id: str):
                 raise NotFoundError(f"Topic '{topic_id}' not available in guest mode")
             manifest = guest_entry["manifest"]
         else:
-            manifest = repo.get_manifest(topic_id)
+            manifest = resolve_speaking_manifest(topic_id, repo)
         return ResponseBuilder().success(data=manifest).build()
 
     except requests.HTTPError as e:
@@ -257,7 +244,7 @@ def speaking_practice_get_content():
             allowed_paths = guest_entry["content_paths"]
             if content_path not in allowed_paths:
                 raise NotFoundError("Content not available in guest mode")
-        content = repo.get_content(content_path)
+        content = resolve_speaking_content(content_path, repo)
         if _is_guest_mode():
             items = content.get("items", [])
             if isinstance(items, list):
@@ -276,7 +263,8 @@ def speaking_practice_stream_audio():
     """
     GET /web/speaking-practice/audio?path={audioPath}
 
-    Stream audio file from GitHub.
+    Stream audio file from GitHub (served from the local media cache, with
+    Range and conditional GET support).
     No authentication required (public content).
 
     Example: ?path=speaking-practice/alimentation/modes_consommation/audio/intro.mp3
@@ -300,8 +288,22 @@ def speaking_practice_stream_audio():
             content_path = f"speaking-practice/{topic_id}/{subtopic_id}/content.json"
             if content_path not in allowed_paths:
                 raise NotFoundError("Audio not available in guest mode")
-        audio_bytes = repo.get_audio(audio_path)
-        return Response(audio_bytes, mimetype="audio/mpeg")
+        cache = get_media_cache()
+        if cache is None:
+            return Response(
+                repo.stream_audio(audio_path),
+                mimetype="audio/mpeg",
+                headers={"Cache-Control": "public, max-age=86400"},
+            )
+
+        def load():
+            return fetch_media(
+                audio_path,
+                lambda: repo.open_audio_stream(audio_path),
+                cache=cache,
+            )
+
+        return send_media(load(), default_content_type="audio/mpeg", refill=load)
 
     except requests.HTTPError as e:
         if e.response.status_code == 404:
@@ -384,6 +386,7 @@ def speaking_practice_admin_mark_guest_preview(user_id: str):
         content=json.dumps(manifest, indent=2, ensure_ascii=False) + "\n",
         commit_message=f"chore: update speaking guest preview for topic {topic_id}",
     )
+    set_cached_speaking_manifest(topic_id, manifest)
 
     updated_content_paths: list[str] = []
     selected_content_paths: list[str] = []
@@ -458,6 +461,7 @@ def speaking_practice_admin_mark_guest_preview(user_id: str):
                 f"chore: update speaking guest preview items for {topic_id}/{subtopic_id or 'unknown'}"
             ),
         )
+        set_cached_speaking_content(content_path, content)
         updated_content_paths.append(content_path)
         if subtopic_id in selected_subtopic_ids:
             content_item_counts[content_path] = len(selected_item_ids)
@@ -1,6 +1,5 @@
 """Vocabulary API endpoints for Web."""
 
-from datetime import datetime, timezone
 from typing import Any
 
 from flask import request
@@ -74,6 +73,18 @@ def _get_int_query(name: str, default: int) -> int:
         raise BadRequestError(f"{name} must be an integer") from exc
 
 
+def _get_optional_bool_query(name: str) -> bool | None:
+    raw = request.args.get(name)
+    if raw is None:
+        return None
+    value = raw.strip().lower()
+    if value in ("1", "true", "yes"):
+        return True
+    if value in ("0", "false", "no"):
+        return False
+    raise BadRequestError(f"{name} must be a boolean")
+
+
 @require_auth
 @with_db
 def vocab_list_create(user_id: str, db: Session):
@@ -88,6 +99,8 @@ def vocab_list_create(user_id: str, db: Session):
             search_query=request.args.get("q", "").strip() or None,
             limit=_get_int_query("limit", 50),
             offset=_get_int_query("offset", 0),
+            cursor=request.args.get("cursor"),
+            include_total=_get_optional_bool_query("include_total"),
         )
         data = {
             **page,
@@ -203,30 +216,10 @@ def vocab_review_batch(user_id: str, db: Session):
 def vocab_stats(user_id: str, db: Session):
     """GET /web/vocab/stats."""
     language = request.args.get("language", "").strip() or None
-    repo = _vocab_repository()
-    base_query: dict[str, Any] = {"user_id": user_id, "deleted_at": None}
-    if language:
-        base_query["language"] = language
-
-    status_counts = {
-        status: repo.cards.count_documents({**base_query, "status": status})
-        for status in ("new", "learning", "review", "suspended")
-    }
-    due_today = repo.cards.count_documents(
-        {
-            **base_query,
-            "status": {"$in": ["new", "learning", "review"]},
-            "$or": [
-                {"next_due_at": None},
-                {"next_due_at": {"$lte": datetime.now(timezone.utc)}},
-            ],
-        }
-    )
+    stats = _vocab_repository().get_stats(user_id=user_id, language=language)
     data = {
         "language": language,
-        "total": repo.cards.count_documents(base_query),
-        **status_counts,
-        "due_today": due_today,
+        **stats,
         "overdue": 0,
         "storage": "mongo",
     }
@@ -31,10 +31,18 @@ def _parse_csv_env(name: str) -> list[str]:
     return values
 
 
+# Serverless functions (Vercel, Lambda) are frozen between requests.
+_SERVERLESS = bool(os.getenv("VERCEL") or os.getenv("AWS_LAMBDA_FUNCTION_NAME"))
+
+
 class LearningConfig:
     """Learning app configuration."""
 
     SECRET_KEY = os.getenv("SECRET_KEY", "change-me")
+    # Response JSON encoder: "auto" (orjson when installed) or "stdlib"
+    JSON_ENCODER = os.getenv("JSON_ENCODER", "auto").lower()
+    # Verified JWT payloads kept in memory per process (0 disables)
+    JWT_CACHE_MAX_ENTRIES = int(os.getenv("JWT_CACHE_MAX_ENTRIES", "4096"))
 
     # Google OAuth
     GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
@@ -60,6 +68,39 @@ class LearningConfig:
     AI_RATE_USER_PER_MINUTE = int(os.getenv("AI_RATE_USER_PER_MINUTE", "10"))
     AI_RATE_USER_PER_DAY = int(os.getenv("AI_RATE_USER_PER_DAY", "500"))
     AI_RATE_GLOBAL_PER_MINUTE = int(os.getenv("AI_RATE_GLOBAL_PER_MINUTE", "120"))
+    # "fixed" counts per calendar window; "sliding" weights in the previous window
+    AI_RATE_MODE = os.getenv("AI_RATE_MODE", "fixed").lower()
+    # Background AI jobs (?async=true) running at once per user
+    AI_RATE_USER_CONCURRENT_JOBS = int(os.getenv("AI_RATE_USER_CONCURRENT_JOBS", "2"))
+    # Shared cache of successful AI learning-task responses
+    AI_RESPONSE_CACHE_ENABLED = (
+        os.getenv("AI_RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    )
+    AI_RESPONSE_CACHE_TTL_SECONDS = int(
+        os.getenv("AI_RESPONSE_CACHE_TTL_SECONDS", str(30 * 86400))
+    )
+    # Identical concurrent AI requests share one model call (across workers)
+    AI_COALESCE_ENABLED = os.getenv("AI_COALESCE_ENABLED", "true").lower() == "true"
+    AI_COALESCE_LOCK_SECONDS = int(os.getenv("AI_COALESCE_LOCK_SECONDS", "60"))
+    AI_COALESCE_RESULT_TTL_SECONDS = int(
+        os.getenv("AI_COALESCE_RESULT_TTL_SECONDS", "30")
+    )
+    # Asynchronous AI jobs run on in-process threads, so they need a
+    # long-lived worker: off by default on serverless platforms, where the
+    # process is frozen once the 202 has been sent
+    AI_JOBS_ENABLED = (
+        os.getenv("AI_JOBS_ENABLED", "false" if _SERVERLESS else "true").lower()
+        == "true"
+    )
+    # Worker threads, queued job cap, result retention
+    AI_JOB_WORKERS = int(os.getenv("AI_JOB_WORKERS", "4"))
+    AI_JOB_MAX_PENDING = int(os.getenv("AI_JOB_MAX_PENDING", "32"))
+    AI_JOB_TTL_SECONDS = int(os.getenv("AI_JOB_TTL_SECONDS", "3600"))
+    # An SSE stream holds a request worker; keep it a short long-poll and let
+    # clients reconnect
+    AI_JOB_STREAM_TIMEOUT_SECONDS = int(
+        os.getenv("AI_JOB_STREAM_TIMEOUT_SECONDS", "25")
+    )
 
     # Redis Configuration
     REDIS_ENABLED = os.getenv("REDIS_ENABLED", "true").lower() == "true"
@@ -71,6 +112,10 @@ class LearningConfig:
     REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
     REDIS_URL = os.getenv("REDIS_URL", None)
     DEFAULT_CACHE_TTL = int(os.getenv("DEFAULT_CACHE_TTL", "3600"))
+    # In-process tier in front of Redis (src.infra.cache.TieredCache): entries
+    # per namespace, and how stale it may get relative to Redis.
+    CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "512"))
+    CACHE_LOCAL_TTL_SECONDS = float(os.getenv("CACHE_LOCAL_TTL_SECONDS", "30"))
     REDIS_POOL_BLOCKING = os.getenv("REDIS_POOL_BLOCKING", "true").lower() == "true"
     REDIS_POOL_BLOCKING_TIMEOUT = float(os.getenv("REDIS_POOL_BLOCKING_TIMEOUT", "1.0"))
     REDIS_SOCKET_CONNECT_TIMEOUT = float(
@@ -86,6 +131,19 @@ class LearningConfig:
     )
     REDIS_DISABLE_SECONDS = int(os.getenv("REDIS_DISABLE_SECONDS", "30"))
 
+    # Outbound HTTP (GitHub-hosted content)
+    HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+    HTTP_MAX_CONCURRENCY = int(os.getenv("HTTP_MAX_CONCURRENCY", "32"))
+    HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+    HTTP_RETRY_BACKOFF = float(os.getenv("HTTP_RETRY_BACKOFF", "0.3"))
+    # Longest Retry-After honoured before a retry, so a rate limit cannot park
+    # a request worker for minutes
+    HTTP_RETRY_AFTER_MAX_SECONDS = float(os.getenv("HTTP_RETRY_AFTER_MAX_SECONDS", "5"))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))
+    HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
+    # Comma-separated "host=connect:read" overrides
+    HTTP_HOST_TIMEOUTS = _parse_csv_env("HTTP_HOST_TIMEOUTS")
+
     # Numbers Dictation
     NUMBERS_ADMIN_TOKEN = os.getenv("NUMBERS_ADMIN_TOKEN")
     NUMBERS_STORE_ROOT = os.getenv("NUMBERS_STORE_ROOT")
@@ -96,10 +154,40 @@ class LearningConfig:
     )
     NUMBERS_DATA_LANG = os.getenv("NUMBERS_DATA_LANG", "fr")
     NUMBERS_DATA_VERSION = os.getenv("NUMBERS_DATA_VERSION", "2025-W50")
+    # Extra dataset versions clients may pin, next to NUMBERS_DATA_VERSION.
+    NUMBERS_DATA_VERSIONS = _parse_csv_env("NUMBERS_DATA_VERSIONS")
+    NUMBERS_MANIFEST_SNAPSHOT_DIR = os.getenv("NUMBERS_MANIFEST_SNAPSHOT_DIR")
+    NUMBERS_MANIFEST_REFRESH_SECONDS = int(
+        os.getenv("NUMBERS_MANIFEST_REFRESH_SECONDS", "900")
+    )
+    # "redis" or "memory"; defaults to Redis whenever it is enabled. The Redis
+    # store serves sessions from memory while Redis is unavailable.
+    NUMBERS_SESSION_STORE = os.getenv(
+        "NUMBERS_SESSION_STORE", "redis" if REDIS_ENABLED else "memory"
+    ).lower()
+    NUMBERS_SESSION_TTL_SECONDS = int(os.getenv("NUMBERS_SESSION_TTL_SECONDS", "21600"))
+    NUMBERS_SESSION_MAX_ENTRIES = int(os.getenv("NUMBERS_SESSION_MAX_ENTRIES", "5000"))
 
     # MongoDB Configuration (Community Feedback)
     MONGO_URI = os.getenv("MONGO_URI")
+    # Connection pool profile: "serverless" (one socket per instance),
+    # "threaded" or "high-throughput"; MONGO_* overrides below win when set.
+    MONGO_POOL_PROFILE = os.getenv("MONGO_POOL_PROFILE", "serverless").lower()
+    MONGO_MAX_POOL_SIZE = os.getenv("MONGO_MAX_POOL_SIZE")
+    MONGO_MIN_POOL_SIZE = os.getenv("MONGO_MIN_POOL_SIZE")
+    MONGO_MAX_IDLE_TIME_MS = os.getenv("MONGO_MAX_IDLE_TIME_MS")
+    MONGO_WAIT_QUEUE_TIMEOUT_MS = os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS")
+    MONGO_COMPRESSORS = _parse_csv_env("MONGO_COMPRESSORS")
+    MONGO_READ_PREFERENCE = os.getenv("MONGO_READ_PREFERENCE")
+    # Open the pool's minimum connections at startup, before traffic arrives
+    MONGO_WARMUP = os.getenv("MONGO_WARMUP", "true").lower() == "true"
+    # Checkouts waiting longer than this are logged as pool saturation
+    MONGO_SLOW_CHECKOUT_MS = int(os.getenv("MONGO_SLOW_CHECKOUT_MS", "100"))
     VOCAB_STORAGE_BACKEND = os.getenv("VOCAB_STORAGE_BACKEND", "mongo").lower()
+    # Cached per-user status counters; short so a dropped update heals quickly
+    VOCAB_STATS_CACHE_TTL_SECONDS = int(
+        os.getenv("VOCAB_STATS_CACHE_TTL_SECONDS", "300")
+    )
 
     # PostgreSQL Configuration
     POSTGRES_DSN = os.getenv("POSTGRES_DSN", None)
@@ -108,6 +196,14 @@ class LearningConfig:
     GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
     GITHUB_REPO_OWNER = os.getenv("GITHUB_REPO_OWNER", "nldq092203")
     GITHUB_REPO_NAME = os.getenv("GITHUB_REPO_NAME", "memomap-audio-fr")
+    # Disk cache for proxied GitHub media: DELF, speaking practice and numbers
+    # audio/images (defaults to a temp directory)
+    MEDIA_CACHE_ENABLED = os.getenv("MEDIA_CACHE_ENABLED", "true").lower() == "true"
+    MEDIA_CACHE_DIR = os.getenv("MEDIA_CACHE_DIR")
+    MEDIA_CACHE_MAX_BYTES = int(
+        os.getenv("MEDIA_CACHE_MAX_BYTES", str(512 * 1024 * 1024))
+    )
+    MEDIA_CACHE_TTL_SECONDS = int(os.getenv("MEDIA_CACHE_TTL_SECONDS", "86400"))
     DELF_LOCAL_ASSET_TOOL_ENABLED = (
         os.getenv("DELF_LOCAL_ASSET_TOOL_ENABLED", "false").lower() == "true"
     )
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
 from typing import Any, Protocol
+import threading
+import time
 import unicodedata
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, literal, null, or_, select, union_all
 from sqlalchemy.orm import Session
 
+from src.config import Config
 from src.domain.db_queries import ExerciseProgressQueries
-from src.infra.db.orm import CoCeExerciseORM, DelfTestPaperORM
+from src.extensions import logger
+from src.infra.cache import get_redis_client
+from src.infra.db.orm import (
+    CoCeExerciseORM,
+    DelfTestPaperORM,
+    UserExerciseProgressORM,
+)
 from src.shared.numbers.blueprints import get_all_number_blueprints
 
 CATALOG_SECTIONS = {"CO", "CE", "PO", "PE"}
@@ -28,6 +37,12 @@ CATALOG_STATUSES = {
     "completed",
     "retry_suggested",
 }
+CATALOG_SNAPSHOT_CACHE_KEY = "catalog:snapshot:v1"
+CATALOG_GENERATION_KEY = "catalog:snapshot:v1:generation"
+CATALOG_SNAPSHOT_TTL = int(getattr(Config, "DEFAULT_CACHE_TTL", 3600))
+# Upper bound on how stale a worker's local copy may get when Redis is down
+# and another worker handled the admin write.
+CATALOG_LOCAL_MAX_AGE_SECONDS = 300
 DEFAULT_SPEAKING_TOPICS = [
     "alimentation",
     "collocations",
@@ -209,30 +224,7 @@ class DelfCatalogProvider:
                 level=paper.level,
             ):
                 continue
-            items.append(
-                ExerciseCatalogItem(
-                    exercise_id=(
-                        f"delf:{paper.level}:{paper.variant}:{paper.section}:"
-                        f"{paper.test_id}"
-                    ),
-                    section=section,
-                    source_type="delf_book",
-                    level=paper.level,
-                    title=f"DELF {paper.level} {paper.section} {paper.test_id}",
-                    route=_delf_route(section),
-                    detail_endpoint=(
-                        f"/api/web/delf/{paper.level.lower()}/{paper.variant}/"
-                        f"{paper.section}/{paper.test_id}"
-                    ),
-                    metadata={
-                        "test_id": paper.test_id,
-                        "variant": paper.variant,
-                        "paper_section": paper.section,
-                        "exercise_count": paper.exercise_count,
-                        "audio_filename": paper.audio_filename,
-                    },
-                )
-            )
+            items.append(_delf_item(paper, section=section))
         return items
 
 
@@ -276,16 +268,482 @@ class SpeakingCatalogProvider:
         ]
 
 
+class CatalogSnapshot:
+    """Immutable catalog items (without progress), indexed by filter field."""
+
+    def __init__(
+        self,
+        items: list[ExerciseCatalogItem],
+        generation: str | None = None,
+    ) -> None:
+        self.items = items
+        self.generation = generation
+        self.built_at = time.monotonic()
+        self._indexes: dict[str, dict[str, list[int]]] = {
+            "section": {},
+            "level": {},
+            "source_type": {},
+        }
+        for position, item in enumerate(items):
+            for name, index in self._indexes.items():
+                value = getattr(item, name)
+                if value is not None:
+                    index.setdefault(value, []).append(position)
+
+    def is_fresh(self, generation: str | None) -> bool:
+        age = time.monotonic() - self.built_at
+        return self.generation == generation and age < CATALOG_LOCAL_MAX_AGE_SECONDS
+
+    def select(self, filters: CatalogFilters) -> list[ExerciseCatalogItem]:
+        """Return matching items in catalog order, starting from the smallest index."""
+        candidates: list[int] | None = None
+        for name in ("section", "level", "source_type"):
+            value = getattr(filters, name)
+            if not value:
+                continue
+            positions = self._indexes[name].get(value, [])
+            if candidates is None or len(positions) < len(candidates):
+                candidates = positions
+        if candidates is None:
+            return list(self.items)
+
+        selected = []
+        for position in candidates:
+            item = self.items[position]
+            if _matches_static_filters(
+                filters,
+                section=item.section,
+                source_type=item.source_type,
+                level=item.level,
+            ):
+                selected.append(item)
+        return selected
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "generation": self.generation,
+            "items": [{**asdict(item), "progress": None} for item in self.items],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> CatalogSnapshot:
+        return cls(
+            [ExerciseCatalogItem(**item) for item in payload["items"]],
+            generation=payload.get("generation"),
+        )
+
+
+class MaterializedCatalog:
+    """Process-level catalog snapshot, optionally shared between workers via Redis.
+
+    Admin writes call ``invalidate_exercise_catalog`` which bumps a Redis
+    generation counter; every worker compares it with its local snapshot on
+    each request and rebuilds (from Redis, else SQL) when it has moved.
+    """
+
+    def __init__(
+        self,
+        providers: list[CatalogProvider],
+        *,
+        shared: bool = True,
+    ) -> None:
+        self.providers = providers
+        self.shared = shared
+        self._snapshot: CatalogSnapshot | None = None
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> CatalogSnapshot:
+        generation = self._current_generation()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.is_fresh(generation):
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.is_fresh(generation):
+                return snapshot
+            snapshot = self._load_shared(generation) or self._build(db, generation)
+            self._snapshot = snapshot
+            return snapshot
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+        if not self.shared:
+            return
+        redis = get_redis_client()
+        redis.incr(CATALOG_GENERATION_KEY)
+        redis.delete(CATALOG_SNAPSHOT_CACHE_KEY)
+
+    def _current_generation(self) -> str | None:
+        if not self.shared:
+            return None
+        return get_redis_client().get(CATALOG_GENERATION_KEY)
+
+    def _load_shared(self, generation: str | None) -> CatalogSnapshot | None:
+        if not self.shared:
+            return None
+        payload = get_redis_client().get_json(CATALOG_SNAPSHOT_CACHE_KEY)
+        if not isinstance(payload, dict) or payload.get("generation") != generation:
+            return None
+        try:
+            return CatalogSnapshot.from_payload(payload)
+        except (KeyError, TypeError) as exc:
+            logger.warning("[CATALOG] Invalid cached snapshot: {}", exc)
+            return None
+
+    def _build(self, db: Session, generation: str | None) -> CatalogSnapshot:
+        items: list[ExerciseCatalogItem] = []
+        for provider in self.providers:
+            items.extend(provider.list_items(db, CatalogFilters()))
+        snapshot = CatalogSnapshot(items, generation=generation)
+        if self.shared:
+            get_redis_client().set_json(
+                CATALOG_SNAPSHOT_CACHE_KEY,
+                snapshot.to_payload(),
+                ex=CATALOG_SNAPSHOT_TTL,
+            )
+        return snapshot
+
+
+def default_catalog_providers() -> list[CatalogProvider]:
+    return [
+        NumberCatalogProvider(),
+        CoCeCatalogProvider(),
+        DelfCatalogProvider(),
+        SpeakingCatalogProvider(),
+    ]
+
+
+_default_catalog: MaterializedCatalog | None = None
+_default_catalog_lock = threading.Lock()
+
+
+def get_materialized_catalog() -> MaterializedCatalog:
+    """Return the process-wide catalog backed by the default providers."""
+    global _default_catalog
+    if _default_catalog is None:
+        with _default_catalog_lock:
+            if _default_catalog is None:
+                _default_catalog = MaterializedCatalog(default_catalog_providers())
+    return _default_catalog
+
+
+def invalidate_exercise_catalog() -> None:
+    """Drop the catalog snapshot in this worker, Redis and (via generation) others."""
+    get_materialized_catalog().invalidate()
+
+
+class SqlCatalogStatusQuery:
+    """Status-filtered catalog pages computed in Postgres.
+
+    CO/CE and DELF rows are LEFT JOINed with the user's progress rows, so the
+    status filter, ordering and LIMIT/OFFSET run in the database. The static
+    number (first) and speaking (last) entries are a small constant set and are
+    matched in Python around the SQL page, preserving the provider order.
+    """
+
+    def __init__(self) -> None:
+        self.prefix_provider = NumberCatalogProvider()
+        self.suffix_provider = SpeakingCatalogProvider()
+
+    def page(
+        self,
+        db: Session,
+        user_id: str,
+        filters: CatalogFilters,
+    ) -> tuple[list[ExerciseCatalogItem], int]:
+        prefix, suffix = self._static_items(db, user_id, filters)
+        start, limit = filters.offset, filters.limit
+
+        page = prefix[start : start + limit]
+        sql_offset = max(0, start - len(prefix))
+        sql_items, sql_total = self._sql_page(
+            db,
+            user_id,
+            filters,
+            offset=sql_offset,
+            limit=limit - len(page),
+        )
+        page.extend(sql_items)
+
+        remaining = limit - len(page)
+        if remaining > 0:
+            suffix_offset = max(0, start - len(prefix) - sql_total)
+            page.extend(suffix[suffix_offset : suffix_offset + remaining])
+        return page, len(prefix) + sql_total + len(suffix)
+
+    def _static_items(
+        self,
+        db: Session,
+        user_id: str,
+        filters: CatalogFilters,
+    ) -> tuple[list[ExerciseCatalogItem], list[ExerciseCatalogItem]]:
+        prefix = self.prefix_provider.list_items(db, filters)
+        suffix = self.suffix_provider.list_items(db, filters)
+        progress_rows = ExerciseProgressQueries.get_many_by_exercise_ids(
+            db,
+            user_id,
+            [item.exercise_id for item in (*prefix, *suffix)],
+        )
+        progress_by_exercise_id = {
+            row.exercise_id: _progress_to_dict(row) for row in progress_rows
+        }
+
+        def matching(items: list[ExerciseCatalogItem]) -> list[ExerciseCatalogItem]:
+            selected = []
+            for item in items:
+                progress = progress_by_exercise_id.get(item.exercise_id)
+                if (progress or {}).get("status", "not_started") == filters.status:
+                    selected.append(replace(item, progress=progress))
+            return selected
+
+        return matching(prefix), matching(suffix)
+
+    def _sql_page(
+        self,
+        db: Session,
+        user_id: str,
+        filters: CatalogFilters,
+        *,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[ExerciseCatalogItem], int]:
+        selects = self._source_selects(db, user_id, filters)
+        if not selects:
+            return [], 0
+
+        rows_cte = union_all(*selects).subquery("catalog_rows")
+        if limit <= 0:
+            total = db.execute(select(func.count()).select_from(rows_cte)).scalar()
+            return [], int(total or 0)
+
+        stmt = (
+            select(rows_cte, func.count().over().label("total_count"))
+            .order_by(
+                rows_cte.c.source_rank,
+                rows_cte.c.sort_level,
+                rows_cte.c.sort_created_at.desc(),
+                rows_cte.c.sort_section,
+                rows_cte.c.sort_test_id,
+                rows_cte.c.source_id,
+                rows_cte.c.variant_rank,
+            )
+            .offset(offset)
+            .limit(limit)
+        )
+        rows = db.execute(stmt).all()
+        if not rows:
+            total = db.execute(select(func.count()).select_from(rows_cte)).scalar()
+            return [], int(total or 0)
+        return self._rows_to_items(db, rows), int(rows[0].total_count)
+
+    def _source_selects(
+        self,
+        db: Session,
+        user_id: str,
+        filters: CatalogFilters,
+    ) -> list[Any]:
+        selects: list[Any] = []
+        if filters.source_type in (None, "video_podcast"):
+            for section, variant, path_column in (
+                ("CO", "co", CoCeExerciseORM.co_path),
+                ("CE", "ce", CoCeExerciseORM.ce_path),
+            ):
+                if filters.section and filters.section != section:
+                    continue
+                selects.append(
+                    self._coce_select(user_id, filters, variant, path_column)
+                )
+
+        if filters.source_type in (None, "delf_book"):
+            raw_sections = self._delf_raw_sections(db, filters.section)
+            if raw_sections:
+                selects.append(self._delf_select(user_id, filters, raw_sections))
+        return selects
+
+    def _coce_select(
+        self,
+        user_id: str,
+        filters: CatalogFilters,
+        variant: str,
+        path_column: Any,
+    ) -> Any:
+        exercise_id = literal("coce:") + CoCeExerciseORM.id + literal(f":{variant}")
+        stmt = self._with_progress(
+            select(
+                literal(0).label("source_rank"),
+                CoCeExerciseORM.id.label("source_id"),
+                literal(variant).label("variant"),
+                literal(0 if variant == "co" else 1).label("variant_rank"),
+                CoCeExerciseORM.level.label("sort_level"),
+                CoCeExerciseORM.created_at.label("sort_created_at"),
+                null().label("sort_section"),
+                null().label("sort_test_id"),
+            ),
+            CoCeExerciseORM,
+            exercise_id,
+            user_id,
+            filters.status,
+        ).where(path_column.is_not(None))
+        if filters.level:
+            stmt = stmt.where(CoCeExerciseORM.level == filters.level)
+        return stmt
+
+    def _delf_select(
+        self,
+        user_id: str,
+        filters: CatalogFilters,
+        raw_sections: list[str],
+    ) -> Any:
+        exercise_id = (
+            literal("delf:")
+            + DelfTestPaperORM.level
+            + literal(":")
+            + DelfTestPaperORM.variant
+            + literal(":")
+            + DelfTestPaperORM.section
+            + literal(":")
+            + DelfTestPaperORM.test_id
+        )
+        stmt = (
+            self._with_progress(
+                select(
+                    literal(1).label("source_rank"),
+                    DelfTestPaperORM.id.label("source_id"),
+                    null().label("variant"),
+                    literal(0).label("variant_rank"),
+                    DelfTestPaperORM.level.label("sort_level"),
+                    null().label("sort_created_at"),
+                    DelfTestPaperORM.section.label("sort_section"),
+                    DelfTestPaperORM.test_id.label("sort_test_id"),
+                ),
+                DelfTestPaperORM,
+                exercise_id,
+                user_id,
+                filters.status,
+            )
+            .where(DelfTestPaperORM.status == "active")
+            .where(DelfTestPaperORM.section.in_(raw_sections))
+        )
+        if filters.level:
+            stmt = stmt.where(DelfTestPaperORM.level == filters.level)
+        return stmt
+
+    def _with_progress(
+        self,
+        stmt: Any,
+        source: Any,
+        exercise_id: Any,
+        user_id: str,
+        status: str,
+    ) -> Any:
+        progress = UserExerciseProgressORM
+        stmt = stmt.add_columns(
+            progress.status.label("progress_status"),
+            progress.score.label("progress_score"),
+            progress.accuracy.label("progress_accuracy"),
+            progress.last_opened_at.label("progress_last_opened_at"),
+            progress.completed_at.label("progress_completed_at"),
+        ).select_from(
+            source.__table__.outerjoin(
+                progress.__table__,
+                and_(
+                    progress.user_id == user_id,
+                    progress.exercise_id == exercise_id,
+                ),
+            )
+        )
+        if status == "not_started":
+            return stmt.where(
+                or_(progress.id.is_(None), progress.status == "not_started")
+            )
+        return stmt.where(progress.status == status)
+
+    def _delf_raw_sections(self, db: Session, section: str | None) -> list[str]:
+        """Raw DELF section labels that normalize to ``section`` (or to any)."""
+        stmt = select(DelfTestPaperORM.section).distinct()
+        raw_sections = []
+        for raw_section in db.execute(stmt).scalars().all():
+            normalized = _normalize_delf_section(raw_section)
+            if normalized and (section is None or normalized == section):
+                raw_sections.append(raw_section)
+        return raw_sections
+
+    def _rows_to_items(self, db: Session, rows: list[Any]) -> list[ExerciseCatalogItem]:
+        coce_ids = [row.source_id for row in rows if row.source_rank == 0]
+        delf_ids = [row.source_id for row in rows if row.source_rank == 1]
+        exercises = {
+            exercise.id: exercise
+            for exercise in (
+                db.execute(
+                    select(CoCeExerciseORM).where(CoCeExerciseORM.id.in_(coce_ids))
+                )
+                .scalars()
+                .all()
+                if coce_ids
+                else []
+            )
+        }
+        papers = {
+            paper.id: paper
+            for paper in (
+                db.execute(
+                    select(DelfTestPaperORM).where(DelfTestPaperORM.id.in_(delf_ids))
+                )
+                .scalars()
+                .all()
+                if delf_ids
+                else []
+            )
+        }
+
+        items: list[ExerciseCatalogItem] = []
+        for row in rows:
+            if row.source_rank == 0:
+                item = _coce_item(
+                    exercises[row.source_id],
+                    section="CO" if row.variant == "co" else "CE",
+                    question_type=row.variant,
+                )
+            else:
+                paper = papers[row.source_id]
+                item = _delf_item(
+                    paper, section=_normalize_delf_section(paper.section) or ""
+                )
+            progress = None
+            if row.progress_status is not None:
+                progress = {
+                    "status": row.progress_status,
+                    "score": row.progress_score,
+                    "accuracy": row.progress_accuracy,
+                    "last_opened_at": row.progress_last_opened_at,
+                    "completed_at": row.progress_completed_at,
+                }
+            item.progress = progress
+            items.append(item)
+        return items
+
+
 class ExerciseCatalogService:
-    """Build catalog items and merge current-user progress in bulk."""
-
-    def __init__(self, providers: list[CatalogProvider] | None = None) -> None:
-        self.providers = providers or [
-            NumberCatalogProvider(),
-            CoCeCatalogProvider(),
-            DelfCatalogProvider(),
-            SpeakingCatalogProvider(),
-        ]
+    """Serve catalog pages from the materialized snapshot plus user progress."""
+
+    def __init__(
+        self,
+        providers: list[CatalogProvider] | None = None,
+        catalog: MaterializedCatalog | None = None,
+    ) -> None:
+        if catalog is None:
+            catalog = (
+                MaterializedCatalog(providers, shared=False)
+                if providers
+                else get_materialized_catalog()
+            )
+        self.catalog = catalog
+        self.providers = catalog.providers
+        # The SQL status query mirrors the default providers only.
+        self.status_query = (
+            SqlCatalogStatusQuery() if catalog is get_materialized_catalog() else None
+        )
 
     def list_catalog(
         self,
@@ -294,12 +752,22 @@ class ExerciseCatalogService:
         filters: CatalogFilters,
     ) -> dict[str, Any]:
         filters = self._normalize_filters(filters)
-        items = self._load_items(db, filters)
-        items = self._merge_progress(db, user_id, items)
-        items = self._filter_by_status(items, filters.status)
+        page_bounds = slice(filters.offset, filters.offset + filters.limit)
+
+        if filters.status and self.status_query is not None:
+            page, total = self.status_query.page(db, user_id, filters)
+        elif filters.status:
+            # Status depends on progress, so every matching item needs it.
+            items = self.catalog.get(db).select(filters)
+            items = self._merge_progress(db, user_id, items)
+            items = self._filter_by_status(items, filters.status)
+            total = len(items)
+            page = items[page_bounds]
+        else:
+            items = self.catalog.get(db).select(filters)
+            total = len(items)
+            page = self._merge_progress(db, user_id, items[page_bounds])
 
-        total = len(items)
-        page = items[filters.offset : filters.offset + filters.limit]
         return {
             "items": [item.to_dict() for item in page],
             "total": total,
@@ -333,16 +801,6 @@ class ExerciseCatalogService:
         filters.offset = max(0, filters.offset)
         return filters
 
-    def _load_items(
-        self,
-        db: Session,
-        filters: CatalogFilters,
-    ) -> list[ExerciseCatalogItem]:
-        items: list[ExerciseCatalogItem] = []
-        for provider in self.providers:
-            items.extend(provider.list_items(db, filters))
-        return items
-
     def _merge_progress(
         self,
         db: Session,
@@ -355,18 +813,13 @@ class ExerciseCatalogService:
             [item.exercise_id for item in items],
         )
         progress_by_exercise_id = {
-            row.exercise_id: {
-                "status": row.status,
-                "score": row.score,
-                "accuracy": row.accuracy,
-                "last_opened_at": row.last_opened_at,
-                "completed_at": row.completed_at,
-            }
-            for row in progress_rows
+            row.exercise_id: _progress_to_dict(row) for row in progress_rows
         }
-        for item in items:
-            item.progress = progress_by_exercise_id.get(item.exercise_id)
-        return items
+        # Snapshot items are shared across requests; attach progress to copies.
+        return [
+            replace(item, progress=progress_by_exercise_id.get(item.exercise_id))
+            for item in items
+        ]
 
     def _filter_by_status(
         self,
@@ -411,6 +864,40 @@ def _coce_item(
     )
 
 
+def _delf_item(paper: DelfTestPaperORM, *, section: str) -> ExerciseCatalogItem:
+    return ExerciseCatalogItem(
+        exercise_id=(
+            f"delf:{paper.level}:{paper.variant}:{paper.section}:" f"{paper.test_id}"
+        ),
+        section=section,
+        source_type="delf_book",
+        level=paper.level,
+        title=f"DELF {paper.level} {paper.section} {paper.test_id}",
+        route=_delf_route(section),
+        detail_endpoint=(
+            f"/api/web/delf/{paper.level.lower()}/{paper.variant}/"
+            f"{paper.section}/{paper.test_id}"
+        ),
+        metadata={
+            "test_id": paper.test_id,
+            "variant": paper.variant,
+            "paper_section": paper.section,
+            "exercise_count": paper.exercise_count,
+            "audio_filename": paper.audio_filename,
+        },
+    )
+
+
+def _progress_to_dict(row: Any) -> dict[str, Any]:
+    return {
+        "status": row.status,
+        "score": row.score,
+        "accuracy": row.accuracy,
+        "last_opened_at": row.last_opened_at,
+        "completed_at": row.completed_at,
+    }
+
+
 def _normalize_delf_section(section: str) -> str | None:
     normalized = (
         unicodedata.normalize("NFKD", section.strip().upper())
@@ -459,9 +946,14 @@ def _title_from_slug(value: str) -> str:
 __all__ = [
     "CatalogFilters",
     "CatalogProvider",
+    "CatalogSnapshot",
     "CoCeCatalogProvider",
     "DelfCatalogProvider",
     "ExerciseCatalogService",
+    "MaterializedCatalog",
     "NumberCatalogProvider",
     "SpeakingCatalogProvider",
+    "SqlCatalogStatusQuery",
+    "get_materialized_catalog",
+    "invalidate_exercise_catalog",
 ]
@@ -8,7 +8,6 @@ from datetime import datetime, timedelta, timezone
 from math import exp
 from typing import Any, Literal
 
-from src.domain.errors import ResourceNotFoundError
 from src.domain.vocabulary_mongo import MongoVocabularyRepository
 
 Grade = Literal["again", "hard", "good", "easy"]
@@ -178,7 +177,7 @@ class MongoSRSService:
         state = FSRSState(
             stability=float(interval_days) if interval_days > 0 else 1.0,
             difficulty=ease / 100.0 if ease > 0 else 0.5,
-            last_review_at=self._as_aware_utc(card.get("last_reviewed_at")),
+            last_review_at=self.as_aware_utc(card.get("last_reviewed_at")),
             last_interval=float(interval_days),
             reps=reps,
             lapses=lapses,
@@ -237,30 +236,23 @@ class MongoSRSService:
         self,
         reviews: list[tuple[str, Grade]],
         user_id: str,
+        now: datetime | None = None,
     ) -> dict[str, Any]:
-        """Process a batch of Mongo card reviews."""
-        reviewed_cards: list[dict[str, Any]] = []
-        review_events: list[dict[str, Any]] = []
-
-        for card_id, grade in reviews:
-            try:
-                result = self.review_card(
-                    user_id=user_id,
-                    card_id=card_id,
-                    grade=grade,
-                )
-            except ResourceNotFoundError:
-                continue
-            reviewed_cards.append(result["card"])
-            review_events.append(result["review"])
-
+        """Process a batch of Mongo card reviews in a fixed number of round trips."""
+        results = self.repository.record_review_batch(
+            user_id=user_id,
+            reviews=reviews,
+            schedule=self.calculate_next_review,
+            now=now or datetime.now(timezone.utc),
+        )
         return {
-            "updated_count": len(reviewed_cards),
-            "cards": reviewed_cards,
-            "reviews": review_events,
+            "updated_count": len(results),
+            "cards": [result["card"] for result in results],
+            "reviews": [result["review"] for result in results],
         }
 
-    def _as_aware_utc(self, value: Any) -> datetime | None:
+    @staticmethod
+    def as_aware_utc(value: Any) -> datetime | None:
         """Normalize legacy/backfilled datetimes before FSRS arithmetic."""
         if value is None:
             return None
@@ -0,0 +1,347 @@
+"""
+Vectorized FSRS scheduling for whole-deck rescheduling and forecasts.
+
+Mirrors ``FSRSModel.review`` over NumPy column arrays so thousands of cards
+can be scheduled in one call. Results are bit-identical to the scalar model.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from math import exp
+from typing import Any
+
+from src.domain.services.srs import FSRSParams, FSRSState, Grade, MongoSRSService
+
+try:  # pragma: no cover - import availability depends on local setup
+    import numpy as np
+except ImportError:  # pragma: no cover - handled at runtime by ensure_numpy
+    np = None
+
+GRADES: tuple[Grade, ...] = ("again", "hard", "good", "easy")
+GRADE_CODES: dict[str, int] = {grade: code for code, grade in enumerate(GRADES)}
+
+_SECONDS_PER_DAY = 86400.0
+
+
+def ensure_numpy() -> None:
+    """Fail with a clear message when NumPy is missing."""
+    if np is None:
+        raise RuntimeError(
+            "NumPy is required for batch FSRS scheduling. "
+            "Install backend/requirements-srs-batch.txt in your environment."
+        )
+
+
+def encode_grades(grades: Sequence[str] | Any) -> Any:
+    """Convert grade names (or existing integer codes) to an int8 code array."""
+    ensure_numpy()
+    if isinstance(grades, np.ndarray) and np.issubdtype(grades.dtype, np.integer):
+        return grades.astype(np.int8, copy=False)
+    return np.fromiter(
+        (GRADE_CODES[str(grade)] for grade in grades),
+        dtype=np.int8,
+        count=len(grades),
+    )
+
+
+def to_datetime64(values: Sequence[datetime | None]) -> Any:
+    """Convert aware/naive UTC datetimes to a ``datetime64[us]`` array (None -> NaT)."""
+    ensure_numpy()
+    return np.array(
+        [None if value is None else _as_naive_utc(value) for value in values],
+        dtype="datetime64[us]",
+    )
+
+
+class FSRSBatchState:
+    """Column-oriented FSRS state for many cards."""
+
+    def __init__(
+        self,
+        stability: Any,
+        difficulty: Any,
+        last_review_at: Any,
+        reps: Any,
+        lapses: Any,
+        last_interval: Any | None = None,
+        last_grade: Any | None = None,
+    ) -> None:
+        ensure_numpy()
+        self.stability = np.asarray(stability, dtype=np.float64)
+        self.difficulty = np.asarray(difficulty, dtype=np.float64)
+        self.last_review_at = np.asarray(last_review_at, dtype="datetime64[us]")
+        self.reps = np.asarray(reps, dtype=np.int64)
+        self.lapses = np.asarray(lapses, dtype=np.int64)
+        self.last_interval = (
+            np.asarray(last_interval, dtype=np.float64)
+            if last_interval is not None
+            else self.stability.copy()
+        )
+        self.last_grade = (
+            np.asarray(last_grade, dtype=np.int8)
+            if last_grade is not None
+            else np.full(len(self.stability), -1, dtype=np.int8)
+        )
+
+    def __len__(self) -> int:
+        return len(self.stability)
+
+    @classmethod
+    def from_states(cls, states: Sequence[FSRSState]) -> FSRSBatchState:
+        """Pack scalar ``FSRSState`` objects into columns."""
+        return cls(
+            stability=[s.stability for s in states],
+            difficulty=[s.difficulty for s in states],
+            last_review_at=to_datetime64([s.last_review_at for s in states]),
+            reps=[s.reps for s in states],
+            lapses=[s.lapses for s in states],
+            last_interval=[s.last_interval for s in states],
+            last_grade=[
+                GRADE_CODES[s.last_grade] if s.last_grade else -1 for s in states
+            ],
+        )
+
+    def to_states(self) -> list[FSRSState]:
+        """Unpack columns into scalar ``FSRSState`` objects."""
+        last_reviews = self.last_review_at.tolist()
+        return [
+            FSRSState(
+                stability=float(self.stability[i]),
+                difficulty=float(self.difficulty[i]),
+                last_review_at=(
+                    last_reviews[i].replace(tzinfo=timezone.utc)
+                    if last_reviews[i] is not None
+                    else None
+                ),
+                last_interval=float(self.last_interval[i]),
+                reps=int(self.reps[i]),
+                lapses=int(self.lapses[i]),
+                last_grade=(
+                    GRADES[self.last_grade[i]] if self.last_grade[i] >= 0 else None
+                ),
+            )
+            for i in range(len(self))
+        ]
+
+
+class FSRSBatchModel:
+    """Vectorized FSRS algorithm, equivalent to ``FSRSModel.review`` per row."""
+
+    def __init__(self, params: FSRSParams | None = None) -> None:
+        ensure_numpy()
+        self.params = params or FSRSParams()
+        p = self.params
+        # Lookup tables indexed by grade code (again, hard, good, easy).
+        self._init_stability = np.array(
+            [
+                p.min_stability,
+                p.init_stability_hard,
+                p.init_stability_good,
+                p.init_stability_easy,
+            ]
+        )
+        self._init_difficulty = np.array(
+            [
+                p.init_difficulty_again,
+                p.init_difficulty_hard,
+                p.init_difficulty_good,
+                p.init_difficulty_easy,
+            ]
+        )
+        self._grow = np.array(
+            [0.0, p.grow_factor_hard, p.grow_factor_good, p.grow_factor_easy]
+        )
+        self._difficulty_delta = np.array(
+            [0.0, p.difficulty_change_slow, 0.0, -p.difficulty_change_slow]
+        )
+
+    def _elapsed_days(self, last_review_at: Any, now: datetime) -> Any:
+        now_us = np.datetime64(_as_naive_utc(now), "us")
+        reviewed = ~np.isnat(last_review_at)
+        delta_us = np.where(
+            reviewed,
+            (now_us - np.where(reviewed, last_review_at, now_us)).astype(np.int64),
+            0,
+        )
+        # Same arithmetic as timedelta.total_seconds() / 86400.0.
+        elapsed = (delta_us / 1e6) / _SECONDS_PER_DAY
+        return np.maximum(elapsed, 0.0)
+
+    def _retrievability(self, elapsed_days: Any, stability: Any) -> Any:
+        R = np.zeros(len(stability))
+        positive = stability > 0
+        ratios = -elapsed_days[positive] / stability[positive]
+        # math.exp keeps results identical to the scalar model; np.exp can
+        # differ by one ulp on some platforms.
+        R[positive] = np.fromiter(
+            map(exp, ratios.tolist()), dtype=np.float64, count=len(ratios)
+        )
+        return R
+
+    def review(
+        self,
+        state: FSRSBatchState,
+        grades: Sequence[str] | Any,
+        now: datetime,
+    ) -> FSRSBatchState:
+        """Apply one review per row and return the next states."""
+        p = self.params
+        codes = encode_grades(grades)
+        if len(codes) != len(state):
+            raise ValueError("grades must have one entry per card")
+
+        s = state.stability
+        d = state.difficulty
+        first = state.reps == 0
+        again = codes == GRADE_CODES["again"]
+        lapse = ~first & again
+        grow_rows = ~first & ~again
+
+        new_stability = np.empty_like(s)
+        new_difficulty = np.empty_like(d)
+        new_reps = np.empty_like(state.reps)
+        new_lapses = state.lapses.copy()
+
+        # First review: fixed initial values per grade.
+        new_stability[first] = self._init_stability[codes[first]]
+        new_difficulty[first] = self._init_difficulty[codes[first]]
+        new_reps[first] = 1
+
+        # Lapse: shrink stability, raise difficulty, reset reps.
+        new_stability[lapse] = np.maximum(s[lapse] * p.lapse_factor, p.min_stability)
+        new_difficulty[lapse] = np.minimum(
+            d[lapse] + p.difficulty_change_fast, p.max_difficulty
+        )
+        new_reps[lapse] = 0
+        new_lapses[lapse] += 1
+
+        # Successful recall: grow stability scaled by forgetting.
+        if grow_rows.any():
+            gs = s[grow_rows]
+            gd = d[grow_rows]
+            gc = codes[grow_rows]
+            elapsed = self._elapsed_days(state.last_review_at[grow_rows], now)
+            R = self._retrievability(elapsed, gs)
+            base_grow = (1 - gd) * self._grow[gc]
+            R_factor = 1.0 + (1.0 - R) * 0.5
+            grown = gs * (1 + base_grow * R_factor)
+            new_stability[grow_rows] = np.maximum(
+                p.min_stability, np.minimum(grown, p.max_stability)
+            )
+            new_difficulty[grow_rows] = np.maximum(
+                p.min_difficulty,
+                np.minimum(gd + self._difficulty_delta[gc], p.max_difficulty),
+            )
+            new_reps[grow_rows] = state.reps[grow_rows] + 1
+
+        return FSRSBatchState(
+            stability=new_stability,
+            difficulty=new_difficulty,
+            last_review_at=np.full(len(state), np.datetime64(_as_naive_utc(now), "us")),
+            reps=new_reps,
+            lapses=new_lapses,
+            last_interval=new_stability.copy(),
+            last_grade=codes.copy(),
+        )
+
+
+class MongoSRSBatchScheduler:
+    """Deck-wide scheduling of Mongo card documents using ``FSRSBatchModel``."""
+
+    def __init__(self, params: FSRSParams | None = None) -> None:
+        self.model = FSRSBatchModel(params)
+
+    def state_from_cards(self, cards: Sequence[dict[str, Any]]) -> FSRSBatchState:
+        """Build FSRS columns the same way ``MongoSRSService`` does per card."""
+        interval_days = np.fromiter(
+            (int(card.get("interval_days") or 0) for card in cards),
+            dtype=np.int64,
+            count=len(cards),
+        )
+        ease = np.fromiter(
+            (int(card.get("ease") or 250) for card in cards),
+            dtype=np.int64,
+            count=len(cards),
+        )
+        normalize = MongoSRSService.as_aware_utc
+        return FSRSBatchState(
+            stability=np.where(interval_days > 0, interval_days, 1).astype(np.float64),
+            difficulty=np.where(ease > 0, ease / 100.0, 0.5),
+            last_review_at=to_datetime64(
+                [normalize(card.get("last_reviewed_at")) for card in cards]
+            ),
+            reps=[int(card.get("reps") or 0) for card in cards],
+            lapses=[int(card.get("lapses") or 0) for card in cards],
+            last_interval=interval_days.astype(np.float64),
+        )
+
+    def calculate_next_reviews(
+        self,
+        cards: Sequence[dict[str, Any]],
+        grades: Sequence[Grade] | Grade,
+        now: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Batch equivalent of ``MongoSRSService.calculate_next_review``.
+
+        Pass a single grade to forecast "what if I review everything now".
+        """
+        now = now or datetime.now(timezone.utc)
+        if isinstance(grades, str):
+            grades = [grades] * len(cards)
+        if not cards:
+            return []
+
+        state = self.state_from_cards(cards)
+        new_state = self.model.review(state, grades, now)
+
+        stability = new_state.stability.tolist()
+        interval_days = np.trunc(new_state.stability).astype(np.int64).tolist()
+        ease = np.trunc(new_state.difficulty * 100).astype(np.int64).tolist()
+        reps = new_state.reps.tolist()
+        lapses = new_state.lapses.tolist()
+        previous_reps = state.reps.tolist()
+
+        results: list[dict[str, Any]] = []
+        for i, card in enumerate(cards):
+            grade = grades[i]
+            if grade == "again" or previous_reps[i] == 0:
+                status = "learning"
+            elif stability[i] >= 21:
+                status = "review"
+            else:
+                status = "learning"
+            streak_correct = int(card.get("streak_correct") or 0)
+            results.append(
+                {
+                    "status": status,
+                    "next_due_at": now + timedelta(seconds=stability[i] * 86400),
+                    "last_reviewed_at": now,
+                    "interval_days": interval_days[i],
+                    "ease": ease[i],
+                    "reps": reps[i],
+                    "lapses": lapses[i],
+                    "streak_correct": (
+                        streak_correct + 1 if grade in ("good", "easy") else 0
+                    ),
+                    "last_grade": grade,
+                }
+            )
+        return results
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+__all__ = [
+    "FSRSBatchModel",
+    "FSRSBatchState",
+    "MongoSRSBatchScheduler",
+    "encode_grades",
+    "ensure_numpy",
+    "to_datetime64",
+]
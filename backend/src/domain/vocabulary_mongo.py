@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import base64
+import json
+from collections import Counter
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from src.domain.errors import ResourceNotFoundError, ValidationError
+from src.domain.vocabulary_stats_cache import (
+    apply_vocab_stats_delta,
+    get_cached_vocab_counts,
+    get_vocab_stats_generation,
+    set_cached_vocab_counts,
+    status_change_delta,
+)
 
 if TYPE_CHECKING:
     from pymongo.collection import Collection
@@ -14,34 +24,43 @@ if TYPE_CHECKING:
 VALID_ITEM_TYPES = {"word", "phrase"}
 VALID_VOCAB_STATUSES = {"new", "learning", "review", "suspended"}
 VALID_REVIEW_GRADES = {"again", "hard", "good", "easy"}
+DUE_VOCAB_STATUSES = ["new", "learning", "review"]
+
+
+_CARD_DATETIME_KEYS = (
+    "created_at",
+    "updated_at",
+    "next_due_at",
+    "last_reviewed_at",
+    "deleted_at",
+)
+_STATE_DATETIME_KEYS = ("next_due_at", "last_reviewed_at")
 
 
 def serialize_vocab_card(doc: dict[str, Any]) -> dict[str, Any]:
     """Convert a Mongo vocabulary card document to a JSON-safe dict."""
-    payload = dict(doc)
-    payload["_id"] = str(payload["_id"])
-    for key in (
-        "created_at",
-        "updated_at",
-        "next_due_at",
-        "last_reviewed_at",
-        "deleted_at",
-    ):
-        if isinstance(payload.get(key), datetime):
-            payload[key] = payload[key].isoformat()
-    return payload
+    return {
+        **doc,
+        "_id": str(doc["_id"]),
+        **_iso_datetimes(doc, _CARD_DATETIME_KEYS),
+    }
 
 
 def serialize_vocab_review(doc: dict[str, Any]) -> dict[str, Any]:
     """Convert a Mongo vocabulary review document to a JSON-safe dict."""
-    payload = dict(doc)
-    payload["_id"] = str(payload["_id"])
-    payload["card_id"] = str(payload["card_id"])
-    if isinstance(payload.get("reviewed_at"), datetime):
-        payload["reviewed_at"] = payload["reviewed_at"].isoformat()
+    payload = {
+        **doc,
+        "_id": str(doc["_id"]),
+        "card_id": str(doc["card_id"]),
+        **_iso_datetimes(doc, ("reviewed_at",)),
+    }
     for state_key in ("previous_state", "next_state"):
-        if isinstance(payload.get(state_key), dict):
-            payload[state_key] = _json_safe_state(payload[state_key])
+        state = payload.get(state_key)
+        if isinstance(state, dict):
+            payload[state_key] = {
+                **state,
+                **_iso_datetimes(state, _STATE_DATETIME_KEYS),
+            }
     return payload
 
 
@@ -110,6 +129,7 @@ class MongoVocabularyRepository:
         }
         result = self.cards.insert_one(doc)
         doc["_id"] = result.inserted_id
+        apply_vocab_stats_delta(user_id, status_change_delta(None, doc))
         return serialize_vocab_card(doc)
 
     def get_card(self, *, user_id: str, card_id: str) -> dict[str, Any]:
@@ -133,19 +153,21 @@ class MongoVocabularyRepository:
             raise ValidationError("Nothing to update")
         set_updates["updated_at"] = _now()
 
-        doc = self.cards.find_one_and_update(
+        before = self.cards.find_one_and_update(
             {"_id": oid, "user_id": user_id, "deleted_at": None},
             {"$set": set_updates},
-            return_document=_return_document_after(),
         )
-        if not doc:
+        if not before:
             raise ResourceNotFoundError("Vocabulary card not found")
+        # $set only replaces top-level fields, so merging gives the stored doc.
+        doc = {**before, **set_updates}
+        apply_vocab_stats_delta(user_id, status_change_delta(before, doc))
         return serialize_vocab_card(doc)
 
     def soft_delete_card(self, *, user_id: str, card_id: str) -> None:
         oid = _object_id(card_id)
         now = _now()
-        result = self.cards.update_one(
+        before = self.cards.find_one_and_update(
             {"_id": oid, "user_id": user_id, "deleted_at": None},
             {
                 "$set": {
@@ -153,16 +175,25 @@ class MongoVocabularyRepository:
                     "updated_at": now,
                 }
             },
+            projection={"language": 1, "status": 1, "deleted_at": 1},
         )
-        if result.matched_count == 0:
+        if not before:
             raise ResourceNotFoundError("Vocabulary card not found")
+        apply_vocab_stats_delta(
+            user_id,
+            status_change_delta(before, {**before, "status": "suspended"}),
+        )
 
     def hard_delete_card(self, *, user_id: str, card_id: str) -> None:
         oid = _object_id(card_id)
-        result = self.cards.delete_one({"_id": oid, "user_id": user_id})
-        if result.deleted_count == 0:
+        deleted = self.cards.find_one_and_delete(
+            {"_id": oid, "user_id": user_id},
+            projection={"language": 1, "status": 1, "deleted_at": 1},
+        )
+        if not deleted:
             raise ResourceNotFoundError("Vocabulary card not found")
         self.reviews.delete_many({"card_id": oid, "user_id": user_id})
+        apply_vocab_stats_delta(user_id, status_change_delta(deleted, None))
 
     def list_cards(
         self,
@@ -176,7 +207,16 @@ class MongoVocabularyRepository:
         include_deleted: bool = False,
         limit: int = 50,
         offset: int = 0,
+        cursor: str | None = None,
+        include_total: bool | None = None,
     ) -> dict[str, Any]:
+        """List cards newest-first.
+
+        Passing ``cursor`` (``""`` for the first page) switches to keyset
+        pagination over ``(updated_at, _id)``: each page seeks directly into
+        ``ix_vocab_cards_user_updated`` instead of skipping ``offset`` rows.
+        The total count is skipped in cursor mode unless ``include_total``.
+        """
         query = self._build_list_query(
             user_id=user_id,
             language=language,
@@ -187,14 +227,33 @@ class MongoVocabularyRepository:
             include_deleted=include_deleted,
         )
         limit = max(1, min(limit, 100))
-        offset = max(0, offset)
-        total = self.cards.count_documents(query)
-        cursor = self.cards.find(query).sort("updated_at", -1).skip(offset).limit(limit)
+        keyset = cursor is not None
+        offset = 0 if keyset else max(0, offset)
+        if include_total is None:
+            include_total = not keyset
+        total = self.cards.count_documents(query) if include_total else None
+
+        page_query = query
+        if cursor:
+            page_query = {
+                "$and": [query, _list_cursor_query(*_decode_list_cursor(cursor))]
+            }
+
+        # Fetch one extra row to know whether another page exists.
+        docs = list(
+            self.cards.find(page_query)
+            .sort([("updated_at", -1), ("_id", -1)])
+            .skip(offset)
+            .limit(limit + 1)
+        )
+        has_more = len(docs) > limit
+        docs = docs[:limit]
         return {
-            "items": [serialize_vocab_card(doc) for doc in cursor],
+            "items": [serialize_vocab_card(doc) for doc in docs],
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": _encode_list_cursor(docs[-1]) if has_more else None,
         }
 
     def list_due_cards(
@@ -205,19 +264,11 @@ class MongoVocabularyRepository:
         limit: int = 20,
         now: datetime | None = None,
     ) -> list[dict[str, Any]]:
-        now = now or _now()
-        query: dict[str, Any] = {
-            "user_id": user_id,
-            "deleted_at": None,
-            "status": {"$in": ["new", "learning", "review"]},
-            "$or": [
-                {"next_due_at": None},
-                {"next_due_at": {"$lte": now}},
-            ],
-        }
-        if language:
-            query["language"] = _normalize_language(language)
-
+        query = self._build_due_query(
+            user_id=user_id,
+            language=language,
+            now=now or _now(),
+        )
         cursor = (
             self.cards.find(query).sort("next_due_at", 1).limit(max(1, min(limit, 100)))
         )
@@ -245,6 +296,7 @@ class MongoVocabularyRepository:
         )
         if not updated_card:
             raise ResourceNotFoundError("Vocabulary card not found")
+        apply_vocab_stats_delta(user_id, status_change_delta(card, updated_card))
 
         review_doc = {
             "user_id": user_id,
@@ -258,6 +310,164 @@ class MongoVocabularyRepository:
         review_doc["_id"] = result.inserted_id
         return serialize_vocab_review(review_doc)
 
+    def record_review_batch(
+        self,
+        *,
+        user_id: str,
+        reviews: list[tuple[str, str]],
+        schedule: Callable[[dict[str, Any], str, datetime], dict[str, Any]],
+        now: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Review many cards with one read, one bulk update and one insert.
+
+        ``schedule(card, grade, now)`` computes the next SRS state in memory.
+        Missing cards are skipped; a card listed twice is reviewed twice in
+        order, exactly like successive ``record_review`` calls.
+        """
+        from pymongo import UpdateOne
+
+        now = now or _now()
+        requested = [
+            (_object_id(card_id), _normalize_grade(grade)) for card_id, grade in reviews
+        ]
+        if not requested:
+            return []
+
+        cards = {
+            doc["_id"]: doc
+            for doc in self.cards.find(
+                {
+                    "_id": {"$in": list({oid for oid, _ in requested})},
+                    "user_id": user_id,
+                    "deleted_at": None,
+                }
+            )
+        }
+
+        original_cards = dict(cards)
+        updates: list[Any] = []
+        review_docs: list[dict[str, Any]] = []
+        reviewed_cards: list[dict[str, Any]] = []
+        for oid, grade in requested:
+            card = cards.get(oid)
+            if card is None:
+                continue
+
+            next_state = self._normalize_srs_updates(
+                schedule(card, grade, now), grade, now
+            )
+            updated_card = {**card, **next_state, "updated_at": now}
+            cards[oid] = updated_card
+
+            updates.append(
+                UpdateOne(
+                    {"_id": oid, "user_id": user_id, "deleted_at": None},
+                    {"$set": {**next_state, "updated_at": now}},
+                )
+            )
+            review_docs.append(
+                {
+                    "user_id": user_id,
+                    "card_id": oid,
+                    "grade": grade,
+                    "reviewed_at": now,
+                    "previous_state": _extract_srs_state(card),
+                    "next_state": _extract_srs_state(updated_card),
+                }
+            )
+            reviewed_cards.append(updated_card)
+
+        if not updates:
+            return []
+
+        self.cards.bulk_write(updates, ordered=True)
+        result = self.reviews.insert_many(review_docs, ordered=True)
+        for review_doc, inserted_id in zip(review_docs, result.inserted_ids):
+            review_doc["_id"] = inserted_id
+
+        stats_delta: Counter = Counter()
+        for oid, original in original_cards.items():
+            stats_delta.update(status_change_delta(original, cards[oid]))
+        apply_vocab_stats_delta(user_id, stats_delta)
+
+        return [
+            {
+                "card": serialize_vocab_card(card),
+                "review": serialize_vocab_review(review_doc),
+            }
+            for card, review_doc in zip(reviewed_cards, review_docs)
+        ]
+
+    def get_stats(
+        self,
+        *,
+        user_id: str,
+        language: str | None = None,
+        now: datetime | None = None,
+    ) -> dict[str, int]:
+        """Return per-status totals and the due count for one user.
+
+        Status counters come from the Redis cache when present; otherwise a
+        single aggregation recomputes them and the due count together.
+        """
+        now = now or _now()
+        language = _normalize_language(language) if language else None
+        counts = get_cached_vocab_counts(user_id)
+        if counts is None:
+            generation = get_vocab_stats_generation(user_id)
+            counts, due_today = self._aggregate_stats(
+                user_id=user_id, language=language, now=now
+            )
+            set_cached_vocab_counts(user_id, counts, generation=generation)
+        else:
+            due_today = self.cards.count_documents(
+                self._build_due_query(user_id=user_id, language=language, now=now)
+            )
+
+        status_counts = dict.fromkeys(("new", "learning", "review", "suspended"), 0)
+        for (card_language, status), count in counts.items():
+            if language and card_language != language:
+                continue
+            if status in status_counts:
+                status_counts[status] += max(0, count)
+        return {
+            "total": sum(status_counts.values()),
+            **status_counts,
+            "due_today": due_today,
+        }
+
+    def _aggregate_stats(
+        self,
+        *,
+        user_id: str,
+        language: str | None,
+        now: datetime,
+    ) -> tuple[dict[tuple[str, str], int], int]:
+        due_match = self._build_due_query(user_id=user_id, language=language, now=now)
+        pipeline = [
+            {"$match": {"user_id": user_id, "deleted_at": None}},
+            {
+                "$facet": {
+                    "counts": [
+                        {
+                            "$group": {
+                                "_id": {"language": "$language", "status": "$status"},
+                                "count": {"$sum": 1},
+                            }
+                        }
+                    ],
+                    "due": [{"$match": due_match}, {"$count": "count"}],
+                }
+            },
+        ]
+        result = next(self.cards.aggregate(pipeline), {})
+        counts = {
+            (row["_id"].get("language"), row["_id"].get("status")): row["count"]
+            for row in result.get("counts", [])
+        }
+        due = result.get("due") or [{}]
+        return counts, int(due[0].get("count", 0))
+
     def _get_card_doc(self, *, user_id: str, card_id: str) -> dict[str, Any]:
         oid = _object_id(card_id)
         doc = self.cards.find_one({"_id": oid, "user_id": user_id, "deleted_at": None})
@@ -265,6 +475,26 @@ class MongoVocabularyRepository:
             raise ResourceNotFoundError("Vocabulary card not found")
         return doc
 
+    def _build_due_query(
+        self,
+        *,
+        user_id: str,
+        language: str | None,
+        now: datetime,
+    ) -> dict[str, Any]:
+        query: dict[str, Any] = {
+            "user_id": user_id,
+            "deleted_at": None,
+            "status": {"$in": DUE_VOCAB_STATUSES},
+            "$or": [
+                {"next_due_at": None},
+                {"next_due_at": {"$lte": now}},
+            ],
+        }
+        if language:
+            query["language"] = _normalize_language(language)
+        return query
+
     def _normalize_card_updates(self, updates: dict[str, Any]) -> dict[str, Any]:
         allowed = {
             "text",
@@ -367,6 +597,44 @@ def _object_id(value: str) -> Any:
         raise ValidationError("Invalid vocabulary card ID") from exc
 
 
+def _encode_list_cursor(doc: dict[str, Any]) -> str:
+    # Cards without updated_at (old imports) sort after all others; "u" is null.
+    updated_at = doc.get("updated_at")
+    payload = {
+        "u": updated_at.isoformat() if isinstance(updated_at, datetime) else None,
+        "i": str(doc["_id"]),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_list_cursor(token: str) -> tuple[datetime | None, Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        updated_at = (
+            None if payload["u"] is None else datetime.fromisoformat(payload["u"])
+        )
+        last_id = payload["i"]
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValidationError("Invalid cursor") from exc
+    return updated_at, _object_id(last_id)
+
+
+def _list_cursor_query(updated_at: datetime | None, last_id: Any) -> dict[str, Any]:
+    """Rows after ``(updated_at, last_id)`` in ``updated_at desc, _id desc`` order."""
+    if updated_at is None:
+        # Missing/null updated_at sorts last; only those rows remain.
+        return {"updated_at": None, "_id": {"$lt": last_id}}
+    return {
+        "$or": [
+            {"updated_at": {"$lt": updated_at}},
+            {"updated_at": updated_at, "_id": {"$lt": last_id}},
+            {"updated_at": None},
+        ]
+    }
+
+
 def _return_document_after() -> Any:
     from pymongo import ReturnDocument
 
@@ -485,12 +753,10 @@ def _extract_srs_state(card: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _json_safe_state(state: dict[str, Any]) -> dict[str, Any]:
-    payload = dict(state)
-    for key in ("next_due_at", "last_reviewed_at"):
-        if isinstance(payload.get(key), datetime):
-            payload[key] = payload[key].isoformat()
-    return payload
+def _iso_datetimes(doc: dict[str, Any], keys: tuple[str, ...]) -> dict[str, str]:
+    return {
+        key: doc[key].isoformat() for key in keys if isinstance(doc.get(key), datetime)
+    }
 
 
 __all__ = [
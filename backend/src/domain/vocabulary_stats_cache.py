@@ -0,0 +1,150 @@
+"""Redis-cached per-user vocabulary status counters."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from src.config import Config
+from src.infra.cache import get_redis_client
+
+VOCAB_STATS_CACHE_PREFIX = "vocab:stats:v1"
+VOCAB_STATS_CACHE_TTL = Config.VOCAB_STATS_CACHE_TTL_SECONDS
+
+# Marks a computed entry for users with no cards; ignored when reading.
+_SENTINEL_FIELD = "_"
+
+# Every delta bumps the user's write generation, whether or not the hash
+# exists, then increments the hash fields when it does.
+_APPLY_DELTA_LUA = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 2, #ARGV, 2 do
+    redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+
+# A recompute is stored only if no delta landed since it read the generation;
+# otherwise its counts may be missing that change and are dropped.
+_STORE_IF_UNCHANGED_LUA = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], unpack(ARGV, 3))
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+def vocab_stats_cache_key(user_id: str) -> str:
+    """Build the Redis key holding one user's status counters."""
+    return f"{VOCAB_STATS_CACHE_PREFIX}:{user_id}"
+
+
+def _generation_key(user_id: str) -> str:
+    return f"{vocab_stats_cache_key(user_id)}:gen"
+
+
+def _field(language: str, status: str) -> str:
+    return f"{language}:{status}"
+
+
+def get_cached_vocab_counts(user_id: str) -> dict[tuple[str, str], int] | None:
+    """Return cached (language, status) counts, or None on a cache miss."""
+    raw = get_redis_client().hgetall(vocab_stats_cache_key(user_id))
+    if not raw:
+        return None
+
+    counts: dict[tuple[str, str], int] = {}
+    for field, value in raw.items():
+        if field == _SENTINEL_FIELD:
+            continue
+        language, _, status = field.rpartition(":")
+        try:
+            counts[(language, status)] = int(value)
+        except (TypeError, ValueError):
+            invalidate_vocab_stats_cache(user_id)
+            return None
+    return counts
+
+
+def get_vocab_stats_generation(user_id: str) -> str | None:
+    """Read the write generation before recomputing (None without Redis)."""
+    redis = get_redis_client()
+    if not redis.enabled:
+        return None
+    return redis.get(_generation_key(user_id)) or "0"
+
+
+def set_cached_vocab_counts(
+    user_id: str,
+    counts: dict[tuple[str, str], int],
+    *,
+    generation: str | None,
+) -> bool:
+    """
+    Store a freshly recomputed set of counters for one user.
+
+    ``generation`` is what ``get_vocab_stats_generation`` returned before the
+    recompute started; the write is skipped if a card changed since then.
+    """
+    if generation is None:
+        return False
+    args: list[Any] = [generation, VOCAB_STATS_CACHE_TTL, _SENTINEL_FIELD, 0]
+    for (language, status), count in counts.items():
+        args.extend((_field(language, status), int(count)))
+    stored = get_redis_client().run_script(
+        _STORE_IF_UNCHANGED_LUA,
+        [vocab_stats_cache_key(user_id), _generation_key(user_id)],
+        args,
+    )
+    return bool(stored)
+
+
+def apply_vocab_stats_delta(user_id: str, delta: Counter) -> None:
+    """Incrementally update cached counters; no-op when the entry is missing."""
+    args: list[Any] = [VOCAB_STATS_CACHE_TTL]
+    for (language, status), amount in delta.items():
+        if amount:
+            args.extend((_field(language, status), int(amount)))
+    if len(args) > 1:
+        get_redis_client().run_script(
+            _APPLY_DELTA_LUA,
+            [vocab_stats_cache_key(user_id), _generation_key(user_id)],
+            args,
+        )
+
+
+def invalidate_vocab_stats_cache(user_id: str) -> None:
+    """Drop cached counters so the next read recomputes them."""
+    get_redis_client().delete(vocab_stats_cache_key(user_id))
+
+
+def status_change_delta(
+    before: dict[str, Any] | None,
+    after: dict[str, Any] | None,
+) -> Counter:
+    """Counter changes implied by a card moving from ``before`` to ``after``."""
+    delta: Counter = Counter()
+    if before is not None and before.get("deleted_at") is None:
+        delta[(before.get("language"), before.get("status"))] -= 1
+    if after is not None and after.get("deleted_at") is None:
+        delta[(after.get("language"), after.get("status"))] += 1
+    return delta
+
+
+__all__ = [
+    "VOCAB_STATS_CACHE_PREFIX",
+    "apply_vocab_stats_delta",
+    "get_cached_vocab_counts",
+    "get_vocab_stats_generation",
+    "invalidate_vocab_stats_cache",
+    "set_cached_vocab_counts",
+    "status_change_delta",
+    "vocab_stats_cache_key",
+]
@@ -4,6 +4,8 @@ Infrastructure layer - external services and integrations.
 Provides:
 - db: PostgreSQL connection and ORM models
 - cache: Redis client
+- http: pooled, retrying HTTP client for GitHub-hosted content
 - ai: AI client and rate limiting
 - auth: JWT and OAuth helpers
+- metrics: Prometheus request, pool and cache metrics
 """
@@ -1,6 +1,23 @@
 """AI infrastructure - Gemini client and rate limiting."""
 
 from src.infra.ai.client import AIClient
-from src.infra.ai.rate_limiter import AIRateLimiter, enforce_ai_rate_limit
+from src.infra.ai.coalesce import (
+    RequestCoalescer,
+    get_ai_coalescer,
+    prompt_flight_key,
+)
+from src.infra.ai.rate_limiter import (
+    AIRateLimiter,
+    RateLimitResult,
+    enforce_ai_rate_limit,
+)
 
-__all__ = ["AIClient", "AIRateLimiter", "enforce_ai_rate_limit"]
+__all__ = [
+    "AIClient",
+    "AIRateLimiter",
+    "RateLimitResult",
+    "RequestCoalescer",
+    "enforce_ai_rate_limit",
+    "get_ai_coalescer",
+    "prompt_flight_key",
+]
@@ -0,0 +1,167 @@
+"""In-flight de-duplication of identical AI requests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+import typing
+import uuid
+from dataclasses import dataclass, field
+
+from src.config import Config
+from src.extensions import logger
+from src.infra.cache import RedisClient, get_redis_client
+
+# How often a caller waiting on another process's request re-checks Redis.
+_WAIT_POLL_SECONDS = 0.05
+
+
+def prompt_flight_key(prompt: str, model_candidates: typing.Sequence[str]) -> str:
+    """Identify a model request by its prompt and the models it may run on."""
+    raw = json.dumps([prompt, list(model_candidates)], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _Flight:
+    done: threading.Event = field(default_factory=threading.Event)
+    value: typing.Any = None
+    ok: bool = False
+
+
+class RequestCoalescer:
+    """
+    Run one request per key at a time; concurrent callers share its result.
+
+    - Within a process, followers wait on the leader thread's event.
+    - Across processes, the leader holds ``ai:flight:<key>`` (``SET NX``,
+      value = flight token) and publishes its result under
+      ``ai:flight:<key>:result:<token>`` for ``result_ttl_seconds`` before
+      releasing the lock; followers in other processes poll for it.
+    - If the leader raises, nothing is handed off: waiting callers retry on
+      their own (one of them becomes the next leader), so per-caller checks
+      such as rate limits are never silently skipped.
+    - Without Redis only in-process de-duplication applies.
+
+    Results must be JSON-serialisable.
+    """
+
+    def __init__(
+        self,
+        *,
+        lock_timeout_seconds: int,
+        result_ttl_seconds: int,
+        redis: RedisClient | None = None,
+    ) -> None:
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.result_ttl_seconds = result_ttl_seconds
+        self._redis_client = redis
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._stats = {"leaders": 0, "local_followers": 0, "remote_followers": 0}
+
+    def run(self, key: str, compute: typing.Callable[[], typing.Any]) -> typing.Any:
+        """Return ``compute()``, or the result of an identical in-flight call."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait(self.lock_timeout_seconds)
+            if flight.ok:
+                self._count("local_followers")
+                return flight.value
+            return self._run_shared(key, compute)
+
+        try:
+            flight.value = self._run_shared(key, compute)
+            flight.ok = True
+            return flight.value
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def stats(self) -> dict[str, int]:
+        """Return leader/follower counters for this process."""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._flights)}
+
+    # -------------------------------------------------
+    # Cross-process coordination
+    # -------------------------------------------------
+
+    def _redis(self) -> RedisClient:
+        return self._redis_client or get_redis_client()
+
+    def _run_shared(
+        self, key: str, compute: typing.Callable[[], typing.Any]
+    ) -> typing.Any:
+        redis = self._redis()
+        lock_key = f"ai:flight:{key}"
+        deadline = time.monotonic() + self.lock_timeout_seconds
+
+        while redis.enabled and time.monotonic() < deadline:
+            token = uuid.uuid4().hex
+            if redis.set(lock_key, token, ex=self.lock_timeout_seconds, nx=True):
+                self._count("leaders")
+                try:
+                    value = compute()
+                    redis.set_json(
+                        f"{lock_key}:result:{token}",
+                        {"value": value},
+                        ex=self.result_ttl_seconds,
+                    )
+                    return value
+                finally:
+                    redis.delete_if_equals(lock_key, token)
+
+            leader_token = redis.get(lock_key)
+            if leader_token is None:
+                continue
+            handoff = self._await_handoff(lock_key, leader_token, deadline)
+            if handoff is not None:
+                self._count("remote_followers")
+                return handoff["value"]
+
+        if redis.enabled:
+            logger.warning(f"[AI-COALESCE] Gave up waiting on {key[:12]}, running")
+        self._count("leaders")
+        return compute()
+
+    def _await_handoff(
+        self, lock_key: str, leader_token: str, deadline: float
+    ) -> dict[str, typing.Any] | None:
+        redis = self._redis()
+        result_key = f"{lock_key}:result:{leader_token}"
+        while time.monotonic() < deadline:
+            handoff = redis.get_json(result_key)
+            if handoff is not None:
+                return handoff
+            if redis.get(lock_key) != leader_token:
+                # Released: the result is written before the lock is dropped.
+                return redis.get_json(result_key)
+            time.sleep(_WAIT_POLL_SECONDS)
+        return None
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+
+_coalescer: RequestCoalescer | None = None
+
+
+def get_ai_coalescer() -> RequestCoalescer:
+    """Return the process-wide coalescer for model requests."""
+    global _coalescer
+    if _coalescer is None:
+        _coalescer = RequestCoalescer(
+            lock_timeout_seconds=Config.AI_COALESCE_LOCK_SECONDS,
+            result_ttl_seconds=Config.AI_COALESCE_RESULT_TTL_SECONDS,
+        )
+    return _coalescer
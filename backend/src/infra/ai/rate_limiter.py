@@ -3,11 +3,103 @@
 from __future__ import annotations
 import time
 import typing
+from dataclasses import dataclass, field
 
 from src.config import Config
 from src.extensions import logger
 from src.infra.cache import get_redis_client
 
+# Checks every bucket in one atomic round trip. Per bucket i:
+#   KEYS[2i-1] current window counter, KEYS[2i] previous window counter
+#   ARGV[3 + 3(i-1) ..] limit, window seconds, key TTL
+# Buckets are incremented in order and evaluation stops at the first one over
+# its limit, so a request rejected globally does not consume user quota.
+# "sliding" mode estimates the rolling count as
+#   previous * (unelapsed share of the window) + current.
+# Returns {0, remaining...} when allowed, {i, used, retry_after} when bucket i
+# is exceeded.
+_CHECK_LIMITS_LUA = """
+local mode = ARGV[1]
+local now = tonumber(ARGV[2])
+local remaining = {}
+for i = 1, #KEYS / 2 do
+    local base = 2 + (i - 1) * 3
+    local limit = tonumber(ARGV[base + 1])
+    local window = tonumber(ARGV[base + 2])
+    local ttl = tonumber(ARGV[base + 3])
+    local key = KEYS[2 * i - 1]
+
+    local count = redis.call('INCR', key)
+    if count == 1 or redis.call('TTL', key) < 0 then
+        redis.call('EXPIRE', key, ttl)
+    end
+
+    local elapsed = now % window
+    local used = count
+    if mode == 'sliding' then
+        local previous = tonumber(redis.call('GET', KEYS[2 * i]) or '0')
+        used = count + math.floor(previous * (window - elapsed) / window)
+    end
+    if used > limit then
+        return {i, used, math.ceil(window - elapsed)}
+    end
+    remaining[i] = limit - used
+end
+return {0, unpack(remaining)}
+"""
+
+# Concurrent job slots: KEYS[1] in-flight counter, ARGV limit and safety TTL
+# (so slots leaked by a crashed worker expire). Returns 1 when acquired.
+_ACQUIRE_SLOT_LUA = """
+local count = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+if count > tonumber(ARGV[1]) then
+    redis.call('DECR', KEYS[1])
+    return 0
+end
+return 1
+"""
+
+_RELEASE_SLOT_LUA = """
+local count = redis.call('DECR', KEYS[1])
+if count <= 0 then
+    redis.call('DEL', KEYS[1])
+end
+return count
+"""
+
+
+@dataclass(frozen=True)
+class _Bucket:
+    scope: str
+    limit: int
+    window_seconds: int
+    key: str
+    previous_key: str
+    ttl_seconds: int
+
+
+@dataclass
+class RateLimitResult:
+    """Outcome of one rate limit check."""
+
+    allowed: bool
+    # Requests left per scope; only the rejecting scope (0) when not allowed.
+    remaining: dict[str, int] = field(default_factory=dict)
+    scope: str | None = None
+    limit: int | None = None
+    retry_after: int | None = None
+
+    def info(self) -> dict[str, typing.Any] | None:
+        """Legacy exceeded-limit payload, or None when allowed."""
+        if self.allowed:
+            return None
+        return {
+            "scope": self.scope,
+            "limit": self.limit,
+            "retry_after": self.retry_after,
+        }
+
 
 class AIRateLimiter:
     """Redis-backed rate limiter for AI calls."""
@@ -15,71 +107,152 @@ class AIRateLimiter:
     USER_PER_MINUTE: int = int(getattr(Config, "AI_RATE_USER_PER_MINUTE", 10))
     USER_PER_DAY: int = int(getattr(Config, "AI_RATE_USER_PER_DAY", 500))
     GLOBAL_PER_MINUTE: int = int(getattr(Config, "AI_RATE_GLOBAL_PER_MINUTE", 200))
+    MODE: str = getattr(Config, "AI_RATE_MODE", "fixed")
+    USER_CONCURRENT_JOBS: int = int(getattr(Config, "AI_RATE_USER_CONCURRENT_JOBS", 2))
+    JOB_SLOT_TTL_SECONDS: int = 300
 
     def __init__(self) -> None:
         self._redis = get_redis_client()
 
-    def _incr_with_ttl(self, key: str, ttl_seconds: int) -> int | None:
-        count = self._redis.incr(key)
-        if count is None:
-            return None
-        if count == 1:
-            self._redis.expire(key, ttl_seconds)
-        return count
+    def _buckets(
+        self, subject_id: str | None, now: int, include_global: bool
+    ) -> list[_Bucket]:
+        minute_bucket = now // 60
+        day_bucket = time.strftime("%Y%m%d", time.gmtime(now))
+        prev_day_bucket = time.strftime("%Y%m%d", time.gmtime(now - 86400))
 
-    def check(self, subject_id: str | None) -> tuple[bool, dict | None]:
+        buckets: list[_Bucket] = []
+        if include_global and self.GLOBAL_PER_MINUTE > 0:
+            buckets.append(
+                _Bucket(
+                    scope="global_minute",
+                    limit=self.GLOBAL_PER_MINUTE,
+                    window_seconds=60,
+                    key=f"ai:rl:global:m:{minute_bucket}",
+                    previous_key=f"ai:rl:global:m:{minute_bucket - 1}",
+                    ttl_seconds=120,
+                )
+            )
+        if subject_id:
+            if self.USER_PER_MINUTE > 0:
+                buckets.append(
+                    _Bucket(
+                        scope="user_minute",
+                        limit=self.USER_PER_MINUTE,
+                        window_seconds=60,
+                        key=f"ai:rl:user:{subject_id}:m:{minute_bucket}",
+                        previous_key=f"ai:rl:user:{subject_id}:m:{minute_bucket - 1}",
+                        ttl_seconds=120,
+                    )
+                )
+            if self.USER_PER_DAY > 0:
+                buckets.append(
+                    _Bucket(
+                        scope="user_day",
+                        limit=self.USER_PER_DAY,
+                        window_seconds=86400,
+                        key=f"ai:rl:user:{subject_id}:d:{day_bucket}",
+                        previous_key=f"ai:rl:user:{subject_id}:d:{prev_day_bucket}",
+                        ttl_seconds=2 * 86400,
+                    )
+                )
+        return buckets
+
+    def evaluate(
+        self, subject_id: str | None, *, include_global: bool = True
+    ) -> RateLimitResult:
+        """
+        Count this call against every applicable bucket in one Redis round trip.
+        Fails open (allowed, no quota info) when Redis is unavailable.
+        """
+        now = int(time.time())
+        buckets = self._buckets(subject_id, now, include_global)
+        if not buckets:
+            return RateLimitResult(allowed=True)
+
+        keys: list[str] = []
+        args: list[typing.Any] = [self.MODE, now]
+        for bucket in buckets:
+            keys.extend((bucket.key, bucket.previous_key))
+            args.extend((bucket.limit, bucket.window_seconds, bucket.ttl_seconds))
+
+        reply = self._redis.run_script(_CHECK_LIMITS_LUA, keys, args)
+        if not reply:
+            return RateLimitResult(allowed=True)
+
+        exceeded_index = int(reply[0])
+        if exceeded_index == 0:
+            return RateLimitResult(
+                allowed=True,
+                remaining={
+                    bucket.scope: int(left) for bucket, left in zip(buckets, reply[1:])
+                },
+            )
+
+        bucket = buckets[exceeded_index - 1]
+        return RateLimitResult(
+            allowed=False,
+            remaining={bucket.scope: 0},
+            scope=bucket.scope,
+            limit=bucket.limit,
+            retry_after=max(int(reply[2]), 0),
+        )
+
+    def check(
+        self, subject_id: str | None, *, include_global: bool = True
+    ) -> tuple[bool, dict | None]:
         """
         Check all rate limits.
         Returns (True, None) if allowed, (False, info) if exceeded.
         """
-        now = int(time.time())
-        minute_bucket = now // 60
-        day_bucket = time.strftime("%Y%m%d", time.gmtime(now))
+        result = self.evaluate(subject_id, include_global=include_global)
+        return result.allowed, result.info()
 
-        # Global per-minute
-        if self.GLOBAL_PER_MINUTE > 0:
-            g_key = f"ai:rl:global:m:{minute_bucket}"
-            g_count = self._incr_with_ttl(g_key, ttl_seconds=120)
-            if g_count is not None and g_count > self.GLOBAL_PER_MINUTE:
-                return False, {
-                    "scope": "global_minute",
-                    "limit": self.GLOBAL_PER_MINUTE,
-                    "retry_after": max(self._redis.ttl(g_key), 0),
-                }
-
-        # Per-user limits
-        if subject_id:
-            if self.USER_PER_MINUTE > 0:
-                u_min_key = f"ai:rl:user:{subject_id}:m:{minute_bucket}"
-                u_min_count = self._incr_with_ttl(u_min_key, ttl_seconds=120)
-                if u_min_count is not None and u_min_count > self.USER_PER_MINUTE:
-                    return False, {
-                        "scope": "user_minute",
-                        "limit": self.USER_PER_MINUTE,
-                        "retry_after": max(self._redis.ttl(u_min_key), 0),
-                    }
+    @staticmethod
+    def _job_slot_key(subject_id: str) -> str:
+        return f"ai:rl:user:{subject_id}:jobs"
 
-            if self.USER_PER_DAY > 0:
-                u_day_key = f"ai:rl:user:{subject_id}:d:{day_bucket}"
-                u_day_count = self._incr_with_ttl(u_day_key, ttl_seconds=2 * 86400)
-                if u_day_count is not None and u_day_count > self.USER_PER_DAY:
-                    return False, {
-                        "scope": "user_day",
-                        "limit": self.USER_PER_DAY,
-                        "retry_after": max(self._redis.ttl(u_day_key), 0),
-                    }
+    def acquire_job_slot(self, subject_id: str) -> RateLimitResult:
+        """
+        Reserve one of the user's concurrent background job slots.
+        Fails open when Redis is unavailable.
+        """
+        if self.USER_CONCURRENT_JOBS <= 0:
+            return RateLimitResult(allowed=True)
+        reply = self._redis.run_script(
+            _ACQUIRE_SLOT_LUA,
+            [self._job_slot_key(subject_id)],
+            [self.USER_CONCURRENT_JOBS, self.JOB_SLOT_TTL_SECONDS],
+        )
+        if reply is None or int(reply) == 1:
+            return RateLimitResult(allowed=True)
+        return RateLimitResult(
+            allowed=False,
+            remaining={"user_jobs": 0},
+            scope="user_jobs",
+            limit=self.USER_CONCURRENT_JOBS,
+            retry_after=5,
+        )
 
-        return True, None
+    def release_job_slot(self, subject_id: str) -> None:
+        """Free a slot taken by ``acquire_job_slot``."""
+        if self.USER_CONCURRENT_JOBS <= 0:
+            return
+        self._redis.run_script(_RELEASE_SLOT_LUA, [self._job_slot_key(subject_id)], [])
 
 
-def enforce_ai_rate_limit(subject_id: str | None) -> dict[str, typing.Any] | None:
+def enforce_ai_rate_limit(
+    subject_id: str | None, *, include_global: bool = True
+) -> dict[str, typing.Any] | None:
     """
     Enforce AI rate limiting.
     Returns None if allowed, or info dict if exceeded.
+    With ``include_global=False`` only the per-user buckets are charged (e.g.
+    for answers served from cache, which cost no model quota).
     """
     limiter = AIRateLimiter()
     try:
-        allowed, info = limiter.check(subject_id)
+        allowed, info = limiter.check(subject_id, include_global=include_global)
         if not allowed and info:
             logger.warning(
                 f"[AI-RATE-LIMIT] scope={info.get('scope')} subject={subject_id}"
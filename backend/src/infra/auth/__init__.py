@@ -1,5 +1,5 @@
 """Authentication infrastructure - JWT and session management."""
 
-from src.infra.auth.jwt import create_jwt, decode_jwt
+from src.infra.auth.jwt import create_jwt, decode_jwt, jwt_cache_stats
 
-__all__ = ["create_jwt", "decode_jwt"]
+__all__ = ["create_jwt", "decode_jwt", "jwt_cache_stats"]
@@ -5,8 +5,10 @@ import base64
 import hashlib
 import hmac
 import json
+import threading
 import time
 import typing
+from collections import OrderedDict
 
 from src.config import Config
 
@@ -14,6 +16,86 @@ JWT_SECRET = getattr(Config, "DB_JWT_SECRET", None) or Config.SECRET_KEY
 JWT_ALG = "HS256"
 JWT_ISS = "memomap-learning"
 
+# Keyed once; each signature copies this instead of re-deriving the HMAC pads.
+_SIGNER = hmac.new(JWT_SECRET.encode("utf-8"), digestmod=hashlib.sha256)
+
+# How long a verified token without ``exp`` may be served from the cache.
+_NO_EXP_CACHE_SECONDS = 300
+
+
+def _sign(signing_input: bytes) -> bytes:
+    mac = _SIGNER.copy()
+    mac.update(signing_input)
+    return mac.digest()
+
+
+class _VerifiedTokenCache:
+    """
+    Bounded LRU of verified payloads keyed by a hash of the token.
+
+    Entries are dropped once the token's ``exp`` passes, so a hit is exactly
+    as valid as a fresh decode. Only successfully verified tokens are stored.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, tuple[dict[str, typing.Any], int]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, token: str) -> dict[str, typing.Any] | None:
+        if self.max_entries <= 0:
+            return None
+        key = self._key(token)
+        now = int(time.time())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now > entry[1]:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, token: str, payload: dict[str, typing.Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = int(exp)
+        else:
+            expires_at = int(time.time()) + _NO_EXP_CACHE_SECONDS
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+
+_token_cache = _VerifiedTokenCache(Config.JWT_CACHE_MAX_ENTRIES)
+
 
 def _b64url_encode(data: bytes) -> str:
     return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
@@ -46,8 +128,7 @@ def create_jwt(
     payload_b64 = _b64url_encode(json.dumps(payload, separators=(",", ":")).encode())
     signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
 
-    sig = hmac.new(JWT_SECRET.encode("utf-8"), signing_input, hashlib.sha256).digest()
-    sig_b64 = _b64url_encode(sig)
+    sig_b64 = _b64url_encode(_sign(signing_input))
 
     return f"{header_b64}.{payload_b64}.{sig_b64}"
 
@@ -56,16 +137,32 @@ def decode_jwt(token: str) -> dict[str, typing.Any] | None:
     """
     Validate and decode a JWT.
     Returns the payload dict on success, None if invalid/expired.
+    Verified payloads are cached until the token expires; treat the returned
+    dict as read-only.
     """
+    cached = _token_cache.get(token)
+    if cached is not None:
+        return cached
+
+    payload = _verify_jwt(token)
+    if payload is not None:
+        _token_cache.put(token, payload)
+    return payload
+
+
+def jwt_cache_stats() -> dict[str, int]:
+    """Return verified-token cache hits, misses and size for this process."""
+    return _token_cache.stats()
+
+
+def _verify_jwt(token: str) -> dict[str, typing.Any] | None:
     try:
         header_b64, payload_b64, sig_b64 = token.split(".")
     except ValueError:
         return None
 
     signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
-    expected_sig = hmac.new(
-        JWT_SECRET.encode("utf-8"), signing_input, hashlib.sha256
-    ).digest()
+    expected_sig = _sign(signing_input)
 
     try:
         sig = _b64url_decode(sig_b64)
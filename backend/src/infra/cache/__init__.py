@@ -1,5 +1,14 @@
 """Redis cache infrastructure."""
 
+from src.infra.cache.blob_cache import CachedBlob, DiskBlobCache
 from src.infra.cache.client import RedisClient, get_redis_client
+from src.infra.cache.tiered import TieredCache, tiered_cache_stats
 
-__all__ = ["RedisClient", "get_redis_client"]
+__all__ = [
+    "CachedBlob",
+    "DiskBlobCache",
+    "RedisClient",
+    "TieredCache",
+    "get_redis_client",
+    "tiered_cache_stats",
+]
@@ -0,0 +1,262 @@
+"""Size-bounded, content-addressed disk cache for proxied binary files."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import typing
+from dataclasses import dataclass
+
+from src.extensions import logger
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: single-flight per process only
+    fcntl = None
+
+
+@dataclass(frozen=True)
+class CachedBlob:
+    """A cached file ready to be served from disk."""
+
+    key: str
+    path: str
+    digest: str
+    size: int
+    content_type: str | None
+    filled_at: float
+
+
+# Blobs used (hit or filled) this recently are never evicted, so a path just
+# returned by get()/get_or_fill() stays valid until the caller opens it.
+_EVICT_GRACE_SECONDS = 60.0
+
+# Writes the body to the given file object and returns its content type.
+BlobFiller = typing.Callable[[typing.BinaryIO], typing.Optional[str]]
+
+
+class DiskBlobCache:
+    """
+    Disk cache mapping a source key (e.g. a GitHub path) to a content blob.
+
+    Layout under ``root``:
+    - ``blobs/<aa>/<sha256>``: file bodies, named by their content hash, so
+      identical files under different keys are stored once.
+    - ``index/<sha1(key)>.json``: key -> digest, size, content type, fill time.
+
+    Misses are filled single-flight through an ``flock`` on a per-key lock
+    file, so concurrent requests in any thread or worker on the host wait for
+    the first fill instead of fetching upstream again.
+    Blob mtimes are bumped on hits and the least recently used blobs are
+    evicted once the cache grows past ``max_bytes`` (blobs used within the
+    last minute are kept).
+    """
+
+    def __init__(
+        self,
+        root: str,
+        *,
+        max_bytes: int,
+        ttl_seconds: int | None = None,
+    ) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._blobs_dir = os.path.join(root, "blobs")
+        self._index_dir = os.path.join(root, "index")
+        self._locks_dir = os.path.join(root, "locks")
+        for path in (self._blobs_dir, self._index_dir, self._locks_dir):
+            os.makedirs(path, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._total_bytes: int | None = None
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+
+    def get(self, key: str) -> CachedBlob | None:
+        """Return a fresh cached blob for ``key``, or None on a miss."""
+        entry = self._read_index(key)
+        if entry is None:
+            return None
+        if self.ttl_seconds and time.time() - entry["filled_at"] > self.ttl_seconds:
+            return None
+
+        blob_path = self._blob_path(entry["digest"])
+        try:
+            os.utime(blob_path)
+        except FileNotFoundError:
+            # Blob was evicted; the stale index entry is rewritten on refill.
+            return None
+        return CachedBlob(
+            key=key,
+            path=blob_path,
+            digest=entry["digest"],
+            size=entry["size"],
+            content_type=entry.get("content_type"),
+            filled_at=entry["filled_at"],
+        )
+
+    def get_or_fill(self, key: str, fill: BlobFiller) -> CachedBlob:
+        """Return the cached blob for ``key``, calling ``fill`` once on a miss."""
+        blob = self.get(key)
+        if blob is not None:
+            return blob
+
+        with self._fill_lock(key):
+            # Another thread or worker may have filled it while we waited.
+            blob = self.get(key)
+            if blob is not None:
+                return blob
+            return self._fill(key, fill)
+
+    def invalidate(self, key: str) -> None:
+        """Forget ``key``; its blob is left for LRU eviction."""
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._index_path(key))
+
+    # -------------------------------------------------
+    # Internals
+    # -------------------------------------------------
+
+    def _fill(self, key: str, fill: BlobFiller) -> CachedBlob:
+        hasher = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=self._blobs_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                content_type = fill(_HashingWriter(raw, hasher))
+            digest = hasher.hexdigest()
+            blob_path = self._blob_path(digest)
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, blob_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+
+        filled_at = time.time()
+        self._write_index(
+            key,
+            {
+                "key": key,
+                "digest": digest,
+                "size": size,
+                "content_type": content_type,
+                "filled_at": filled_at,
+            },
+        )
+        self._account(size, keep=blob_path)
+        return CachedBlob(
+            key=key,
+            path=blob_path,
+            digest=digest,
+            size=size,
+            content_type=content_type,
+            filled_at=filled_at,
+        )
+
+    def _account(self, added: int, *, keep: str) -> None:
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, _, size in self._scan_blobs())
+            else:
+                self._total_bytes += added
+            if self._total_bytes > self.max_bytes:
+                self._evict(keep=keep)
+
+    def _evict(self, *, keep: str) -> None:
+        """
+        Drop least recently used blobs down to 90% of ``max_bytes``.
+
+        ``keep`` (the blob just filled) and recently used blobs are skipped
+        even if that leaves the cache above the target.
+        """
+        blobs = sorted(self._scan_blobs())
+        total = sum(size for _, _, size in blobs)
+        target = int(self.max_bytes * 0.9)
+        cutoff = time.time() - _EVICT_GRACE_SECONDS
+        for mtime, path, size in blobs:
+            if total <= target or mtime >= cutoff:
+                break
+            if path == keep:
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+                total -= size
+        self._total_bytes = total
+        logger.info(f"[BLOB-CACHE] Evicted down to {total} bytes in {self.root}")
+
+    def _scan_blobs(self) -> list[tuple[float, str, int]]:
+        blobs = []
+        for dirpath, _, filenames in os.walk(self._blobs_dir):
+            for name in filenames:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(dirpath, name)
+                with contextlib.suppress(FileNotFoundError):
+                    stat = os.stat(path)
+                    blobs.append((stat.st_mtime, path, stat.st_size))
+        return blobs
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self._blobs_dir, digest[:2], digest)
+
+    def _key_hash(self, key: str) -> str:
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _index_path(self, key: str) -> str:
+        return os.path.join(self._index_dir, f"{self._key_hash(key)}.json")
+
+    def _read_index(self, key: str) -> dict[str, typing.Any] | None:
+        try:
+            with open(self._index_path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return entry if entry.get("key") == key else None
+
+    def _write_index(self, key: str, entry: dict[str, typing.Any]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self._index_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, self._index_path(key))
+
+    @contextlib.contextmanager
+    def _fill_lock(self, key: str) -> typing.Iterator[None]:
+        if fcntl is None:
+            with self._lock:
+                key_lock = self._key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                yield
+            return
+        # flock on separate descriptors also serializes threads of this process.
+        lock_path = os.path.join(self._locks_dir, f"{self._key_hash(key)}.lock")
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class _HashingWriter:
+    """Binary file wrapper that hashes everything written through it."""
+
+    def __init__(self, raw: typing.BinaryIO, hasher: typing.Any) -> None:
+        self._raw = raw
+        self._hasher = hasher
+
+    def write(self, data: bytes) -> int:
+        self._hasher.update(data)
+        return self._raw.write(data)
+
+
+__all__ = ["BlobFiller", "CachedBlob", "DiskBlobCache"]
@@ -13,6 +13,24 @@ from redis.exceptions import RedisError
 from src.config import Config
 from src.extensions import logger
 
+_HSET_IF_EXISTS_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+if tonumber(ARGV[1]) > 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return 1
+"""
+
+_DELETE_IF_EQUALS_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
 
 class RedisClient:
     """
@@ -25,6 +43,7 @@ class RedisClient:
     _client: redis.Redis | None = None
     _test_client: typing.Any | None = None
     _disabled_until: float = 0.0
+    _scripts: dict[str, typing.Any] = {}
 
     def __new__(cls) -> RedisClient:
         if cls._instance is None:
@@ -125,6 +144,28 @@ class RedisClient:
             self._trip(e)
             return False
 
+    @property
+    def breaker_open(self) -> bool:
+        """Whether operations are suspended after a recent Redis error."""
+        return time.time() < float(self._disabled_until)
+
+    def pool_stats(self) -> dict[str, int]:
+        """Connection counts of this process's pool (zeros before it exists)."""
+        pool = self._pool
+        if pool is None:
+            return {"max_connections": 0, "open": 0, "in_use": 0}
+        if isinstance(pool, BlockingConnectionPool):
+            opened = len(pool._connections)
+            idle = len(pool._get_free_connections())
+        else:
+            opened = pool._created_connections
+            idle = len(pool._available_connections)
+        return {
+            "max_connections": pool.max_connections,
+            "open": opened,
+            "in_use": max(opened - idle, 0),
+        }
+
     # String operations
     def get(self, key: str) -> str | None:
         if not self.enabled:
@@ -135,15 +176,28 @@ class RedisClient:
             self._trip(e)
             return None
 
-    def set(self, key: str, value: str, ex: int | None = None) -> bool:
+    def set(
+        self, key: str, value: str, ex: int | None = None, nx: bool = False
+    ) -> bool:
+        """Set ``key``; with ``nx`` only when absent (False if it already exists)."""
         if not self.enabled:
             return False
         try:
-            return bool(self.client.set(key, value, ex=ex))
+            return bool(self.client.set(key, value, ex=ex, nx=nx))
         except RedisError as e:
             self._trip(e)
             return False
 
+    def mget(self, keys: list[str]) -> list[str | None]:
+        """Fetch many keys in one round trip; all misses when unavailable."""
+        if not self.enabled or not keys:
+            return [None] * len(keys)
+        try:
+            return self.client.mget(keys)
+        except RedisError as e:
+            self._trip(e)
+            return [None] * len(keys)
+
     def delete(self, key: str) -> bool:
         if not self.enabled:
             return False
@@ -153,6 +207,16 @@ class RedisClient:
             self._trip(e)
             return False
 
+    def delete_if_equals(self, key: str, value: str) -> bool:
+        """Delete ``key`` only while it still holds ``value`` (e.g. a lock token)."""
+        if not self.enabled:
+            return False
+        try:
+            return bool(self.client.eval(_DELETE_IF_EQUALS_LUA, 1, key, value))
+        except RedisError as e:
+            self._trip(e)
+            return False
+
     def incr(self, key: str) -> int | None:
         if not self.enabled:
             return None
@@ -180,6 +244,70 @@ class RedisClient:
             self._trip(e)
             return -1
 
+    # Hash operations
+    def hgetall(self, key: str) -> dict[str, str] | None:
+        """Return all hash fields, or None when missing or Redis is unavailable."""
+        if not self.enabled:
+            return None
+        try:
+            return self.client.hgetall(key) or None
+        except RedisError as e:
+            self._trip(e)
+            return None
+
+    def hset_mapping(
+        self, key: str, mapping: dict[str, typing.Any], ex: int | None = None
+    ) -> bool:
+        """Atomically replace a hash with ``mapping`` and optionally set a TTL."""
+        if not self.enabled or not mapping:
+            return False
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.delete(key)
+            pipe.hset(key, mapping=mapping)
+            if ex:
+                pipe.expire(key, ex)
+            pipe.execute()
+            return True
+        except RedisError as e:
+            self._trip(e)
+            return False
+
+    def hset_if_exists(
+        self, key: str, mapping: dict[str, typing.Any], ex: int | None = None
+    ) -> bool:
+        """Set hash fields only when the hash exists, optionally refreshing its TTL."""
+        if not self.enabled or not mapping:
+            return False
+        args: list[typing.Any] = [int(ex or 0)]
+        for field, value in mapping.items():
+            args.extend((field, value))
+        try:
+            return bool(self.client.eval(_HSET_IF_EXISTS_LUA, 1, key, *args))
+        except RedisError as e:
+            self._trip(e)
+            return False
+
+    # Scripting
+    def run_script(
+        self,
+        script: str,
+        keys: list[str],
+        args: list[typing.Any],
+    ) -> typing.Any | None:
+        """Run a Lua script by SHA (loaded on first use); None when unavailable."""
+        if not self.enabled:
+            return None
+        try:
+            compiled = self._scripts.get(script)
+            if compiled is None:
+                compiled = self.client.register_script(script)
+                self._scripts[script] = compiled
+            return compiled(keys=keys, args=args, client=self.client)
+        except RedisError as e:
+            self._trip(e)
+            return None
+
     # JSON operations
     def get_json(self, key: str) -> typing.Any | None:
         val = self.get(key)
@@ -190,6 +318,15 @@ class RedisClient:
         except json.JSONDecodeError:
             return None
 
+    def mget_json(self, keys: list[str]) -> list[typing.Any | None]:
+        values: list[typing.Any | None] = []
+        for val in self.mget(keys):
+            try:
+                values.append(json.loads(val) if val is not None else None)
+            except json.JSONDecodeError:
+                values.append(None)
+        return values
+
     def set_json(self, key: str, value: typing.Any, ex: int | None = None) -> bool:
         try:
             return self.set(key, json.dumps(value), ex=ex)
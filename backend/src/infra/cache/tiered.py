@@ -0,0 +1,442 @@
+"""Two-tier (in-process LRU + Redis) cache with stampede protection."""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import random
+import threading
+import time
+import typing
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from src.config import Config
+from src.extensions import logger
+from src.infra.cache.client import RedisClient, get_redis_client
+from src.infra.metrics import count_cache_event
+
+T = typing.TypeVar("T")
+
+# How often a caller waiting on another process's load re-checks Redis.
+_WAIT_POLL_SECONDS = 0.05
+
+_STAT_NAMES = (
+    "local_hits",
+    "redis_hits",
+    "misses",
+    "loads",
+    "load_errors",
+    "coalesced",
+    "early_refreshes",
+)
+
+
+@dataclass(frozen=True)
+class _Entry(typing.Generic[T]):
+    value: T
+    expires_at: float
+    # Seconds the load that produced this value took (drives early refresh).
+    delta: float
+    # When the local copy must be re-read from Redis (while Redis is usable).
+    local_until: float
+
+
+class TieredCache(typing.Generic[T]):
+    """
+    Read-through cache: per-process LRU in front of Redis, shared by workers.
+
+    - Keys live under ``cache:<namespace>:v<version>:``. ``invalidate_all``
+      bumps the namespace version in Redis, orphaning every key at once; other
+      processes pick the new version up within ``local_ttl_seconds``.
+    - Local entries are re-read from Redis after ``local_ttl_seconds``, which
+      bounds how long another worker's ``delete`` can go unseen here.
+    - Misses in ``get_or_load`` are single-flight: one loader per key per
+      process (thread lock) and per cluster (Redis ``SET NX`` lock); others
+      wait for its result instead of hitting the origin too.
+    - Hits are refreshed early with probability rising towards expiry
+      (XFetch, scaled by how long the last load took), so hot keys are
+      reloaded by one caller before they expire for everyone.
+    - When Redis is disabled or tripped, the local tier keeps serving entries
+      until their own expiry and locking falls back to in-process only.
+
+    Values are returned by reference from the local tier: treat them as
+    read-only. ``encode``/``decode`` convert to and from JSON-safe data for
+    Redis (e.g. pydantic dump / validate). ``None`` is never cached.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        ttl_seconds: int,
+        encode: typing.Callable[[T], typing.Any] | None = None,
+        decode: typing.Callable[[typing.Any], T] | None = None,
+        local_max_entries: int | None = None,
+        local_ttl_seconds: float | None = None,
+        early_refresh_beta: float = 1.0,
+        lock_timeout_seconds: float = 10.0,
+        redis: RedisClient | None = None,
+    ) -> None:
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.local_max_entries = (
+            Config.CACHE_LOCAL_MAX_ENTRIES
+            if local_max_entries is None
+            else local_max_entries
+        )
+        self.local_ttl_seconds = (
+            Config.CACHE_LOCAL_TTL_SECONDS
+            if local_ttl_seconds is None
+            else local_ttl_seconds
+        )
+        self.early_refresh_beta = early_refresh_beta
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self._encode = encode or (lambda value: value)
+        self._decode = decode or (lambda data: data)
+        self._redis_client = redis
+
+        self._lock = threading.Lock()
+        self._local: OrderedDict[str, _Entry[T]] = OrderedDict()
+        self._key_locks: dict[str, list[typing.Any]] = {}
+        self._version = 0
+        self._version_checked_at = float("-inf")
+        self._stats = dict.fromkeys(_STAT_NAMES, 0)
+
+        _REGISTRY[namespace] = self
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+
+    def get(self, key: str) -> T | None:
+        """Return the cached value for ``key``, or None on a miss."""
+        entry = self._lookup(key)
+        return entry.value if entry is not None else None
+
+    def get_many(self, keys: typing.Sequence[str]) -> dict[str, T]:
+        """Return cached values for ``keys`` (misses omitted); one Redis MGET."""
+        now = time.time()
+        self._sync_version(now)
+        found: dict[str, T] = {}
+        remote: list[str] = []
+        for key in keys:
+            entry = self._local_get(key, now)
+            if entry is not None:
+                found[key] = entry.value
+            else:
+                remote.append(key)
+        local_hits = len(found)
+        if remote:
+            payloads = self._redis().mget_json([self._redis_key(k) for k in remote])
+            for key, payload in zip(remote, payloads):
+                entry = self._entry_from_payload(key, payload, now)
+                if entry is not None:
+                    found[key] = entry.value
+        self._count("local_hits", local_hits)
+        self._count("redis_hits", len(found) - local_hits)
+        self._count("misses", len(keys) - len(found))
+        return found
+
+    def set(self, key: str, value: T, *, ttl_seconds: int | None = None) -> None:
+        """Store ``value`` in both tiers."""
+        self._store(key, value, ttl_seconds=ttl_seconds, delta=0.0)
+
+    def delete(self, key: str) -> None:
+        """Drop ``key`` here and in Redis (other workers' local copies age out)."""
+        with self._lock:
+            self._local.pop(key, None)
+        self._redis().delete(self._redis_key(key))
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: typing.Callable[[], T],
+        *,
+        ttl_seconds: int | None = None,
+    ) -> T:
+        """Return the cached value, calling ``loader`` once on a miss."""
+        entry = self._lookup(key)
+        if entry is None:
+            return self._load_single_flight(key, loader, ttl_seconds)
+        if self._should_refresh_early(entry):
+            refreshed = self._refresh_early(key, loader, ttl_seconds)
+            if refreshed is not None:
+                return refreshed
+        return entry.value
+
+    def invalidate_all(self) -> None:
+        """Invalidate every key in the namespace by bumping its version."""
+        version = self._redis().incr(self._version_key())
+        with self._lock:
+            self._version = version if version is not None else self._version + 1
+            self._version_checked_at = time.time()
+            self._local.clear()
+
+    def clear_local(self) -> None:
+        """Drop this process's local tier only."""
+        with self._lock:
+            self._local.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss/load counters plus the current local tier size."""
+        with self._lock:
+            return {**self._stats, "local_entries": len(self._local)}
+
+    # -------------------------------------------------
+    # Lookup / store
+    # -------------------------------------------------
+
+    def _lookup(self, key: str, *, count: bool = True) -> _Entry[T] | None:
+        now = time.time()
+        self._sync_version(now)
+        entry = self._local_get(key, now)
+        if entry is not None:
+            if count:
+                self._count("local_hits")
+            return entry
+
+        payload = self._redis().get_json(self._redis_key(key))
+        entry = self._entry_from_payload(key, payload, now)
+        if count:
+            self._count("redis_hits" if entry is not None else "misses")
+        return entry
+
+    def _local_get(self, key: str, now: float) -> _Entry[T] | None:
+        redis_usable = self._redis().enabled
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            if now >= entry.expires_at or (redis_usable and now >= entry.local_until):
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return entry
+
+    def _entry_from_payload(
+        self, key: str, payload: typing.Any, now: float
+    ) -> _Entry[T] | None:
+        if not isinstance(payload, dict) or "value" not in payload:
+            return None
+        expires_at = float(payload.get("expires_at") or 0)
+        if now >= expires_at:
+            return None
+        try:
+            value = self._decode(payload["value"])
+        except Exception as e:
+            logger.warning(f"[CACHE:{self.namespace}] Dropping undecodable {key}: {e}")
+            self._redis().delete(self._redis_key(key))
+            return None
+        entry = _Entry(
+            value=value,
+            expires_at=expires_at,
+            delta=float(payload.get("delta") or 0.0),
+            local_until=min(expires_at, now + self.local_ttl_seconds),
+        )
+        self._local_put(key, entry)
+        return entry
+
+    def _store(
+        self,
+        key: str,
+        value: T,
+        *,
+        ttl_seconds: int | None,
+        delta: float,
+    ) -> None:
+        ttl = ttl_seconds or self.ttl_seconds
+        now = time.time()
+        expires_at = now + ttl
+        self._redis().set_json(
+            self._redis_key(key),
+            {"value": self._encode(value), "expires_at": expires_at, "delta": delta},
+            ex=math.ceil(ttl),
+        )
+        self._local_put(
+            key,
+            _Entry(
+                value=value,
+                expires_at=expires_at,
+                delta=delta,
+                local_until=min(expires_at, now + self.local_ttl_seconds),
+            ),
+        )
+
+    def _local_put(self, key: str, entry: _Entry[T]) -> None:
+        if self.local_max_entries <= 0:
+            return
+        with self._lock:
+            self._local[key] = entry
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_max_entries:
+                self._local.popitem(last=False)
+
+    # -------------------------------------------------
+    # Loading
+    # -------------------------------------------------
+
+    def _load(
+        self,
+        key: str,
+        loader: typing.Callable[[], T],
+        ttl_seconds: int | None,
+    ) -> T:
+        started = time.perf_counter()
+        try:
+            value = loader()
+        except Exception:
+            self._count("load_errors")
+            raise
+        self._count("loads")
+        if value is not None:
+            self._store(
+                key,
+                value,
+                ttl_seconds=ttl_seconds,
+                delta=time.perf_counter() - started,
+            )
+        return value
+
+    def _load_single_flight(
+        self,
+        key: str,
+        loader: typing.Callable[[], T],
+        ttl_seconds: int | None,
+    ) -> T:
+        with self._key_lock(key, blocking=True):
+            # Another thread of this process may have loaded it while we waited.
+            entry = self._lookup(key, count=False)
+            if entry is not None:
+                self._count("coalesced")
+                return entry.value
+
+            redis = self._redis()
+            if not redis.enabled:
+                return self._load(key, loader, ttl_seconds)
+
+            with self._redis_lock(key) as acquired:
+                if acquired:
+                    return self._load(key, loader, ttl_seconds)
+
+            # Another process is loading: wait for its result, not the origin.
+            deadline = time.monotonic() + self.lock_timeout_seconds
+            while time.monotonic() < deadline:
+                time.sleep(_WAIT_POLL_SECONDS)
+                entry = self._lookup(key, count=False)
+                if entry is not None:
+                    self._count("coalesced")
+                    return entry.value
+                if not redis.enabled or redis.get(self._lock_key(key)) is None:
+                    break  # Redis went away, or the other loader gave up.
+            return self._load(key, loader, ttl_seconds)
+
+    def _should_refresh_early(self, entry: _Entry[T]) -> bool:
+        if self.early_refresh_beta <= 0 or entry.delta <= 0:
+            return False
+        # XFetch: -log(u) is Exp(1); slow loads start refreshing earlier.
+        gap = -entry.delta * self.early_refresh_beta * math.log(1.0 - random.random())
+        return time.time() + gap >= entry.expires_at
+
+    def _refresh_early(
+        self,
+        key: str,
+        loader: typing.Callable[[], T],
+        ttl_seconds: int | None,
+    ) -> T | None:
+        """Reload ``key`` if nobody else is; None means keep the cached value."""
+        with self._key_lock(key, blocking=False) as local_acquired:
+            if not local_acquired:
+                return None
+            with self._redis_lock(key) as acquired:
+                if not acquired and self._redis().enabled:
+                    return None
+                self._count("early_refreshes")
+                try:
+                    return self._load(key, loader, ttl_seconds)
+                except Exception as e:
+                    logger.warning(
+                        f"[CACHE:{self.namespace}] Early refresh of {key} failed: {e}"
+                    )
+                    return None
+
+    # -------------------------------------------------
+    # Locks, versions, keys
+    # -------------------------------------------------
+
+    @contextlib.contextmanager
+    def _key_lock(self, key: str, *, blocking: bool) -> typing.Iterator[bool]:
+        with self._lock:
+            slot = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            slot[1] += 1
+        acquired = slot[0].acquire(blocking=blocking)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                slot[0].release()
+            with self._lock:
+                slot[1] -= 1
+                if slot[1] == 0:
+                    self._key_locks.pop(key, None)
+
+    @contextlib.contextmanager
+    def _redis_lock(self, key: str) -> typing.Iterator[bool]:
+        redis = self._redis()
+        lock_key = self._lock_key(key)
+        token = uuid.uuid4().hex
+        acquired = redis.set(
+            lock_key, token, ex=math.ceil(self.lock_timeout_seconds), nx=True
+        )
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                redis.delete_if_equals(lock_key, token)
+
+    def _sync_version(self, now: float) -> None:
+        redis = self._redis()
+        if not redis.enabled:
+            return
+        with self._lock:
+            if now - self._version_checked_at < self.local_ttl_seconds:
+                return
+            self._version_checked_at = now
+        raw = redis.get(self._version_key())
+        try:
+            version = int(raw) if raw is not None else 0
+        except ValueError:
+            version = 0
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._local.clear()
+
+    def _redis(self) -> RedisClient:
+        return self._redis_client or get_redis_client()
+
+    def _redis_key(self, key: str) -> str:
+        return f"cache:{self.namespace}:v{self._version}:{key}"
+
+    def _version_key(self) -> str:
+        return f"cache:{self.namespace}:version"
+
+    def _lock_key(self, key: str) -> str:
+        return f"cache:{self.namespace}:lock:{key}"
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+        count_cache_event(self.namespace, name, amount)
+
+
+_REGISTRY: dict[str, TieredCache[typing.Any]] = {}
+
+
+def tiered_cache_stats() -> dict[str, dict[str, int]]:
+    """Counters of every TieredCache created in this process, by namespace."""
+    return {namespace: cache.stats() for namespace, cache in _REGISTRY.items()}
+
+
+__all__ = ["TieredCache", "tiered_cache_stats"]
@@ -1,6 +1,8 @@
 """Database connection and session management."""
 
 from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from src.config import Config
@@ -45,6 +47,69 @@ def db_session() -> Session:
         db.close()
 
 
+class LazySession:
+    """
+    Stand-in for a Session that creates the real one on first use.
+
+    Requests that never touch Postgres construct no Session, check out no
+    pooled connection and issue no COMMIT. Attribute access is forwarded to
+    the underlying Session once it exists.
+    """
+
+    def __init__(self, factory: Callable[[], Session] = SessionLocal) -> None:
+        self._factory = factory
+        self._session: Session | None = None
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the real Session has been created."""
+        return self._session is not None
+
+    def _get(self) -> Session:
+        if self._session is None:
+            self._session = self._factory()
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+    def has_pending_work(self) -> bool:
+        """True when a transaction is open or objects await a flush."""
+        session = self._session
+        if session is None:
+            return False
+        return session.in_transaction() or bool(
+            session.new or session.dirty or session.deleted
+        )
+
+    def commit_if_needed(self) -> None:
+        """Commit only if the session did something worth committing."""
+        if self.has_pending_work():
+            self._session.commit()
+
+    def rollback(self) -> None:
+        if self._session is not None:
+            self._session.rollback()
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+@contextmanager
+def lazy_db_session() -> Iterator[LazySession]:
+    """Like ``db_session`` but the Session is only created if it is used."""
+    db = LazySession()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 def get_db() -> Session:
     """Get a new database session (caller manages lifecycle)."""
     return SessionLocal()
@@ -0,0 +1,17 @@
+"""Shared outbound HTTP client."""
+
+from src.infra.http.client import (
+    STREAM_CHUNK_SIZE,
+    HttpClient,
+    HttpMetrics,
+    get_http_client,
+    iter_response_chunks,
+)
+
+__all__ = [
+    "HttpClient",
+    "HttpMetrics",
+    "STREAM_CHUNK_SIZE",
+    "get_http_client",
+    "iter_response_chunks",
+]
@@ -0,0 +1,275 @@
+"""Pooled, retrying HTTP client shared by the GitHub content repositories."""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import Config
+from src.extensions import logger
+
+Timeout = float | tuple[float, float]
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Only these are replayed. GitHub contents PUT/DELETE are commits: a retry
+# after a lost or 5xx response could repeat one that already landed.
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+
+# Upper bound on bytes held per streamed body read.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _parse_host_timeouts(entries: list[str]) -> dict[str, tuple[float, float]]:
+    """Parse ``host=connect:read`` (or ``host=seconds``) entries."""
+    timeouts: dict[str, tuple[float, float]] = {}
+    for entry in entries:
+        host, sep, value = entry.partition("=")
+        if not sep:
+            continue
+        connect, _, read = value.partition(":")
+        try:
+            timeouts[host.strip().lower()] = (float(connect), float(read or connect))
+        except ValueError:
+            logger.warning(f"[HTTP] Ignoring invalid host timeout entry: {entry}")
+    return timeouts
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+    bytes: int = 0
+
+
+class _CappedRetry(Retry):
+    """Retry that waits at most ``HTTP_RETRY_AFTER_MAX_SECONDS`` for Retry-After."""
+
+    def get_retry_after(self, response: typing.Any) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, Config.HTTP_RETRY_AFTER_MAX_SECONDS)
+
+
+class HttpMetrics:
+    """Per-host request counters (count, errors, retries, latency, bytes)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hosts: dict[str, HostStats] = {}
+
+    def record(
+        self,
+        host: str,
+        *,
+        seconds: float,
+        nbytes: int,
+        error: bool,
+        retries: int = 0,
+    ) -> None:
+        with self._lock:
+            stats = self._hosts.setdefault(host, HostStats())
+            stats.requests += 1
+            stats.errors += int(error)
+            stats.retries += retries
+            stats.seconds += seconds
+            stats.bytes += nbytes
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {
+                host: {
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "retries": stats.retries,
+                    "seconds": stats.seconds,
+                    "bytes": stats.bytes,
+                }
+                for host, stats in self._hosts.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+
+
+class HttpClient:
+    """
+    One keep-alive ``requests.Session`` with bounded concurrency.
+
+    - Connections are pooled per host, so repeated fetches skip TCP/TLS setup.
+    - GET/HEAD requests are retried with exponential backoff on 429/5xx and
+      connection errors (read timeouts once); ``Retry-After`` is honoured up
+      to ``HTTP_RETRY_AFTER_MAX_SECONDS``. Writes are never replayed. The
+      final response is returned as-is, so callers keep using
+      ``raise_for_status``.
+    - A semaphore caps in-flight requests. For ``stream=True`` the slot is
+      released once headers arrive; the body is read by the caller.
+    - Timeouts default per host (``HTTP_HOST_TIMEOUTS``) unless passed
+      explicitly.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_maxsize: int | None = None,
+        max_concurrency: int | None = None,
+        max_retries: int | None = None,
+        backoff_factor: float | None = None,
+        default_timeout: tuple[float, float] | None = None,
+        host_timeouts: dict[str, tuple[float, float]] | None = None,
+    ) -> None:
+        pool_maxsize = pool_maxsize or Config.HTTP_POOL_MAXSIZE
+        self.default_timeout = default_timeout or (
+            Config.HTTP_CONNECT_TIMEOUT,
+            Config.HTTP_READ_TIMEOUT,
+        )
+        self.host_timeouts = (
+            host_timeouts
+            if host_timeouts is not None
+            else _parse_host_timeouts(Config.HTTP_HOST_TIMEOUTS)
+        )
+        self.metrics = HttpMetrics()
+        self._slots = threading.BoundedSemaphore(
+            max_concurrency or Config.HTTP_MAX_CONCURRENCY
+        )
+
+        retry = _CappedRetry(
+            total=Config.HTTP_MAX_RETRIES if max_retries is None else max_retries,
+            # A read timeout already cost a full timeout; retry it only once.
+            read=1,
+            backoff_factor=(
+                Config.HTTP_RETRY_BACKOFF if backoff_factor is None else backoff_factor
+            ),
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def timeout_for(self, url: str) -> tuple[float, float]:
+        host = (urlsplit(url).hostname or "").lower()
+        return self.host_timeouts.get(host, self.default_timeout)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: Timeout | None = None,
+        **kwargs: typing.Any,
+    ) -> requests.Response:
+        host = urlsplit(url).hostname or ""
+        started = time.perf_counter()
+        response: requests.Response | None = None
+        with self._slots:
+            try:
+                response = self.session.request(
+                    method,
+                    url,
+                    timeout=timeout if timeout is not None else self.timeout_for(url),
+                    **kwargs,
+                )
+                return response
+            finally:
+                self._record(host, started, response, kwargs.get("stream", False))
+
+    def get(self, url: str, **kwargs: typing.Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def put(self, url: str, **kwargs: typing.Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: typing.Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def _record(
+        self,
+        host: str,
+        started: float,
+        response: requests.Response | None,
+        stream: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - started
+        nbytes = 0
+        retries = 0
+        if response is not None:
+            if stream:
+                nbytes = int(response.headers.get("Content-Length") or 0)
+            else:
+                nbytes = len(response.content or b"")
+            raw_retries = getattr(response.raw, "retries", None)
+            if raw_retries is not None:
+                retries = len(raw_retries.history)
+        self.metrics.record(
+            host,
+            seconds=elapsed,
+            nbytes=nbytes,
+            error=response is None or response.status_code >= 500,
+            retries=retries,
+        )
+        logger.debug(
+            "[HTTP] {} {:.1f}ms {}B status={}",
+            host,
+            elapsed * 1000,
+            nbytes,
+            response.status_code if response is not None else "error",
+        )
+
+
+def iter_response_chunks(
+    response: requests.Response,
+    *,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> typing.Iterator[bytes]:
+    """Yield a streamed response body in bounded chunks, then release it.
+
+    The connection goes back to the pool when the body is exhausted, or as
+    soon as the consumer stops iterating (e.g. the downstream client went
+    away and the WSGI server closed the generator).
+    """
+    try:
+        yield from response.iter_content(chunk_size=chunk_size)
+    finally:
+        response.close()
+
+
+_http_client_singleton: HttpClient | None = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Get the process-wide HTTP client."""
+    global _http_client_singleton
+    if _http_client_singleton is None:
+        with _http_client_lock:
+            if _http_client_singleton is None:
+                _http_client_singleton = HttpClient()
+    return _http_client_singleton
+
+
+__all__ = [
+    "HttpClient",
+    "HttpMetrics",
+    "STREAM_CHUNK_SIZE",
+    "get_http_client",
+    "iter_response_chunks",
+]
@@ -0,0 +1,187 @@
+"""Prometheus metrics: request latency, connection pools and cache counters.
+
+For multi-process servers set ``PROMETHEUS_MULTIPROC_DIR`` to an empty,
+writable directory (wiped on deploy). Every worker then records its samples
+there and ``render_metrics`` merges them, so counters and histograms add up
+across workers whichever one answers the scrape. Gunicorn must call
+``mark_worker_dead(worker.pid)`` from its ``child_exit`` hook so pool gauges
+of exited workers are dropped. Without the variable, metrics cover the
+current process only.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+from flask import Request, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from src.extensions import logger
+
+# Pool gauges are sampled at most this often per process (and on every scrape).
+_GAUGE_REFRESH_SECONDS = 5.0
+
+# Most routes answer in milliseconds; AI and TTS calls take seconds.
+_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request handling time by blueprint and route.",
+    ("blueprint", "route", "method"),
+    buckets=_LATENCY_BUCKETS,
+)
+RESPONSES = Counter(
+    "http_responses",
+    "Responses by blueprint, route and status code.",
+    ("blueprint", "route", "method", "status"),
+)
+CACHE_EVENTS = Counter(
+    "cache_events",
+    "TieredCache lookups and loads by namespace "
+    "(local_hits, redis_hits, misses, loads, ...).",
+    ("namespace", "event"),
+)
+SQL_POOL = Gauge(
+    "sqlalchemy_pool_connections",
+    "SQLAlchemy connection pool (size, checked_out, checked_in, overflow).",
+    ("state",),
+    multiprocess_mode="livesum",
+)
+MONGO_POOL = Gauge(
+    "mongo_pool_connections",
+    "MongoDB connection pool (open, in_use, waiting).",
+    ("state",),
+    multiprocess_mode="livesum",
+)
+REDIS_POOL = Gauge(
+    "redis_pool_connections",
+    "Redis connection pool (max_connections, open, in_use).",
+    ("state",),
+    multiprocess_mode="livesum",
+)
+REDIS_BREAKER_OPEN = Gauge(
+    "redis_breaker_open",
+    "1 while Redis calls are suspended after an error (any worker).",
+    multiprocess_mode="livemax",
+)
+
+_refresh_lock = threading.Lock()
+_last_refresh = 0.0
+
+
+def multiprocess_enabled() -> bool:
+    """Whether samples are shared through ``PROMETHEUS_MULTIPROC_DIR``."""
+    return bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def observe_request(request: Request, response: Response, seconds: float) -> None:
+    """Record one handled request (templated route, so labels stay bounded)."""
+    blueprint = request.blueprint or ""
+    route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+    REQUEST_LATENCY.labels(blueprint, route, request.method).observe(seconds)
+    RESPONSES.labels(blueprint, route, request.method, str(response.status_code)).inc()
+
+
+def count_cache_event(namespace: str, event: str, amount: int = 1) -> None:
+    """Count a TieredCache event (called by the cache's own counters)."""
+    if amount:
+        CACHE_EVENTS.labels(namespace, event).inc(amount)
+
+
+def refresh_gauges(*, force: bool = False) -> None:
+    """Sample pool sizes and the Redis breaker into this process's gauges."""
+    global _last_refresh
+    now = time.monotonic()
+    if not force and now - _last_refresh < _GAUGE_REFRESH_SECONDS:
+        return
+    if not _refresh_lock.acquire(blocking=force):
+        return
+    try:
+        _last_refresh = now
+        _sample_sql_pool()
+        _sample_mongo_pool()
+        _sample_redis()
+    finally:
+        _refresh_lock.release()
+
+
+def _sample_sql_pool() -> None:
+    try:
+        from src.infra.db.connection import engine
+
+        pool = engine.pool
+        SQL_POOL.labels("size").set(pool.size())
+        SQL_POOL.labels("checked_out").set(pool.checkedout())
+        SQL_POOL.labels("checked_in").set(pool.checkedin())
+        SQL_POOL.labels("overflow").set(max(pool.overflow(), 0))
+    except Exception as e:
+        logger.debug(f"[Metrics] SQLAlchemy pool unavailable: {e}")
+
+
+def _sample_mongo_pool() -> None:
+    from src.infra.mongo import mongo_pool_stats
+
+    stats = mongo_pool_stats()
+    MONGO_POOL.labels("open").set(stats["open_connections"])
+    MONGO_POOL.labels("in_use").set(stats["in_use"])
+    MONGO_POOL.labels("waiting").set(stats["waiting"])
+
+
+def _sample_redis() -> None:
+    from src.infra.cache import get_redis_client
+
+    redis = get_redis_client()
+    for state, value in redis.pool_stats().items():
+        REDIS_POOL.labels(state).set(value)
+    REDIS_BREAKER_OPEN.set(int(redis.breaker_open))
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Return the exposition payload and its content type."""
+    refresh_gauges(force=True)
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead(pid: int) -> None:
+    """Drop an exited worker's live gauges (gunicorn ``child_exit`` hook)."""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid)
+
+
+__all__ = [
+    "count_cache_event",
+    "mark_worker_dead",
+    "multiprocess_enabled",
+    "observe_request",
+    "refresh_gauges",
+    "render_metrics",
+]
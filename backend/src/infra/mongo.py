@@ -1,15 +1,218 @@
 """MongoDB connection helpers."""
 
+import importlib.util
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 
 from pymongo import ASCENDING, DESCENDING, TEXT, MongoClient
 from pymongo.collection import Collection
 from pymongo.errors import OperationFailure
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+    ConnectionCheckOutStartedEvent,
+    ConnectionClosedEvent,
+    ConnectionCreatedEvent,
+    ConnectionPoolListener,
+    ConnectionReadyEvent,
+    PoolClearedEvent,
+    PoolClosedEvent,
+    PoolCreatedEvent,
+    PoolReadyEvent,
+)
 
+from src.config import Config
 from src.extensions import logger
 
+
+@dataclass(frozen=True)
+class MongoPoolProfile:
+    """MongoClient pool settings for one kind of deployment."""
+
+    max_pool_size: int
+    min_pool_size: int
+    max_idle_time_ms: int | None
+    wait_queue_timeout_ms: int | None
+    compressors: tuple[str, ...]
+    read_preference: str
+
+    def client_kwargs(self) -> dict:
+        kwargs: dict = {
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "readPreference": self.read_preference,
+        }
+        if self.max_idle_time_ms is not None:
+            kwargs["maxIdleTimeMS"] = self.max_idle_time_ms
+        if self.wait_queue_timeout_ms is not None:
+            kwargs["waitQueueTimeoutMS"] = self.wait_queue_timeout_ms
+        compressors = _available_compressors(self.compressors)
+        if compressors:
+            kwargs["compressors"] = ",".join(compressors)
+        return kwargs
+
+
+MONGO_POOL_PROFILES: dict[str, MongoPoolProfile] = {
+    # One socket per function instance; idle sockets are dropped quickly so
+    # frozen instances don't pile up connections on the cluster.
+    "serverless": MongoPoolProfile(
+        max_pool_size=1,
+        min_pool_size=0,
+        max_idle_time_ms=60_000,
+        wait_queue_timeout_ms=None,
+        compressors=("zstd", "zlib"),
+        read_preference="primary",
+    ),
+    # gunicorn/threaded workers: enough sockets for concurrent requests.
+    "threaded": MongoPoolProfile(
+        max_pool_size=16,
+        min_pool_size=2,
+        max_idle_time_ms=300_000,
+        wait_queue_timeout_ms=5_000,
+        compressors=("zstd", "zlib"),
+        read_preference="primary",
+    ),
+    # Long-running, busy workers: large warm pool, fail fast when saturated.
+    "high-throughput": MongoPoolProfile(
+        max_pool_size=64,
+        min_pool_size=8,
+        max_idle_time_ms=600_000,
+        wait_queue_timeout_ms=2_000,
+        compressors=("zstd", "snappy", "zlib"),
+        read_preference="primaryPreferred",
+    ),
+}
+
+# Compressors needing an optional package; zlib is always available.
+_COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy"}
+
+
+def _available_compressors(names: tuple[str, ...]) -> list[str]:
+    return [
+        name
+        for name in names
+        if name not in _COMPRESSOR_MODULES
+        or importlib.util.find_spec(_COMPRESSOR_MODULES[name]) is not None
+    ]
+
+
+def resolve_pool_profile() -> MongoPoolProfile:
+    """Return the configured pool profile with any MONGO_* overrides applied."""
+    profile = MONGO_POOL_PROFILES.get(Config.MONGO_POOL_PROFILE)
+    if profile is None:
+        logger.warning(
+            f"Unknown MONGO_POOL_PROFILE={Config.MONGO_POOL_PROFILE!r}, "
+            "using 'serverless'"
+        )
+        profile = MONGO_POOL_PROFILES["serverless"]
+
+    overrides: dict = {}
+    for field_name, raw in (
+        ("max_pool_size", Config.MONGO_MAX_POOL_SIZE),
+        ("min_pool_size", Config.MONGO_MIN_POOL_SIZE),
+        ("max_idle_time_ms", Config.MONGO_MAX_IDLE_TIME_MS),
+        ("wait_queue_timeout_ms", Config.MONGO_WAIT_QUEUE_TIMEOUT_MS),
+    ):
+        if raw:
+            overrides[field_name] = int(raw)
+    if Config.MONGO_COMPRESSORS:
+        overrides["compressors"] = tuple(Config.MONGO_COMPRESSORS)
+    if Config.MONGO_READ_PREFERENCE:
+        overrides["read_preference"] = Config.MONGO_READ_PREFERENCE
+    return replace(profile, **overrides)
+
+
+class MongoPoolMetrics(ConnectionPoolListener):
+    """Connection pool counters, including how long checkouts wait for a socket."""
+
+    def __init__(self, slow_checkout_ms: int) -> None:
+        self.slow_checkout_seconds = slow_checkout_ms / 1000
+        self._lock = threading.Lock()
+        self._stats = {
+            "checkouts": 0,
+            "checkout_failures": 0,
+            "wait_queue_timeouts": 0,
+            "slow_checkouts": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+            "waiting": 0,
+            "in_use": 0,
+            "open_connections": 0,
+            "pool_clears": 0,
+        }
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _add(self, **deltas: float) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                self._stats[name] += delta
+
+    def connection_check_out_started(
+        self, event: ConnectionCheckOutStartedEvent
+    ) -> None:
+        self._add(waiting=1)
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent) -> None:
+        wait = event.duration or 0.0
+        slow = wait >= self.slow_checkout_seconds
+        with self._lock:
+            self._stats["waiting"] -= 1
+            self._stats["in_use"] += 1
+            self._stats["checkouts"] += 1
+            self._stats["slow_checkouts"] += int(slow)
+            self._stats["wait_seconds_total"] += wait
+            self._stats["wait_seconds_max"] = max(self._stats["wait_seconds_max"], wait)
+        if slow:
+            logger.warning(
+                f"[Mongo] Waited {wait * 1000:.0f}ms for a pooled connection "
+                f"to {event.address}"
+            )
+
+    def connection_check_out_failed(self, event: ConnectionCheckOutFailedEvent) -> None:
+        timed_out = event.reason == "timeout"
+        self._add(
+            waiting=-1,
+            checkout_failures=1,
+            wait_queue_timeouts=int(timed_out),
+        )
+        if timed_out:
+            logger.warning(f"[Mongo] Pool wait queue timeout for {event.address}")
+
+    def connection_checked_in(self, event: ConnectionCheckedInEvent) -> None:
+        self._add(in_use=-1)
+
+    def connection_created(self, event: ConnectionCreatedEvent) -> None:
+        self._add(open_connections=1)
+
+    def connection_closed(self, event: ConnectionClosedEvent) -> None:
+        self._add(open_connections=-1)
+
+    def connection_ready(self, event: ConnectionReadyEvent) -> None:
+        pass
+
+    def pool_created(self, event: PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: PoolClearedEvent) -> None:
+        self._add(pool_clears=1)
+
+    def pool_closed(self, event: PoolClosedEvent) -> None:
+        pass
+
+
 # ── Global singleton ──────────────────────────────────────────────
 _client: MongoClient | None = None
+_client_lock = threading.Lock()
+_pool_metrics = MongoPoolMetrics(Config.MONGO_SLOW_CHECKOUT_MS)
 
 _DB_NAME = os.getenv("MONGO_DB_NAME", "memomap")
 
@@ -18,14 +221,53 @@ def _get_client() -> MongoClient:
     """Return the global MongoClient, creating it once."""
     global _client
     if _client is None:
-        uri = os.getenv("MONGO_URI")
-        if not uri:
-            raise RuntimeError("MONGO_URI environment variable is not set")
-        _client = MongoClient(uri, maxPoolSize=1)
-        logger.info("MongoDB client created (pool-size=1, serverless-safe)")
+        with _client_lock:
+            if _client is None:
+                uri = os.getenv("MONGO_URI")
+                if not uri:
+                    raise RuntimeError("MONGO_URI environment variable is not set")
+                profile = resolve_pool_profile()
+                _client = MongoClient(
+                    uri,
+                    event_listeners=[_pool_metrics],
+                    **profile.client_kwargs(),
+                )
+                logger.info(
+                    f"MongoDB client created (profile={Config.MONGO_POOL_PROFILE}, "
+                    f"pool={profile.min_pool_size}-{profile.max_pool_size})"
+                )
     return _client
 
 
+def mongo_pool_stats() -> dict[str, float]:
+    """Return connection pool counters (checkout waits, timeouts, sockets in use)."""
+    return _pool_metrics.snapshot()
+
+
+def warm_mongo_pool() -> int:
+    """
+    Open the pool's minimum connections now instead of on first requests.
+
+    Runs ``minPoolSize`` concurrent pings (at least one, which also primes
+    server discovery). Returns the number of successful pings.
+    """
+    client = _get_client()
+    connections = max(resolve_pool_profile().min_pool_size, 1)
+
+    def ping(_: int) -> bool:
+        try:
+            client.admin.command("ping")
+            return True
+        except Exception as exc:
+            logger.warning(f"[Mongo] Warmup ping failed: {exc}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=connections) as pool:
+        warmed = sum(pool.map(ping, range(connections)))
+    logger.info(f"[Mongo] Warmed {warmed}/{connections} pooled connections")
+    return warmed
+
+
 def get_db():
     """Return the default Mongo database handle."""
     return _get_client()[_DB_NAME]
@@ -57,6 +299,15 @@ def _drop_index_if_exists(collection: Collection, name: str) -> None:
             raise
 
 
+def _drop_index_if_keys_changed(
+    collection: Collection, name: str, keys: list[tuple[str, int]]
+) -> None:
+    """Drop a named index whose key pattern no longer matches ``keys``."""
+    existing = collection.index_information().get(name)
+    if existing and [tuple(key) for key in existing["key"]] != keys:
+        _drop_index_if_exists(collection, name)
+
+
 def ensure_vocabulary_indexes() -> None:
     """Create Mongo indexes required by the vocabulary repository."""
     cards = get_vocab_cards_collection()
@@ -87,10 +338,16 @@ def ensure_vocabulary_indexes() -> None:
         [("user_id", ASCENDING), ("source_context.exercise_id", ASCENDING)],
         name="ix_vocab_cards_user_source_exercise",
     )
-    cards.create_index(
-        [("user_id", ASCENDING), ("updated_at", DESCENDING)],
-        name="ix_vocab_cards_user_updated",
-    )
+    # `_id` is the keyset-pagination tie-breaker for cards sharing an
+    # `updated_at` (batch reviews stamp many cards at once), so it must be part
+    # of the index for `sort(updated_at, _id)` to avoid an in-memory sort.
+    updated_keys = [
+        ("user_id", ASCENDING),
+        ("updated_at", DESCENDING),
+        ("_id", DESCENDING),
+    ]
+    _drop_index_if_keys_changed(cards, "ix_vocab_cards_user_updated", updated_keys)
+    cards.create_index(updated_keys, name="ix_vocab_cards_user_updated")
     # Drop any pre-existing definition: a compound `sparse` unique index does
     # NOT skip documents where only `legacy_sql_id` is null (user_id is always
     # present), so every new card with `legacy_sql_id: null` collides. Replace
@@ -1,6 +1,31 @@
 """AI services for text explanation and chat."""
 
 from src.shared.ai.service import AIService
-from src.shared.ai.rate_limit import enforce_rate_limit
+from src.shared.ai.jobs import (
+    AIJobQueueFull,
+    get_ai_job,
+    iter_ai_job_events,
+    submit_ai_job,
+)
+from src.shared.ai.rate_limit import (
+    AIRateLimitExceeded,
+    enforce_rate_limit,
+    require_global_quota,
+)
+from src.shared.ai.response_cache import (
+    ai_response_cache_stats,
+    invalidate_ai_responses,
+)
 
-__all__ = ["AIService", "enforce_rate_limit"]
+__all__ = [
+    "AIJobQueueFull",
+    "AIRateLimitExceeded",
+    "AIService",
+    "ai_response_cache_stats",
+    "enforce_rate_limit",
+    "get_ai_job",
+    "invalidate_ai_responses",
+    "iter_ai_job_events",
+    "require_global_quota",
+    "submit_ai_job",
+]
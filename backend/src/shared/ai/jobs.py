@@ -0,0 +1,192 @@
+"""Background execution of AI requests with pollable/streamable results.
+
+Jobs run on a bounded per-process thread pool so a slow model call does not
+hold a web worker. Job state lives in Redis under ``ai:job:<id>`` so any
+worker can answer polls. Jobs are only accepted when ``AI_JOBS_ENABLED`` is
+set (off on serverless, where the pool would be frozen after the response)
+and Redis is available; otherwise callers answer synchronously.
+
+The SSE stream occupies a request worker while open, so it is a short
+long-poll (``AI_JOB_STREAM_TIMEOUT_SECONDS``). It requires the bearer token
+header, so browsers read it with ``fetch`` (not ``EventSource``, which cannot
+send headers) and open a new request after a ``timeout`` event; polling the
+job works just as well.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator
+from uuid import uuid4
+
+from src.config import Config
+from src.extensions import logger
+from src.infra.ai import AIRateLimiter
+from src.infra.cache import get_redis_client
+from src.shared.ai.rate_limit import AIRateLimitExceeded
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+_FINISHED = (JOB_DONE, JOB_FAILED)
+
+_STREAM_POLL_SECONDS = 0.5
+_STREAM_HEARTBEAT_SECONDS = 15.0
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_pending = threading.BoundedSemaphore(max(Config.AI_JOB_MAX_PENDING, 1))
+
+
+class AIJobQueueFull(Exception):
+    """Raised when this worker already has the maximum number of queued jobs."""
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(Config.AI_JOB_WORKERS, 1),
+                    thread_name_prefix="ai-job",
+                )
+    return _executor
+
+
+def _job_key(job_id: str) -> str:
+    return f"ai:job:{job_id}"
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _save(job: dict[str, Any]) -> None:
+    get_redis_client().set_json(
+        _job_key(job["job_id"]), job, ex=Config.AI_JOB_TTL_SECONDS
+    )
+
+
+def _public(job: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in job.items() if k != "user_id"}
+
+
+def submit_ai_job(
+    user_id: str,
+    task: str,
+    run: Callable[[], dict[str, Any]],
+) -> dict[str, Any] | None:
+    """
+    Queue ``run`` as a background job owned by ``user_id``.
+
+    Returns the pending job, or None when jobs are unavailable (disabled or no
+    Redis) and the caller should run synchronously. Raises AIRateLimitExceeded
+    when the user already has the maximum number of jobs in flight,
+    AIJobQueueFull when this worker's queue is full.
+    """
+    if not Config.AI_JOBS_ENABLED:
+        return None
+    redis = get_redis_client()
+    if not redis.enabled:
+        return None
+
+    limiter = AIRateLimiter()
+    slot = limiter.acquire_job_slot(user_id)
+    if not slot.allowed:
+        raise AIRateLimitExceeded(slot.info())
+    if not _pending.acquire(blocking=False):
+        limiter.release_job_slot(user_id)
+        raise AIJobQueueFull()
+
+    job = {
+        "job_id": uuid4().hex,
+        "task": task,
+        "status": JOB_PENDING,
+        "user_id": user_id,
+        "created_at": _now_iso(),
+    }
+    try:
+        _save(job)
+        _get_executor().submit(_execute, dict(job), run)
+    except Exception:
+        _pending.release()
+        limiter.release_job_slot(user_id)
+        raise
+    return _public(job)
+
+
+def _execute(job: dict[str, Any], run: Callable[[], dict[str, Any]]) -> None:
+    try:
+        job["status"] = JOB_RUNNING
+        _save(job)
+        try:
+            job["result"] = run()
+            job["status"] = JOB_DONE
+        except AIRateLimitExceeded as e:
+            job["status"] = JOB_FAILED
+            job["error"] = {"message": str(e), "rate_limit": e.info}
+        except Exception as e:
+            logger.error(f"[AI-JOB] {job['task']} {job['job_id']} failed: {e}")
+            job["status"] = JOB_FAILED
+            job["error"] = {"message": str(e)}
+        job["finished_at"] = _now_iso()
+        _save(job)
+    finally:
+        _pending.release()
+        AIRateLimiter().release_job_slot(job["user_id"])
+
+
+def get_ai_job(job_id: str, user_id: str) -> dict[str, Any] | None:
+    """Return the job if it exists and belongs to ``user_id``."""
+    job = get_redis_client().get_json(_job_key(job_id))
+    if not job or job.get("user_id") != user_id:
+        return None
+    return _public(job)
+
+
+def iter_ai_job_events(job_id: str, user_id: str) -> Iterator[str]:
+    """
+    Yield Server-Sent Events for a job: ``status`` on every state change,
+    then ``result`` with the finished job, or ``timeout`` once the stream
+    window ends while the job is still running (clients request it again).
+    Comment lines keep idle connections open.
+    """
+
+    def event(name: str, data: dict[str, Any]) -> str:
+        return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+    deadline = time.monotonic() + Config.AI_JOB_STREAM_TIMEOUT_SECONDS
+    last_status: str | None = None
+    last_sent = time.monotonic()
+    while time.monotonic() < deadline:
+        job = get_ai_job(job_id, user_id)
+        if job is None:
+            yield event("error", {"message": "Job not found", "job_id": job_id})
+            return
+        if job["status"] in _FINISHED:
+            yield event("result", job)
+            return
+        if job["status"] != last_status:
+            last_status = job["status"]
+            last_sent = time.monotonic()
+            yield event("status", {"job_id": job_id, "status": last_status})
+        elif time.monotonic() - last_sent >= _STREAM_HEARTBEAT_SECONDS:
+            last_sent = time.monotonic()
+            yield ": keep-alive\n\n"
+        time.sleep(_STREAM_POLL_SECONDS)
+    yield event("timeout", {"job_id": job_id, "status": last_status})
+
+
+__all__ = [
+    "AIJobQueueFull",
+    "get_ai_job",
+    "iter_ai_job_events",
+    "submit_ai_job",
+]
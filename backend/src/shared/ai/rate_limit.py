@@ -4,9 +4,29 @@ from typing import Any
 from src.infra.ai import enforce_ai_rate_limit
 
 
-def enforce_rate_limit(subject_id: str | None) -> dict[str, Any] | None:
+class AIRateLimitExceeded(Exception):
+    """Raised when an AI call is refused by the rate limiter."""
+
+    def __init__(self, info: dict[str, Any]) -> None:
+        super().__init__(f"Rate limit exceeded: {info.get('scope')}")
+        self.info = info
+
+
+def enforce_rate_limit(
+    subject_id: str | None, *, include_global: bool = True
+) -> dict[str, Any] | None:
     """
     Check AI rate limits.
     Returns None if allowed, info dict if exceeded.
     """
-    return enforce_ai_rate_limit(subject_id)
+    return enforce_ai_rate_limit(subject_id, include_global=include_global)
+
+
+def require_global_quota() -> None:
+    """
+    Charge one request against the global (model quota) bucket.
+    Raises AIRateLimitExceeded if it is used up.
+    """
+    info = enforce_ai_rate_limit(None)
+    if info:
+        raise AIRateLimitExceeded(info)
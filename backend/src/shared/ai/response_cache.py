@@ -0,0 +1,114 @@
+"""Shared cache of successful AI learning-task responses.
+
+Answers for the dictionary-style tasks depend only on the looked-up text and
+the request parameters, so one Gemini call can serve every user asking the
+same thing. Keys combine the task, its prompt version, the normalized text and
+the language/level parameters; bump a task's entry in ``AI_PROMPT_VERSIONS``
+whenever its prompt changes so stale answers are no longer served.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import unicodedata
+from typing import Any
+
+from src.config import Config
+from src.infra.cache import TieredCache
+
+AI_PROMPT_VERSIONS: dict[str, int] = {
+    "quick_explain": 1,
+    "deep_breakdown": 1,
+    "generate_examples": 1,
+    "create_mnemonic": 1,
+}
+
+_response_cache: TieredCache[dict[str, Any]] = TieredCache(
+    "ai-response", ttl_seconds=Config.AI_RESPONSE_CACHE_TTL_SECONDS
+)
+
+_stats_lock = threading.Lock()
+_stats: dict[str, dict[str, int]] = {}
+
+
+def normalize_ai_text(text: str) -> str:
+    """Normalize looked-up text so trivially different inputs share an entry."""
+    return " ".join(unicodedata.normalize("NFC", text).split()).casefold()
+
+
+def ai_response_cache_key(
+    task: str,
+    text: str,
+    *,
+    learning_lang: str,
+    native_lang: str,
+    level: str | None = None,
+    count: int | None = None,
+) -> str:
+    """Build the cache key for one learning-task request."""
+    digest = hashlib.sha1(normalize_ai_text(text).encode("utf-8")).hexdigest()
+    parts = [
+        task,
+        f"p{AI_PROMPT_VERSIONS[task]}",
+        learning_lang,
+        native_lang,
+        level or "-",
+        str(count) if count is not None else "-",
+        digest,
+    ]
+    return ":".join(parts)
+
+
+def _count(task: str, outcome: str) -> None:
+    with _stats_lock:
+        counters = _stats.setdefault(task, {"hits": 0, "misses": 0, "stores": 0})
+        counters[outcome] += 1
+
+
+def get_cached_ai_response(task: str, key: str) -> dict[str, Any] | None:
+    """Return the cached response for ``key`` (marked ``meta.cached``), or None."""
+    if not Config.AI_RESPONSE_CACHE_ENABLED:
+        return None
+    cached = _response_cache.get(key)
+    _count(task, "hits" if cached is not None else "misses")
+    if cached is None:
+        return None
+    return {**cached, "meta": {**cached.get("meta", {}), "cached": True}}
+
+
+def store_ai_response(task: str, key: str, result: dict[str, Any]) -> None:
+    """Cache ``result`` if it is a successfully parsed JSON answer."""
+    if not Config.AI_RESPONSE_CACHE_ENABLED:
+        return
+    meta = result.get("meta") or {}
+    if not meta.get("isJson") or meta.get("error"):
+        return
+    _response_cache.set(key, result)
+    _count(task, "stores")
+
+
+def ai_response_cache_stats() -> dict[str, dict[str, Any]]:
+    """Return per-task hit/miss/store counters and hit rate for this process."""
+    with _stats_lock:
+        snapshot = {task: dict(counters) for task, counters in _stats.items()}
+    for counters in snapshot.values():
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = round(counters["hits"] / lookups, 4) if lookups else 0.0
+    return snapshot
+
+
+def invalidate_ai_responses() -> None:
+    """Drop every cached AI response (all tasks, all workers)."""
+    _response_cache.invalidate_all()
+
+
+__all__ = [
+    "AI_PROMPT_VERSIONS",
+    "ai_response_cache_key",
+    "ai_response_cache_stats",
+    "get_cached_ai_response",
+    "invalidate_ai_responses",
+    "normalize_ai_text",
+    "store_ai_response",
+]
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 import json
-from typing import Any
+from typing import Any, Callable
 from uuid import uuid4
 
-from src.infra.ai import AIClient
+from src.config import Config
+from src.infra.ai import AIClient, get_ai_coalescer, prompt_flight_key
 from src.infra.cache import get_redis_client
 from src.extensions import logger
+from src.shared.ai.response_cache import (
+    ai_response_cache_key,
+    get_cached_ai_response,
+    store_ai_response,
+)
 
 CHAT_HISTORY_TTL = 12 * 60 * 60  # 12 hours
 
@@ -25,9 +31,16 @@ class AIService:
     """AI service for text explanation, chat, and specialized learning tasks."""
 
     def __init__(self) -> None:
-        self._client = AIClient()
+        self._ai_client: AIClient | None = None
         self._redis = get_redis_client()
 
+    @property
+    def _client(self) -> AIClient:
+        # Built on first use so cached answers never initialise the SDK client.
+        if self._ai_client is None:
+            self._ai_client = AIClient()
+        return self._ai_client
+
     # ──────────────────────────────────────────────
     #  Chat (existing)
     # ──────────────────────────────────────────────
@@ -130,10 +143,22 @@ class AIService:
         text: str,
         learning_lang: str = "fr",
         native_lang: str = "vi",
+        *,
+        before_generate: Callable[[], None] | None = None,
     ) -> dict[str, Any]:
         """Quick explanation of a word/phrase: meaning, POS, pronunciation."""
         prompt = self._build_quick_explain_prompt(text, learning_lang, native_lang)
-        return self._call_json(prompt, "quick_explain")
+        return self._call_json(
+            prompt,
+            "quick_explain",
+            cache_key=ai_response_cache_key(
+                "quick_explain",
+                text,
+                learning_lang=learning_lang,
+                native_lang=native_lang,
+            ),
+            before_generate=before_generate,
+        )
 
     def _build_quick_explain_prompt(
         self, text: str, learning_lang: str, native_lang: str
@@ -164,12 +189,25 @@ class AIService:
         learning_lang: str = "fr",
         native_lang: str = "vi",
         level: str = "B1",
+        *,
+        before_generate: Callable[[], None] | None = None,
     ) -> dict[str, Any]:
         """Deep analysis: grammar, nuance, synonyms, DELF usage."""
         prompt = self._build_deep_breakdown_prompt(
             text, learning_lang, native_lang, level
         )
-        return self._call_json(prompt, "deep_breakdown")
+        return self._call_json(
+            prompt,
+            "deep_breakdown",
+            cache_key=ai_response_cache_key(
+                "deep_breakdown",
+                text,
+                learning_lang=learning_lang,
+                native_lang=native_lang,
+                level=level,
+            ),
+            before_generate=before_generate,
+        )
 
     def _build_deep_breakdown_prompt(
         self, text: str, learning_lang: str, native_lang: str, level: str
@@ -228,12 +266,26 @@ class AIService:
         native_lang: str = "vi",
         level: str = "B1",
         count: int = 3,
+        *,
+        before_generate: Callable[[], None] | None = None,
     ) -> dict[str, Any]:
         """Generate example sentences based on user's level."""
         prompt = self._build_examples_prompt(
             text, learning_lang, native_lang, level, count
         )
-        return self._call_json(prompt, "generate_examples")
+        return self._call_json(
+            prompt,
+            "generate_examples",
+            cache_key=ai_response_cache_key(
+                "generate_examples",
+                text,
+                learning_lang=learning_lang,
+                native_lang=native_lang,
+                level=level,
+                count=count,
+            ),
+            before_generate=before_generate,
+        )
 
     def _build_examples_prompt(
         self, text: str, learning_lang: str, native_lang: str, level: str, count: int
@@ -318,10 +370,22 @@ class AIService:
         text: str,
         learning_lang: str = "fr",
         native_lang: str = "vi",
+        *,
+        before_generate: Callable[[], None] | None = None,
     ) -> dict[str, Any]:
         """Create memory tricks for a word/phrase."""
         prompt = self._build_mnemonic_prompt(text, learning_lang, native_lang)
-        return self._call_json(prompt, "create_mnemonic")
+        return self._call_json(
+            prompt,
+            "create_mnemonic",
+            cache_key=ai_response_cache_key(
+                "create_mnemonic",
+                text,
+                learning_lang=learning_lang,
+                native_lang=native_lang,
+            ),
+            before_generate=before_generate,
+        )
 
     def _build_mnemonic_prompt(
         self, text: str, learning_lang: str, native_lang: str
@@ -356,8 +420,41 @@ class AIService:
     #  Private helpers
     # ──────────────────────────────────────────────
 
-    def _call_json(self, prompt: str, task_name: str) -> dict[str, Any]:
-        """Call AI and parse JSON response. Common pattern for all specialized tasks."""
+    def _call_json(
+        self,
+        prompt: str,
+        task_name: str,
+        *,
+        cache_key: str | None = None,
+        before_generate: Callable[[], None] | None = None,
+    ) -> dict[str, Any]:
+        """Call AI and parse JSON response. Common pattern for all specialized tasks.
+
+        With ``cache_key`` the shared response cache is consulted first and
+        successful answers are stored. ``before_generate`` runs only when the
+        model is actually about to be called (e.g. to charge the global quota)
+        and may raise to abort. Identical prompts already in flight (in any
+        worker) are awaited instead of sent again.
+        """
+        if cache_key:
+            cached = get_cached_ai_response(task_name, cache_key)
+            if cached is not None:
+                return cached
+
+        def generate() -> dict[str, Any]:
+            if before_generate is not None:
+                before_generate()
+            result = self._generate_json(prompt, task_name)
+            if cache_key:
+                store_ai_response(task_name, cache_key, result)
+            return result
+
+        if not Config.AI_COALESCE_ENABLED:
+            return generate()
+        flight_key = prompt_flight_key(prompt, self._client.model_candidates)
+        return get_ai_coalescer().run(flight_key, generate)
+
+    def _generate_json(self, prompt: str, task_name: str) -> dict[str, Any]:
         try:
             raw = self._client.call(prompt)
             logger.debug(f"[AI] {task_name} raw: {raw[:200]}")
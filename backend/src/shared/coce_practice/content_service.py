@@ -0,0 +1,98 @@
+"""Cached CO/CE transcript and questions loading from GitHub."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from src.config import Config
+from src.infra.cache import TieredCache
+from src.shared.coce_practice.repository import GitHubCoCePracticeRepository
+from src.shared.coce_practice.schemas import CoCeQuestionsFile, CoCeTranscript
+
+COCE_CONTENT_CACHE_TTL = int(getattr(Config, "DEFAULT_CACHE_TTL", 3600))
+COCE_QUESTION_VARIANTS = ("co", "ce")
+
+_transcript_cache: TieredCache[CoCeTranscript] = TieredCache(
+    "coce-transcript",
+    ttl_seconds=COCE_CONTENT_CACHE_TTL,
+    encode=lambda transcript: transcript.model_dump(mode="json"),
+    decode=CoCeTranscript.model_validate,
+)
+_questions_cache: TieredCache[CoCeQuestionsFile] = TieredCache(
+    "coce-questions",
+    ttl_seconds=COCE_CONTENT_CACHE_TTL,
+    encode=lambda questions: questions.model_dump(mode="json"),
+    decode=CoCeQuestionsFile.model_validate,
+)
+
+
+def coce_questions_cache_key(exercise_id: str, variant: str) -> str:
+    """Build the cache key for one exercise questions file."""
+    return f"{exercise_id}:{variant.lower()}"
+
+
+def invalidate_coce_content_cache(exercise_id: str) -> None:
+    """Invalidate the cached transcript and both questions files of an exercise."""
+    _transcript_cache.delete(exercise_id)
+    for variant in COCE_QUESTION_VARIANTS:
+        _questions_cache.delete(coce_questions_cache_key(exercise_id, variant))
+
+
+def set_cached_coce_transcript(exercise_id: str, transcript: CoCeTranscript) -> None:
+    """Store a validated transcript in the cache.
+
+    The admin endpoints write saved files through rather than deleting the
+    entry, because raw GitHub may lag a commit by a few minutes and a refill
+    would cache that stale copy for the whole TTL.
+    """
+    _transcript_cache.set(exercise_id, transcript)
+
+
+def set_cached_coce_questions(
+    exercise_id: str,
+    variant: str,
+    questions: CoCeQuestionsFile,
+) -> None:
+    """Store a validated questions file in the cache; see set_cached_coce_transcript."""
+    _questions_cache.set(coce_questions_cache_key(exercise_id, variant), questions)
+
+
+def resolve_coce_transcript(
+    *,
+    exercise: Any,
+    github_repo: GitHubCoCePracticeRepository | None = None,
+) -> CoCeTranscript:
+    """Load an exercise transcript from the cache first, then GitHub on miss."""
+
+    def load() -> CoCeTranscript:
+        repo = github_repo or GitHubCoCePracticeRepository(level=exercise.level)
+        return repo.fetch_transcript(exercise.media_id)
+
+    return _transcript_cache.get_or_load(exercise.id, load)
+
+
+def resolve_coce_questions(
+    *,
+    exercise: Any,
+    variant: str,
+    github_repo: GitHubCoCePracticeRepository | None = None,
+) -> CoCeQuestionsFile:
+    """Load an exercise questions file from the cache first, then GitHub on miss."""
+
+    def load() -> CoCeQuestionsFile:
+        repo = github_repo or GitHubCoCePracticeRepository(level=exercise.level)
+        return repo.fetch_questions(exercise.media_id, variant=variant)
+
+    return _questions_cache.get_or_load(
+        coce_questions_cache_key(exercise.id, variant), load
+    )
+
+
+__all__ = [
+    "coce_questions_cache_key",
+    "invalidate_coce_content_cache",
+    "resolve_coce_questions",
+    "resolve_coce_transcript",
+    "set_cached_coce_questions",
+    "set_cached_coce_transcript",
+]
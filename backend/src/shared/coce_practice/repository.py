@@ -14,10 +14,9 @@ Layout example (for level B2):
 
 from typing import Any
 
-import requests
-
 from src.config import Config
 from src.extensions import logger
+from src.infra.http import get_http_client
 from src.shared.coce_practice.schemas import (
     CoCeManifest,
     CoCeTranscript,
@@ -43,7 +42,7 @@ class GitHubCoCePracticeRepository:
         base_url: str | None = None,
         level: str = "B2",
         lang: str = "fr",
-        timeout: float = 10.0,
+        timeout: float | None = None,
     ) -> None:
         base = base_url or getattr(Config, "NUMBERS_AUDIO_BASE_URL", "").rstrip("/")
         if not base:
@@ -87,7 +86,7 @@ class GitHubCoCePracticeRepository:
 
         url = self.manifest_url()
         logger.info(f"[COCE-GITHUB-REPO] Fetching manifest from {url}")
-        resp = requests.get(url, timeout=self.timeout)
+        resp = get_http_client().get(url, timeout=self.timeout)
         resp.raise_for_status()
 
         try:
@@ -126,7 +125,7 @@ class GitHubCoCePracticeRepository:
         return None
 
     def fetch_json(self, url: str) -> Any:
-        resp = requests.get(url, timeout=self.timeout)
+        resp = get_http_client().get(url, timeout=self.timeout)
         resp.raise_for_status()
         return resp.json()
 
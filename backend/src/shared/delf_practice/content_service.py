@@ -6,14 +6,20 @@ from typing import Any
 
 from src.config import Config
 from src.extensions import logger
-from src.infra.cache import get_redis_client
+from src.infra.cache import TieredCache
 from src.shared.delf_practice.github_repository import GitHubDelfRepository
 from src.shared.delf_practice.github_manager import GitHubDelfManager
 from src.shared.delf_practice.schemas import DelfTestPaper
 
-DELF_CONTENT_CACHE_PREFIX = "delf:test-content:v1"
 DELF_CONTENT_CACHE_TTL = int(getattr(Config, "DEFAULT_CACHE_TTL", 3600))
 
+_content_cache: TieredCache[DelfTestPaper] = TieredCache(
+    "delf-test-content",
+    ttl_seconds=DELF_CONTENT_CACHE_TTL,
+    encode=lambda paper: paper.model_dump(mode="json", by_alias=True),
+    decode=DelfTestPaper.model_validate,
+)
+
 
 def delf_content_cache_key(
     *,
@@ -22,10 +28,8 @@ def delf_content_cache_key(
     section: str,
     test_id: str,
 ) -> str:
-    """Build the Redis key for one DELF paper."""
-    return (
-        f"{DELF_CONTENT_CACHE_PREFIX}:" f"{level.upper()}:{variant}:{section}:{test_id}"
-    )
+    """Build the cache key for one DELF paper."""
+    return f"{level.upper()}:{variant}:{section}:{test_id}"
 
 
 def invalidate_delf_content_cache(
@@ -36,7 +40,7 @@ def invalidate_delf_content_cache(
     test_id: str,
 ) -> None:
     """Invalidate cached DELF paper content."""
-    get_redis_client().delete(
+    _content_cache.delete(
         delf_content_cache_key(
             level=level,
             variant=variant,
@@ -53,8 +57,8 @@ def get_cached_delf_content(
     section: str,
     test_id: str,
 ) -> DelfTestPaper | None:
-    """Read and validate cached DELF content from Redis."""
-    payload = get_redis_client().get_json(
+    """Read validated DELF content from the cache."""
+    return _content_cache.get(
         delf_content_cache_key(
             level=level,
             variant=variant,
@@ -62,24 +66,6 @@ def get_cached_delf_content(
             test_id=test_id,
         )
     )
-    if not isinstance(payload, dict):
-        return None
-
-    content = payload.get("content")
-    if not isinstance(content, dict):
-        return None
-
-    try:
-        return DelfTestPaper.model_validate(content)
-    except Exception as exc:
-        logger.warning("[DELF-CACHE] Invalid cached content for {}: {}", test_id, exc)
-        invalidate_delf_content_cache(
-            level=level,
-            variant=variant,
-            section=section,
-            test_id=test_id,
-        )
-        return None
 
 
 def set_cached_delf_content(
@@ -90,22 +76,15 @@ def set_cached_delf_content(
     test_id: str,
     content: DelfTestPaper,
 ) -> None:
-    """Store validated DELF content in Redis."""
-    get_redis_client().set_json(
+    """Store validated DELF content in the cache."""
+    _content_cache.set(
         delf_content_cache_key(
             level=level,
             variant=variant,
             section=section,
             test_id=test_id,
         ),
-        {
-            "content": content.model_dump(mode="json", by_alias=True),
-            "test_id": test_id,
-            "level": level.upper(),
-            "variant": variant,
-            "section": section,
-        },
-        ex=DELF_CONTENT_CACHE_TTL,
+        content,
     )
 
 
@@ -114,33 +93,28 @@ def resolve_delf_content(
     paper: Any,
     github_repo: GitHubDelfRepository | None = None,
 ) -> DelfTestPaper:
-    """Load one DELF paper from Redis first, then GitHub on cache miss."""
-    cached = get_cached_delf_content(
-        level=paper.level,
-        variant=paper.variant,
-        section=paper.section,
-        test_id=paper.test_id,
-    )
-    if cached is not None:
-        return cached
-
-    repo = github_repo or GitHubDelfRepository()
-    try:
-        content = repo.fetch_test_paper(paper.github_path)
-    except Exception as raw_exc:
-        logger.warning(
-            "[DELF-CACHE] Raw GitHub fetch failed for {}: {}. "
-            "Trying Contents API fallback.",
-            paper.github_path,
-            raw_exc,
-        )
-        data = GitHubDelfManager().read_file(paper.github_path)
-        content = DelfTestPaper.model_validate_json(data.decode("utf-8"))
-    set_cached_delf_content(
-        level=paper.level,
-        variant=paper.variant,
-        section=paper.section,
-        test_id=paper.test_id,
-        content=content,
+    """Load one DELF paper from the cache first, then GitHub on cache miss."""
+
+    def load() -> DelfTestPaper:
+        repo = github_repo or GitHubDelfRepository()
+        try:
+            return repo.fetch_test_paper(paper.github_path)
+        except Exception as raw_exc:
+            logger.warning(
+                "[DELF-CACHE] Raw GitHub fetch failed for {}: {}. "
+                "Trying Contents API fallback.",
+                paper.github_path,
+                raw_exc,
+            )
+            data = GitHubDelfManager().read_file(paper.github_path)
+            return DelfTestPaper.model_validate_json(data.decode("utf-8"))
+
+    return _content_cache.get_or_load(
+        delf_content_cache_key(
+            level=paper.level,
+            variant=paper.variant,
+            section=paper.section,
+            test_id=paper.test_id,
+        ),
+        load,
     )
-    return content
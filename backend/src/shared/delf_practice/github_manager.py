@@ -7,6 +7,7 @@ import binascii
 
 import requests
 
+from src.infra.http import get_http_client
 from src.shared.github_manager import GitHubContentManager
 
 
@@ -22,7 +23,7 @@ class GitHubDelfManager(GitHubContentManager):
         A missing directory is treated as empty. Other GitHub API failures are
         surfaced because callers use this for overwrite preflight checks.
         """
-        response = requests.get(
+        response = get_http_client().get(
             self._content_url(directory_path.strip("/")),
             headers=self._headers(),
             timeout=10,
@@ -56,7 +57,7 @@ class GitHubDelfManager(GitHubContentManager):
         returns an empty list. `extensions` are matched case-insensitively
         and must include the leading dot, e.g. `(".webp", ".png")`.
         """
-        response = requests.get(
+        response = get_http_client().get(
             self._content_url(directory_path.strip("/")),
             headers=self._headers(),
             timeout=10,
@@ -98,7 +99,7 @@ class GitHubDelfManager(GitHubContentManager):
         results: list[str] = []
 
         def walk(path: str, rel_prefix: str = "") -> None:
-            response = requests.get(
+            response = get_http_client().get(
                 self._content_url(path),
                 headers=self._headers(),
                 timeout=10,
@@ -131,7 +132,7 @@ class GitHubDelfManager(GitHubContentManager):
 
     def file_exists(self, file_path: str) -> bool:
         """Return whether a GitHub file path already exists."""
-        response = requests.get(
+        response = get_http_client().get(
             self._content_url(file_path),
             headers=self._headers(),
             timeout=10,
@@ -143,7 +144,7 @@ class GitHubDelfManager(GitHubContentManager):
 
     def read_file(self, file_path: str) -> bytes:
         """Read a GitHub file's raw bytes through the Contents API."""
-        response = requests.get(
+        response = get_http_client().get(
             self._content_url(file_path),
             headers=self._headers(),
             timeout=10,
@@ -160,6 +161,21 @@ class GitHubDelfManager(GitHubContentManager):
                 f"Could not decode GitHub file content for {file_path}"
             ) from exc
 
+    def open_file_stream(self, file_path: str) -> requests.Response:
+        """Stream a GitHub file's raw bytes through the Contents API.
+
+        Uses the raw media type, so the body is not base64-encoded JSON and can
+        be copied to disk chunk by chunk.
+        """
+        response = get_http_client().get(
+            self._content_url(file_path),
+            headers={**self._headers(), "Accept": "application/vnd.github.raw"},
+            timeout=30,
+            stream=True,
+        )
+        response.raise_for_status()
+        return response
+
     def create_file(
         self,
         file_path: str,
@@ -173,7 +189,7 @@ class GitHubDelfManager(GitHubContentManager):
             "content": base64.b64encode(raw_content).decode(),
             "branch": self.base_branch,
         }
-        response = requests.put(
+        response = get_http_client().put(
             self._content_url(file_path),
             json=payload,
             headers=self._headers(),
@@ -8,6 +8,7 @@ import requests
 
 from src.config import Config
 from src.extensions import logger
+from src.infra.http import get_http_client
 from src.shared.delf_practice.schemas import DelfTestPaper
 
 
@@ -18,7 +19,7 @@ class GitHubDelfRepository:
         self,
         *,
         base_url: str | None = None,
-        timeout: float = 10.0,
+        timeout: float | None = None,
     ) -> None:
         base = base_url or getattr(Config, "NUMBERS_AUDIO_BASE_URL", "").rstrip("/")
         if not base:
@@ -56,7 +57,7 @@ class GitHubDelfRepository:
 
     def fetch_json(self, url: str) -> Any:
         """Fetch and parse JSON from a URL."""
-        resp = requests.get(url, timeout=self.timeout)
+        resp = get_http_client().get(url, timeout=self.timeout)
         resp.raise_for_status()
         return resp.json()
 
@@ -69,7 +70,7 @@ class GitHubDelfRepository:
 
     def fetch_raw(self, url: str) -> requests.Response:
         """Fetch raw content (audio/image) from GitHub, returning the response for streaming."""
-        resp = requests.get(url, timeout=30, stream=True)
+        resp = get_http_client().get(url, timeout=30, stream=True)
         resp.raise_for_status()
         return resp
 
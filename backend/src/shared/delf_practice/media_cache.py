@@ -0,0 +1,47 @@
+"""DELF audio and image files in the shared local media cache."""
+
+from __future__ import annotations
+
+import requests
+
+from src.extensions import logger
+from src.infra.cache import CachedBlob, DiskBlobCache
+from src.shared.delf_practice.github_manager import GitHubDelfManager
+from src.shared.delf_practice.github_repository import GitHubDelfRepository
+from src.shared.media_cache import fetch_media, invalidate_media
+
+
+def fetch_delf_media(
+    github_path: str,
+    *,
+    cache: DiskBlobCache,
+    github_repo: GitHubDelfRepository,
+) -> CachedBlob:
+    """Return a cached DELF file, downloading it once on a miss.
+
+    Raw GitHub is tried first; the Contents API (raw media type) is the
+    fallback for files not yet visible on the raw CDN.
+    """
+
+    def open_stream() -> requests.Response:
+        try:
+            return github_repo.fetch_raw(f"{github_repo.base_url}/{github_path}")
+        except Exception as e:
+            logger.info(
+                f"[DELF-MEDIA-CACHE] Raw fetch failed for {github_path}, "
+                f"using Contents API: {e}"
+            )
+            return GitHubDelfManager().open_file_stream(github_path)
+
+    return fetch_media(github_path, open_stream, cache=cache)
+
+
+def invalidate_delf_media(github_path: str) -> None:
+    """Drop a DELF file from the local media cache after it changes upstream."""
+    invalidate_media(github_path)
+
+
+__all__ = [
+    "fetch_delf_media",
+    "invalidate_delf_media",
+]
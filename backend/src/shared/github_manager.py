@@ -8,6 +8,7 @@ import requests
 
 from src.config import Config
 from src.extensions import logger
+from src.infra.http import get_http_client
 
 
 class GitHubContentManager:
@@ -47,7 +48,7 @@ class GitHubContentManager:
         url = self._content_url(file_path)
 
         try:
-            existing = requests.get(url, headers=self._headers(), timeout=10)
+            existing = get_http_client().get(url, headers=self._headers(), timeout=10)
             sha = existing.json().get("sha") if existing.status_code == 200 else None
         except Exception as exc:
             logger.warning(f"[{self.log_prefix}] Could not check existing file: {exc}")
@@ -63,7 +64,9 @@ class GitHubContentManager:
         if sha:
             payload["sha"] = sha
 
-        response = requests.put(url, json=payload, headers=self._headers(), timeout=30)
+        response = get_http_client().put(
+            url, json=payload, headers=self._headers(), timeout=30
+        )
 
         try:
             response.raise_for_status()
@@ -86,7 +89,7 @@ class GitHubContentManager:
         """Delete a file from GitHub."""
         url = self._content_url(file_path)
 
-        existing = requests.get(url, headers=self._headers(), timeout=10)
+        existing = get_http_client().get(url, headers=self._headers(), timeout=10)
         existing.raise_for_status()
         sha = existing.json()["sha"]
 
@@ -96,7 +99,7 @@ class GitHubContentManager:
             "branch": self.base_branch,
         }
 
-        response = requests.delete(
+        response = get_http_client().delete(
             url, json=payload, headers=self._headers(), timeout=30
         )
         response.raise_for_status()
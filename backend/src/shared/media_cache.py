@@ -0,0 +1,128 @@
+"""
+Local disk cache for proxied GitHub media (DELF, speaking practice, numbers).
+
+Keys are repository-relative paths (e.g. ``delf/a2/.../audio/piste.mp3``), so
+every proxy endpoint shares one cache. Cached files are served with
+``send_file``, which answers ``Range`` requests by seeking in the blob and
+``If-None-Match``/``If-Modified-Since`` with ``304`` against the content
+digest and fill time.
+"""
+
+from __future__ import annotations
+
+import mimetypes
+import os
+import tempfile
+import threading
+from typing import BinaryIO, Callable
+
+import requests
+from flask import Response, send_file
+
+from src.config import Config
+from src.extensions import logger
+from src.infra.cache import CachedBlob, DiskBlobCache
+from src.infra.http import get_http_client, iter_response_chunks
+
+_media_cache: DiskBlobCache | None = None
+_media_cache_disabled = False
+_media_cache_lock = threading.Lock()
+
+
+def get_media_cache() -> DiskBlobCache | None:
+    """Return the shared media cache, or None when disabled or unusable."""
+    global _media_cache, _media_cache_disabled
+    if _media_cache is not None or _media_cache_disabled:
+        return _media_cache
+    with _media_cache_lock:
+        if _media_cache is None and not _media_cache_disabled:
+            if not Config.MEDIA_CACHE_ENABLED:
+                _media_cache_disabled = True
+                return None
+            root = Config.MEDIA_CACHE_DIR or os.path.join(
+                tempfile.gettempdir(), "memomap-media"
+            )
+            try:
+                _media_cache = DiskBlobCache(
+                    root,
+                    max_bytes=Config.MEDIA_CACHE_MAX_BYTES,
+                    ttl_seconds=Config.MEDIA_CACHE_TTL_SECONDS,
+                )
+            except OSError as e:
+                logger.warning(f"[MEDIA-CACHE] Disabled, cannot use {root}: {e}")
+                _media_cache_disabled = True
+    return _media_cache
+
+
+def open_media_stream(url: str) -> requests.Response:
+    """Open a streamed GET for a media URL, raising on HTTP errors."""
+    resp = get_http_client().get(url, stream=True)
+    resp.raise_for_status()
+    return resp
+
+
+def fetch_media(
+    key: str,
+    open_stream: Callable[[], requests.Response],
+    *,
+    cache: DiskBlobCache,
+) -> CachedBlob:
+    """Return the cached file for ``key``, downloading it once on a miss.
+
+    ``open_stream`` is only called on a miss; its body is copied to disk chunk
+    by chunk, so large audio files are never held in memory.
+    """
+
+    def fill(out: BinaryIO) -> str | None:
+        resp = open_stream()
+        for chunk in iter_response_chunks(resp):
+            out.write(chunk)
+        return mimetypes.guess_type(key)[0] or resp.headers.get("Content-Type")
+
+    return cache.get_or_fill(key, fill)
+
+
+def invalidate_media(key: str) -> None:
+    """Drop a file from the local media cache after it changes upstream."""
+    cache = get_media_cache()
+    if cache is not None:
+        cache.invalidate(key)
+
+
+def send_media(
+    blob: CachedBlob,
+    *,
+    default_content_type: str,
+    max_age: int = 86400,
+    refill: Callable[[], CachedBlob] | None = None,
+) -> Response:
+    """Serve a cached file with Range, strong ETag and Last-Modified support.
+
+    If the blob was evicted before it could be opened, ``refill`` (normally
+    the ``fetch_media`` call that produced it) is used once to fetch it again.
+    """
+    try:
+        return send_file(
+            blob.path,
+            mimetype=blob.content_type or default_content_type,
+            conditional=True,
+            etag=blob.digest,
+            last_modified=blob.filled_at,
+            max_age=max_age,
+        )
+    except FileNotFoundError:
+        if refill is None:
+            raise
+        logger.info(f"[MEDIA-CACHE] {blob.key} was evicted, refilling")
+        return send_media(
+            refill(), default_content_type=default_content_type, max_age=max_age
+        )
+
+
+__all__ = [
+    "fetch_media",
+    "get_media_cache",
+    "invalidate_media",
+    "open_media_stream",
+    "send_media",
+]
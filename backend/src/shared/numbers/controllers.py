@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from src.shared.numbers.blueprints import NumberType
-from src.shared.numbers.session_engine import NumbersSessionGenerator
+from src.shared.numbers.session_engine import (
+    NumbersSessionGenerator,
+    available_data_versions,
+)
 from src.config import Config
 
 # Singleton generator (pure sampling, no AI)
@@ -39,6 +42,25 @@ def parse_number_types(raw_types: list[str]) -> list[NumberType]:
     return types
 
 
+def resolve_data_version(raw_version: object) -> str:
+    """
+    Validate a client-pinned dataset version, defaulting to the current one.
+
+    Raises ValueError for versions that are not served.
+    """
+    versions = available_data_versions()
+    if raw_version is None or raw_version == "":
+        if not versions:
+            raise ValueError("NUMBERS_DATA_VERSION is not configured")
+        return versions[0]
+    if not isinstance(raw_version, str) or raw_version not in versions:
+        raise ValueError(
+            f"Invalid dataset version: {raw_version}. "
+            f"Available: {', '.join(versions)}"
+        )
+    return raw_version
+
+
 def build_audio_url(raw_audio_ref: str | None) -> str | None:
     """
     Build a client-facing audio URL from a stored audio_ref.
@@ -65,5 +87,6 @@ def build_audio_url(raw_audio_ref: str | None) -> str | None:
 __all__ = [
     "get_generator",
     "parse_number_types",
+    "resolve_data_version",
     "build_audio_url",
 ]
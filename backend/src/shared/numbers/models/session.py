@@ -77,4 +77,5 @@ class NumberDictationSession(BaseModel):
     types: list[NumberType]
     exercises: list[NumberExerciseState]
     current_index: int = 0
+    data_version: str | None = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
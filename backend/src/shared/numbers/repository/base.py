@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import random
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Iterable, Sequence
 
 from src.shared.numbers.blueprints import NumberType
 from src.shared.numbers.models.stored import NumberDictationExercise
@@ -26,3 +27,40 @@ class NumbersExerciseRepository(ABC):
         Return all available exercises matching the given number types.
         """
         raise NotImplementedError
+
+    def count_by_types(
+        self,
+        types: Iterable[NumberType],
+        *,
+        guest_preview_only: bool = False,
+    ) -> int:
+        """
+        Return how many exercises match the given number types.
+        """
+        return len(self.list_by_types(types, guest_preview_only=guest_preview_only))
+
+    def sample_by_types(
+        self,
+        types: Iterable[NumberType],
+        k: int,
+        rng: random.Random,
+        *,
+        guest_preview_only: bool = False,
+    ) -> list[NumberDictationExercise]:
+        """
+        Draw ``k`` distinct exercises uniformly from the given number types.
+        """
+        available = self.list_by_types(types, guest_preview_only=guest_preview_only)
+        return rng.sample(available, k=k)
+
+    def get_by_ids(
+        self,
+        exercise_ids: Sequence[str],
+    ) -> dict[str, NumberDictationExercise]:
+        """
+        Return exercises keyed by ID; unknown IDs are omitted.
+        """
+        wanted = set(exercise_ids)
+        return {
+            ex.id: ex for ex in self.list_by_types(list(NumberType)) if ex.id in wanted
+        }
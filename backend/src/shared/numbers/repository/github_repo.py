@@ -15,20 +15,27 @@ Where:
   - version comes from Config.NUMBERS_DATA_VERSION, e.g. "2025-W50"
 """
 
-from typing import Iterable
-
-import requests
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, Sequence
 
 from src.shared.numbers.blueprints import NumberType
 from src.shared.numbers.models.stored import NumberDictationExercise
 from src.shared.numbers.repository.base import NumbersExerciseRepository
-from src.extensions import logger
+from src.shared.numbers.repository.manifest_cache import (
+    NumbersDataset,
+    NumbersManifestCache,
+)
 
 
 class GitHubNumbersExerciseRepository(NumbersExerciseRepository):
     """
     Load Numbers Dictation exercises from a static manifest hosted on GitHub
     (or any HTTP-accessible endpoint).
+
+    Manifests are held by a ``NumbersManifestCache``; repositories for several
+    versions can share one cache.
     """
 
     def __init__(
@@ -37,7 +44,8 @@ class GitHubNumbersExerciseRepository(NumbersExerciseRepository):
         base_url: str,
         version: str,
         lang: str = "fr",
-        timeout: float = 10.0,
+        timeout: float | None = None,
+        manifest_cache: NumbersManifestCache | None = None,
     ) -> None:
         if not base_url:
             raise ValueError(
@@ -52,46 +60,39 @@ class GitHubNumbersExerciseRepository(NumbersExerciseRepository):
         self.version = version
         self.lang = lang
         self.timeout = timeout
-
-        self._exercises_cache: list[NumberDictationExercise] | None = None
+        self.manifest_cache = manifest_cache or NumbersManifestCache(
+            base_url=self.base_url,
+            timeout=timeout,
+        )
 
     # -------------------------------------------------
     # Internal helpers
     # -------------------------------------------------
 
-    def _manifest_url(self) -> str:
-        return f"{self.base_url}/number-dictation/{self.version}/manifest.json"
+    def _dataset(self) -> NumbersDataset:
+        return self.manifest_cache.get(self.version)
 
     def _load_all_exercises(self) -> list[NumberDictationExercise]:
         """
-        Fetch and cache all exercises from the manifest.
+        Return all exercises of this repository's dataset version.
         """
-        if self._exercises_cache is not None:
-            return self._exercises_cache
-
-        url = self._manifest_url()
-        logger.info(f"[NUMBERS-GITHUB-REPO] Fetching manifest from {url}")
-        resp = requests.get(url, timeout=self.timeout)
-        resp.raise_for_status()
-
-        try:
-            data = resp.json()
-        except ValueError as e:
-            # Provide a clearer error message including a small preview
-            # of the response body to help diagnose invalid JSON.
-            body_preview = resp.text[:200].replace("\n", "\\n")
-            logger.error(
-                f"[NUMBERS-GITHUB-REPO] Failed to parse manifest JSON from {url}: {e} "
-                f"| body_preview={body_preview!r}"
-            )
-            raise ValueError(
-                f"Failed to parse Numbers Dictation manifest at {url}: {e}"
-            ) from e
+        return self._dataset().exercises
 
-        raw_exercises = data.get("exercises", [])
-        exercises = [NumberDictationExercise(**ex) for ex in raw_exercises]
-        self._exercises_cache = exercises
-        return exercises
+    def _buckets_for(
+        self,
+        types: Iterable[NumberType],
+        guest_preview_only: bool,
+    ) -> list[list[NumberDictationExercise]]:
+        buckets = self._dataset().buckets
+        # dict.fromkeys de-duplicates while keeping the caller's type order
+        return [
+            buckets[key]
+            for key in (
+                (number_type, guest_preview_only)
+                for number_type in dict.fromkeys(types)
+            )
+            if key in buckets
+        ]
 
     # -------------------------------------------------
     # Repository API
@@ -103,13 +104,56 @@ class GitHubNumbersExerciseRepository(NumbersExerciseRepository):
         *,
         guest_preview_only: bool = False,
     ) -> list[NumberDictationExercise]:
-        wanted = set(types)
-        all_exercises = self._load_all_exercises()
         return [
             ex
-            for ex in all_exercises
-            if ex.number_type in wanted and (not guest_preview_only or ex.guest_preview)
+            for bucket in self._buckets_for(types, guest_preview_only)
+            for ex in bucket
         ]
 
+    def count_by_types(
+        self,
+        types: Iterable[NumberType],
+        *,
+        guest_preview_only: bool = False,
+    ) -> int:
+        return sum(
+            len(bucket) for bucket in self._buckets_for(types, guest_preview_only)
+        )
+
+    def sample_by_types(
+        self,
+        types: Iterable[NumberType],
+        k: int,
+        rng: random.Random,
+        *,
+        guest_preview_only: bool = False,
+    ) -> list[NumberDictationExercise]:
+        """
+        Sample across type buckets without building the merged list.
+
+        Positions are drawn from a virtual concatenation of the buckets, so the
+        cost depends on ``k`` and the number of types, not the manifest size.
+        """
+        buckets = self._buckets_for(types, guest_preview_only)
+        ends = list(accumulate(len(bucket) for bucket in buckets))
+        total = ends[-1] if ends else 0
+        picks: list[NumberDictationExercise] = []
+        for position in rng.sample(range(total), k=k):
+            index = bisect_right(ends, position)
+            start = ends[index - 1] if index else 0
+            picks.append(buckets[index][position - start])
+        return picks
+
+    def get_by_ids(
+        self,
+        exercise_ids: Sequence[str],
+    ) -> dict[str, NumberDictationExercise]:
+        by_id = self._dataset().by_id
+        return {
+            exercise_id: by_id[exercise_id]
+            for exercise_id in exercise_ids
+            if exercise_id in by_id
+        }
+
 
 __all__ = ["GitHubNumbersExerciseRepository"]
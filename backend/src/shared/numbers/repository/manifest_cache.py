@@ -0,0 +1,283 @@
+"""
+Versioned manifest cache for Numbers Dictation datasets.
+
+Each dataset version is parsed and indexed once, then kept in memory next to
+the other loaded versions so sessions pinned to an older version keep working
+while new sessions roll forward.
+
+- Cold workers start from an on-disk snapshot instead of the network.
+- Snapshots and in-memory copies are revalidated with If-None-Match in a
+  background thread once they are older than ``refresh_seconds``; requests
+  keep being served from the current copy meanwhile.
+- A failed background refresh is retried at most once per
+  ``retry_seconds`` per version, not on every request.
+- Only a version that was never loaded (and has no snapshot) is fetched
+  synchronously.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any
+
+from src.shared.numbers.blueprints import NumberType
+from src.shared.numbers.models.stored import NumberDictationExercise
+from src.extensions import logger
+from src.infra.http import get_http_client
+
+
+class NumbersDataset:
+    """
+    Parsed and indexed manifest of one dataset version.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        exercises: list[NumberDictationExercise],
+        *,
+        etag: str | None = None,
+        fetched_at: float = 0.0,
+    ) -> None:
+        self.version = version
+        self.exercises = exercises
+        self.etag = etag
+        self.fetched_at = fetched_at
+        self.by_id: dict[str, NumberDictationExercise] = {ex.id: ex for ex in exercises}
+        # (number_type, guest_preview_only) -> exercises
+        self.buckets: dict[tuple[NumberType, bool], list[NumberDictationExercise]] = {}
+        for ex in exercises:
+            self.buckets.setdefault((ex.number_type, False), []).append(ex)
+            if ex.guest_preview:
+                self.buckets.setdefault((ex.number_type, True), []).append(ex)
+
+    @classmethod
+    def from_manifest(
+        cls,
+        version: str,
+        data: dict[str, Any],
+        *,
+        etag: str | None = None,
+        fetched_at: float = 0.0,
+    ) -> NumbersDataset:
+        return cls(
+            version,
+            [NumberDictationExercise(**ex) for ex in data.get("exercises", [])],
+            etag=etag,
+            fetched_at=fetched_at,
+        )
+
+
+class NumbersManifestCache:
+    """
+    Thread-safe, multi-version cache of Numbers manifests.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        timeout: float | None = None,
+        snapshot_dir: str | None = None,
+        refresh_seconds: int | None = None,
+        retry_seconds: float = 60.0,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.snapshot_dir = snapshot_dir
+        self.refresh_seconds = refresh_seconds
+        self.retry_seconds = retry_seconds
+
+        self._datasets: dict[str, NumbersDataset] = {}
+        self._refreshing: set[str] = set()
+        # version -> time of the last failed background refresh
+        self._failed_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+
+    def manifest_url(self, version: str) -> str:
+        return f"{self.base_url}/number-dictation/{version}/manifest.json"
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+
+    def get(self, version: str) -> NumbersDataset:
+        """
+        Return the dataset for ``version``, loading it on first use.
+        """
+        dataset = self._datasets.get(version)
+        if dataset is None:
+            dataset = self._load(version)
+        if self._is_stale(version, dataset):
+            self._refresh_in_background(version)
+        return dataset
+
+    def loaded_versions(self) -> list[str]:
+        return sorted(self._datasets)
+
+    def refresh(self, version: str) -> NumbersDataset:
+        """
+        Revalidate ``version`` against the origin and swap in any new manifest.
+        """
+        current = self._datasets.get(version)
+        data, etag = self._fetch(version, current.etag if current else None)
+        now = time.time()
+
+        if data is None and current is not None:
+            # 304: the snapshot on disk is still current; a restarted worker
+            # simply revalidates it once more.
+            current.fetched_at = now
+            return current
+
+        dataset = NumbersDataset.from_manifest(
+            version, data or {}, etag=etag, fetched_at=now
+        )
+        self._datasets[version] = dataset
+        self._write_snapshot(version, data, etag, now)
+        logger.info(
+            f"[NUMBERS-MANIFEST] Loaded {version} "
+            f"({len(dataset.exercises)} exercises, etag={etag})"
+        )
+        return dataset
+
+    # -------------------------------------------------
+    # Loading / refresh
+    # -------------------------------------------------
+
+    def _load(self, version: str) -> NumbersDataset:
+        with self._lock:
+            load_lock = self._load_locks.setdefault(version, threading.Lock())
+        with load_lock:
+            dataset = self._datasets.get(version)
+            if dataset is not None:
+                return dataset
+
+            dataset = self._read_snapshot(version)
+            if dataset is not None:
+                self._datasets[version] = dataset
+                return dataset
+            return self.refresh(version)
+
+    def _is_stale(self, version: str, dataset: NumbersDataset) -> bool:
+        if not self.refresh_seconds:
+            return False
+        now = time.time()
+        if now - self._failed_at.get(version, 0.0) < self.retry_seconds:
+            return False
+        return now - dataset.fetched_at >= self.refresh_seconds
+
+    def _refresh_in_background(self, version: str) -> None:
+        with self._lock:
+            if version in self._refreshing:
+                return
+            self._refreshing.add(version)
+
+        def run() -> None:
+            try:
+                self.refresh(version)
+                self._failed_at.pop(version, None)
+            except Exception as e:
+                # Keep serving the current copy; retry after ``retry_seconds``.
+                self._failed_at[version] = time.time()
+                logger.warning(f"[NUMBERS-MANIFEST] Refresh of {version} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(version)
+
+        threading.Thread(
+            target=run, name=f"numbers-manifest-{version}", daemon=True
+        ).start()
+
+    def _fetch(
+        self,
+        version: str,
+        etag: str | None,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """
+        GET the manifest; returns (None, etag) when the origin answers 304.
+        """
+        url = self.manifest_url(version)
+        headers = {"If-None-Match": etag} if etag else {}
+        logger.info(f"[NUMBERS-MANIFEST] Fetching manifest from {url}")
+        resp = get_http_client().get(url, headers=headers, timeout=self.timeout)
+        if resp.status_code == 304:
+            return None, etag
+        resp.raise_for_status()
+
+        try:
+            data = resp.json()
+        except ValueError as e:
+            # Provide a clearer error message including a small preview
+            # of the response body to help diagnose invalid JSON.
+            body_preview = resp.text[:200].replace("\n", "\\n")
+            logger.error(
+                f"[NUMBERS-MANIFEST] Failed to parse manifest JSON from {url}: {e} "
+                f"| body_preview={body_preview!r}"
+            )
+            raise ValueError(
+                f"Failed to parse Numbers Dictation manifest at {url}: {e}"
+            ) from e
+        return data, resp.headers.get("ETag")
+
+    # -------------------------------------------------
+    # Disk snapshots
+    # -------------------------------------------------
+
+    def _snapshot_path(self, version: str) -> str | None:
+        if not self.snapshot_dir:
+            return None
+        digest = hashlib.sha1(self.manifest_url(version).encode("utf-8")).hexdigest()
+        return os.path.join(self.snapshot_dir, f"numbers-manifest-{digest[:16]}.json")
+
+    def _read_snapshot(self, version: str) -> NumbersDataset | None:
+        path = self._snapshot_path(version)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            return NumbersDataset.from_manifest(
+                version,
+                snapshot["manifest"],
+                etag=snapshot.get("etag"),
+                fetched_at=float(snapshot.get("fetched_at") or 0.0),
+            )
+        except Exception as e:
+            logger.warning(f"[NUMBERS-MANIFEST] Ignoring snapshot {path}: {e}")
+            return None
+
+    def _write_snapshot(
+        self,
+        version: str,
+        data: dict[str, Any],
+        etag: str | None,
+        fetched_at: float,
+    ) -> None:
+        path = self._snapshot_path(version)
+        if not path:
+            return
+        try:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.snapshot_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": version,
+                        "etag": etag,
+                        "fetched_at": fetched_at,
+                        "manifest": data,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"[NUMBERS-MANIFEST] Could not write snapshot {path}: {e}")
+
+
+__all__ = ["NumbersDataset", "NumbersManifestCache"]
@@ -19,20 +19,40 @@ from src.shared.numbers.repository.base import NumbersExerciseRepository
 from src.shared.numbers.repository.github_repo import (
     GitHubNumbersExerciseRepository,
 )
+from src.shared.numbers.repository.manifest_cache import NumbersManifestCache
+from src.shared.numbers.session_store import (
+    InMemoryNumbersSessionStore,
+    NumbersSessionStore,
+    RedisNumbersSessionStore,
+    StoredNumbersSession,
+)
 from src.config import Config
+from src.extensions import logger
 
 # ============================================================
-# Repository access (singleton-style for MVP)
+# Repository access (one repository per dataset version)
 # ============================================================
 
-_REPO: NumbersExerciseRepository | None = None
+_REPOS: dict[str, NumbersExerciseRepository] = {}
+_MANIFEST_CACHE: NumbersManifestCache | None = None
+
+
+def _get_manifest_cache(base_url: str) -> NumbersManifestCache:
+    global _MANIFEST_CACHE
+    if _MANIFEST_CACHE is None:
+        _MANIFEST_CACHE = NumbersManifestCache(
+            base_url=base_url,
+            snapshot_dir=Config.NUMBERS_MANIFEST_SNAPSHOT_DIR,
+            refresh_seconds=Config.NUMBERS_MANIFEST_REFRESH_SECONDS,
+        )
+    return _MANIFEST_CACHE
 
 
-def _get_repo() -> NumbersExerciseRepository:
-    global _REPO
-    if _REPO is None:
+def _get_repo(version: str | None = None) -> NumbersExerciseRepository:
+    version = version or Config.NUMBERS_DATA_VERSION
+    repo = _REPOS.get(version)
+    if repo is None:
         base_url = Config.NUMBERS_AUDIO_BASE_URL
-        version = Config.NUMBERS_DATA_VERSION
         lang = Config.NUMBERS_DATA_LANG or "fr"
 
         if not base_url:
@@ -46,12 +66,22 @@ def _get_repo() -> NumbersExerciseRepository:
                 "version like '2025-W50'."
             )
 
-        _REPO = GitHubNumbersExerciseRepository(
+        repo = GitHubNumbersExerciseRepository(
             base_url=base_url,
             version=version,
             lang=lang,
+            manifest_cache=_get_manifest_cache(base_url),
         )
-    return _REPO
+        _REPOS[version] = repo
+    return repo
+
+
+def available_data_versions() -> list[str]:
+    """
+    Dataset versions clients may pin; the default version comes first.
+    """
+    versions = [Config.NUMBERS_DATA_VERSION, *Config.NUMBERS_DATA_VERSIONS]
+    return [version for version in dict.fromkeys(versions) if version]
 
 
 # ============================================================
@@ -79,6 +109,7 @@ class NumbersSessionGenerator:
         count: int,
         *,
         guest_mode: bool = False,
+        version: str | None = None,
     ) -> list[NumberDictationExercise]:
         if count <= 0:
             raise ValueError("count must be positive")
@@ -87,8 +118,8 @@ class NumbersSessionGenerator:
         if not type_list:
             raise ValueError("At least one number type is required")
 
-        repo = _get_repo()
-        available = repo.list_by_types(type_list, guest_preview_only=guest_mode)
+        repo = _get_repo(version)
+        available = repo.count_by_types(type_list, guest_preview_only=guest_mode)
 
         if not available:
             raise ValueError(
@@ -96,14 +127,16 @@ class NumbersSessionGenerator:
                 "for the requested types."
             )
 
-        if count > len(available):
+        if count > available:
             raise ValueError(
-                f"Requested {count} exercises but only {len(available)} distinct "
+                f"Requested {count} exercises but only {available} distinct "
                 "exercises are available for the requested types."
             )
 
         # Sample WITHOUT replacement to avoid duplicates in a single session
-        return self._rng.sample(available, k=count)
+        return repo.sample_by_types(
+            type_list, count, self._rng, guest_preview_only=guest_mode
+        )
 
     def create_session(
         self,
@@ -111,31 +144,114 @@ class NumbersSessionGenerator:
         count: int,
         *,
         guest_mode: bool = False,
+        version: str | None = None,
     ) -> NumberDictationSession:
-        exercises = self.generate_exercises(types, count, guest_mode=guest_mode)
+        version = version or Config.NUMBERS_DATA_VERSION
+        exercises = self.generate_exercises(
+            types, count, guest_mode=guest_mode, version=version
+        )
 
         states = [NumberExerciseState(exercise=exercise) for exercise in exercises]
 
         return NumberDictationSession(
             types=list(types),
             exercises=states,
+            data_version=version,
         )
 
 
 # ============================================================
-# In-memory session store (MVP)
+# Session store
 # ============================================================
 
-_SESSIONS: dict[str, NumberDictationSession] = {}
+_STORE: NumbersSessionStore | None = None
+
+
+def get_session_store() -> NumbersSessionStore:
+    """
+    Return the configured session store (Redis or in-process LRU).
+    """
+    global _STORE
+    if _STORE is None:
+        ttl_seconds = Config.NUMBERS_SESSION_TTL_SECONDS
+        memory_store = InMemoryNumbersSessionStore(
+            max_entries=Config.NUMBERS_SESSION_MAX_ENTRIES,
+            ttl_seconds=ttl_seconds,
+        )
+        if Config.NUMBERS_SESSION_STORE == "redis":
+            _STORE = RedisNumbersSessionStore(
+                ttl_seconds=ttl_seconds, fallback=memory_store
+            )
+        else:
+            _STORE = memory_store
+    return _STORE
+
+
+def set_session_store(store: NumbersSessionStore | None) -> None:
+    """
+    Override the session store (tests, scripts). None restores the default.
+    """
+    global _STORE
+    _STORE = store
 
 
 def save_session(session: NumberDictationSession) -> NumberDictationSession:
-    _SESSIONS[session.id] = session
+    get_session_store().create(
+        StoredNumbersSession(
+            id=session.id,
+            types=[t.value for t in session.types],
+            version=session.data_version,
+            created_at=session.created_at.isoformat(),
+            entries=[(state.id, state.exercise.id) for state in session.exercises],
+            answers={
+                state.id: state.user_input
+                for state in session.exercises
+                if state.user_input is not None
+            },
+        )
+    )
     return session
 
 
 def get_session(session_id: str) -> NumberDictationSession | None:
-    return _SESSIONS.get(session_id)
+    stored = get_session_store().load(session_id)
+    if stored is None:
+        return None
+
+    exercises = _get_repo(stored.version).get_by_ids(
+        [ex_id for _, ex_id in stored.entries]
+    )
+    states: list[NumberExerciseState] = []
+    for state_id, exercise_id in stored.entries:
+        exercise = exercises.get(exercise_id)
+        if exercise is None:
+            # Dataset changed under a live session; it cannot be rebuilt.
+            logger.warning(
+                f"[NUMBERS] Session {session_id} references unknown exercise "
+                f"{exercise_id}"
+            )
+            return None
+        user_input = stored.answers.get(state_id)
+        states.append(
+            NumberExerciseState(
+                id=state_id,
+                exercise=exercise,
+                user_input=user_input,
+                result=(
+                    check_answer(user_input, exercise)
+                    if user_input is not None
+                    else None
+                ),
+            )
+        )
+
+    return NumberDictationSession(
+        id=stored.id,
+        types=[NumberType(t) for t in stored.types],
+        exercises=states,
+        data_version=stored.version,
+        created_at=datetime.fromisoformat(stored.created_at),
+    )
 
 
 # ============================================================
@@ -207,6 +323,9 @@ def apply_answer(
 ) -> tuple[NumberExerciseState, AnswerResult]:
     """
     Attach a user answer to a specific exercise in the session.
+
+    The answer is persisted with a single atomic store write; results are
+    recomputed from the stored input when the session is loaded again.
     """
     target: NumberExerciseState | None = None
 
@@ -219,6 +338,8 @@ def apply_answer(
         raise ValueError(f"Exercise with id {exercise_id} not found in session")
 
     result = check_answer(user_input, target.exercise)
+    if not get_session_store().record_answer(session.id, target.id, user_input):
+        raise ValueError("Session not found or expired")
     target.user_input = user_input
     target.result = result
 
@@ -282,6 +403,9 @@ def compute_summary(session: NumberDictationSession) -> SessionSummary:
 
 __all__ = [
     "NumbersSessionGenerator",
+    "available_data_versions",
+    "get_session_store",
+    "set_session_store",
     "save_session",
     "get_session",
     "get_next_exercise",
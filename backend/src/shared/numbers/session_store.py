@@ -0,0 +1,245 @@
+"""
+Session stores for Numbers Dictation.
+
+Sessions are persisted in a compact form: the ordered (state_id, exercise_id)
+pairs plus the raw user answers. Exercise models and answer results are
+rebuilt from the dataset by the session engine, so a stored session stays a
+few hundred bytes regardless of exercise content.
+
+Two implementations are provided:
+- InMemoryNumbersSessionStore: per-process LRU with TTL (dev / single worker)
+- RedisNumbersSessionStore: shared across workers, survives restarts; falls
+  back to a process-local store while Redis is unavailable
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable
+
+from src.infra.cache import get_redis_client
+
+NUMBERS_SESSION_KEY_PREFIX = "numbers:session:v1"
+
+_META_FIELD = "meta"
+_ANSWER_FIELD_PREFIX = "a:"
+
+
+@dataclass
+class StoredNumbersSession:
+    """
+    Compact, serializable snapshot of a Numbers Dictation session.
+    """
+
+    id: str
+    types: list[str]
+    created_at: str
+    entries: list[tuple[str, str]]  # (state_id, exercise_id) in session order
+    answers: dict[str, str] = field(default_factory=dict)  # state_id -> input
+    version: str | None = None  # dataset version the exercises come from
+
+    def meta(self) -> dict:
+        return {
+            "types": self.types,
+            "created_at": self.created_at,
+            "entries": [list(entry) for entry in self.entries],
+            "version": self.version,
+        }
+
+    @classmethod
+    def from_meta(
+        cls,
+        session_id: str,
+        meta: dict,
+        answers: dict[str, str] | None = None,
+    ) -> StoredNumbersSession:
+        return cls(
+            id=session_id,
+            types=list(meta["types"]),
+            created_at=meta["created_at"],
+            entries=[(state_id, ex_id) for state_id, ex_id in meta["entries"]],
+            answers=dict(answers or {}),
+            version=meta.get("version"),
+        )
+
+
+class NumbersSessionStore(ABC):
+    """
+    Storage backend for Numbers Dictation sessions.
+    """
+
+    @abstractmethod
+    def create(self, session: StoredNumbersSession) -> None:
+        """
+        Store a new session, replacing any session with the same ID.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, session_id: str) -> StoredNumbersSession | None:
+        """
+        Return the stored session, or None when it is unknown or expired.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def record_answer(self, session_id: str, state_id: str, user_input: str) -> bool:
+        """
+        Atomically store one answer. Returns False when the session is gone.
+        """
+        raise NotImplementedError
+
+
+class InMemoryNumbersSessionStore(NumbersSessionStore):
+    """
+    Process-local LRU store with a sliding TTL.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # session_id -> (expires_at, meta, answers)
+        self._entries: OrderedDict[str, tuple[float, dict, dict[str, str]]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def create(self, session: StoredNumbersSession) -> None:
+        with self._lock:
+            self._entries[session.id] = (
+                self._clock() + self.ttl_seconds,
+                session.meta(),
+                dict(session.answers),
+            )
+            self._entries.move_to_end(session.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def load(self, session_id: str) -> StoredNumbersSession | None:
+        with self._lock:
+            entry = self._live_entry(session_id)
+            if entry is None:
+                return None
+            self._entries.move_to_end(session_id)
+            _, meta, answers = entry
+            return StoredNumbersSession.from_meta(session_id, meta, answers)
+
+    def record_answer(self, session_id: str, state_id: str, user_input: str) -> bool:
+        with self._lock:
+            entry = self._live_entry(session_id)
+            if entry is None:
+                return False
+            _, meta, answers = entry
+            answers[state_id] = user_input
+            self._entries[session_id] = (
+                self._clock() + self.ttl_seconds,
+                meta,
+                answers,
+            )
+            self._entries.move_to_end(session_id)
+            return True
+
+    def _live_entry(self, session_id: str) -> tuple[float, dict, dict[str, str]] | None:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            del self._entries[session_id]
+            return None
+        return entry
+
+
+class RedisNumbersSessionStore(NumbersSessionStore):
+    """
+    Redis hash per session: a JSON ``meta`` field plus one field per answer.
+
+    Answers are written with a single conditional HSET, so concurrent answers
+    to the same session never overwrite each other and an expired session is
+    never resurrected by a late answer.
+
+    While Redis is unavailable (disabled or tripped), sessions are created in
+    and served from ``fallback`` instead, so an outage does not fail requests;
+    sessions stored in Redis come back once it recovers.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: int,
+        fallback: NumbersSessionStore | None = None,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.fallback = fallback
+
+    def _key(self, session_id: str) -> str:
+        return f"{NUMBERS_SESSION_KEY_PREFIX}:{session_id}"
+
+    def create(self, session: StoredNumbersSession) -> None:
+        mapping = {_META_FIELD: json.dumps(session.meta(), separators=(",", ":"))}
+        for state_id, user_input in session.answers.items():
+            mapping[f"{_ANSWER_FIELD_PREFIX}{state_id}"] = user_input
+        if get_redis_client().hset_mapping(
+            self._key(session.id), mapping, ex=self.ttl_seconds
+        ):
+            return
+        if self.fallback is None:
+            raise RuntimeError("Numbers session store is unavailable")
+        self.fallback.create(session)
+
+    def load(self, session_id: str) -> StoredNumbersSession | None:
+        session = self._load_from_redis(session_id)
+        if session is None and self.fallback is not None:
+            return self.fallback.load(session_id)
+        return session
+
+    def record_answer(self, session_id: str, state_id: str, user_input: str) -> bool:
+        if get_redis_client().hset_if_exists(
+            self._key(session_id),
+            {f"{_ANSWER_FIELD_PREFIX}{state_id}": user_input},
+            ex=self.ttl_seconds,
+        ):
+            return True
+        if self.fallback is None:
+            return False
+        return self.fallback.record_answer(session_id, state_id, user_input)
+
+    def _load_from_redis(self, session_id: str) -> StoredNumbersSession | None:
+        raw = get_redis_client().hgetall(self._key(session_id))
+        if not raw or _META_FIELD not in raw:
+            return None
+        try:
+            meta = json.loads(raw[_META_FIELD])
+        except json.JSONDecodeError:
+            return None
+        answers = {
+            name[len(_ANSWER_FIELD_PREFIX) :]: value
+            for name, value in raw.items()
+            if name.startswith(_ANSWER_FIELD_PREFIX)
+        }
+        return StoredNumbersSession.from_meta(session_id, meta, answers)
+
+
+__all__ = [
+    "NUMBERS_SESSION_KEY_PREFIX",
+    "InMemoryNumbersSessionStore",
+    "NumbersSessionStore",
+    "RedisNumbersSessionStore",
+    "StoredNumbersSession",
+]
@@ -0,0 +1,147 @@
+"""Cached speaking-practice topic index, manifest and content loading from GitHub."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from src.config import Config
+from src.extensions import logger
+from src.infra.cache import TieredCache
+from src.shared.speaking_practice_repo import (
+    FALLBACK_TOPICS,
+    SpeakingPracticeRepository,
+)
+
+SPEAKING_CACHE_TTL = int(getattr(Config, "DEFAULT_CACHE_TTL", 3600))
+
+# Manifests missing from the cache are fetched concurrently, at most this many at once.
+_MANIFEST_FETCH_WORKERS = 8
+
+_TOPICS_KEY = "index"
+
+_topics_cache: TieredCache[list[str]] = TieredCache(
+    "speaking-topics", ttl_seconds=SPEAKING_CACHE_TTL
+)
+_manifest_cache: TieredCache[dict[str, Any]] = TieredCache(
+    "speaking-manifest", ttl_seconds=SPEAKING_CACHE_TTL
+)
+_content_cache: TieredCache[dict[str, Any]] = TieredCache(
+    "speaking-content", ttl_seconds=SPEAKING_CACHE_TTL
+)
+
+
+def speaking_content_cache_key(content_path: str) -> str:
+    """Build the cache key for one content.json path."""
+    return content_path.strip("/")
+
+
+def invalidate_speaking_cache(
+    *,
+    topic_id: str | None = None,
+    content_paths: list[str] | tuple[str, ...] = (),
+    topics: bool = False,
+) -> None:
+    """Invalidate cached speaking-practice documents."""
+    if topics:
+        _topics_cache.delete(_TOPICS_KEY)
+    if topic_id:
+        _manifest_cache.delete(topic_id)
+    for content_path in content_paths:
+        _content_cache.delete(speaking_content_cache_key(content_path))
+
+
+def set_cached_speaking_manifest(topic_id: str, manifest: dict[str, Any]) -> None:
+    """Store a topic manifest in the cache.
+
+    Admin saves write the new document through instead of invalidating it:
+    raw GitHub can keep serving the previous file for a few minutes after a
+    commit, and a refill from it would then be cached for a full TTL.
+    """
+    _manifest_cache.set(topic_id, manifest)
+
+
+def set_cached_speaking_content(content_path: str, content: dict[str, Any]) -> None:
+    """Store a content.json document in the cache; see set_cached_speaking_manifest."""
+    _content_cache.set(speaking_content_cache_key(content_path), content)
+
+
+def resolve_speaking_topics(repo: SpeakingPracticeRepository) -> list[str]:
+    """Load the topic index from the cache first, then GitHub on cache miss.
+
+    The built-in fallback list is returned (but not cached) when GitHub fails.
+    """
+    try:
+        return _topics_cache.get_or_load(_TOPICS_KEY, repo.fetch_topics)
+    except Exception as e:
+        logger.warning(f"[SPEAKING-CACHE] Could not fetch topics list: {e}")
+        return list(FALLBACK_TOPICS)
+
+
+def resolve_speaking_manifest(
+    topic_id: str,
+    repo: SpeakingPracticeRepository,
+) -> dict[str, Any]:
+    """Load one topic manifest from the cache first, then GitHub on cache miss."""
+    return _manifest_cache.get_or_load(topic_id, lambda: repo.get_manifest(topic_id))
+
+
+def resolve_speaking_manifests(
+    topic_ids: list[str],
+    repo: SpeakingPracticeRepository,
+) -> dict[str, dict[str, Any]]:
+    """Load many manifests: one cache lookup, then parallel GitHub fetches for misses.
+
+    Topics whose manifest cannot be fetched are logged and left out; the
+    result keeps the order of ``topic_ids``.
+    """
+    cached = _manifest_cache.get_many(topic_ids)
+    missing = [topic_id for topic_id in topic_ids if topic_id not in cached]
+
+    fetched: dict[str, dict[str, Any]] = {}
+    if missing:
+
+        def fetch(topic_id: str) -> dict[str, Any] | None:
+            try:
+                return resolve_speaking_manifest(topic_id, repo)
+            except Exception as e:
+                logger.warning(
+                    f"[SPEAKING-CACHE] Could not fetch manifest for {topic_id}: {e}"
+                )
+                return None
+
+        workers = min(_MANIFEST_FETCH_WORKERS, len(missing))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for topic_id, manifest in zip(missing, pool.map(fetch, missing)):
+                if manifest is not None:
+                    fetched[topic_id] = manifest
+
+    manifests: dict[str, dict[str, Any]] = {}
+    for topic_id in topic_ids:
+        manifest = cached.get(topic_id) or fetched.get(topic_id)
+        if manifest is not None:
+            manifests[topic_id] = manifest
+    return manifests
+
+
+def resolve_speaking_content(
+    content_path: str,
+    repo: SpeakingPracticeRepository,
+) -> dict[str, Any]:
+    """Load one content.json from the cache first, then GitHub on cache miss."""
+    return _content_cache.get_or_load(
+        speaking_content_cache_key(content_path),
+        lambda: repo.get_content(content_path),
+    )
+
+
+__all__ = [
+    "invalidate_speaking_cache",
+    "resolve_speaking_content",
+    "resolve_speaking_manifest",
+    "resolve_speaking_manifests",
+    "resolve_speaking_topics",
+    "set_cached_speaking_content",
+    "set_cached_speaking_manifest",
+    "speaking_content_cache_key",
+]
@@ -14,10 +14,25 @@ Base URL structure:
 
 from __future__ import annotations
 
+from typing import Any, Iterator
+
 import requests
-from typing import Any
 
 from src.extensions import logger
+from src.infra.http import STREAM_CHUNK_SIZE, get_http_client, iter_response_chunks
+
+# Served when topics.json cannot be fetched.
+FALLBACK_TOPICS = (
+    "alimentation",
+    "collocations",
+    "environnement",
+    "reseaux_sociaux",
+    "sante",
+    "technologie",
+    "travail",
+    "uniforme",
+    "vie_privee",
+)
 
 
 class SpeakingPracticeRepository:
@@ -27,7 +42,7 @@ class SpeakingPracticeRepository:
         self,
         *,
         base_url: str,
-        timeout: float = 10.0,
+        timeout: float | None = None,
     ) -> None:
         if not base_url:
             raise ValueError("base_url must be provided")
@@ -40,7 +55,7 @@ class SpeakingPracticeRepository:
         url = f"{self.base_url}/{path}"
         logger.info(f"[SPEAKING-PRACTICE] Fetching JSON from {url}")
 
-        resp = requests.get(url, timeout=self.timeout)
+        resp = get_http_client().get(url, timeout=self.timeout)
         resp.raise_for_status()
 
         try:
@@ -53,15 +68,6 @@ class SpeakingPracticeRepository:
             )
             raise ValueError(f"Failed to parse JSON at {url}: {e}") from e
 
-    def _fetch_bytes(self, path: str) -> bytes:
-        """Fetch raw file bytes from GitHub."""
-        url = f"{self.base_url}/{path}"
-        logger.info(f"[SPEAKING-PRACTICE] Fetching file from {url}")
-
-        resp = requests.get(url, timeout=self.timeout)
-        resp.raise_for_status()
-        return resp.content
-
     def get_manifest(self, topic_id: str) -> dict[str, Any]:
         """Get manifest.json for a specific topic."""
         path = f"speaking-practice/{topic_id}/manifest.json"
@@ -71,36 +77,48 @@ class SpeakingPracticeRepository:
         """Get content.json from a specific path."""
         return self._fetch_json(content_path)
 
-    def get_audio(self, audio_path: str) -> bytes:
-        """Get audio file bytes from a specific path."""
-        return self._fetch_bytes(audio_path)
+    def open_audio_stream(self, audio_path: str) -> requests.Response:
+        """Open a streamed response for an audio file, without buffering it."""
+        url = f"{self.base_url}/{audio_path}"
+        logger.info(f"[SPEAKING-PRACTICE] Streaming audio from {url}")
 
-    def list_topics(self) -> list[str]:
+        resp = get_http_client().get(url, timeout=self.timeout, stream=True)
+        resp.raise_for_status()
+        return resp
+
+    def stream_audio(
+        self,
+        audio_path: str,
+        *,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Yield an audio file in chunks of at most ``chunk_size`` bytes.
+
+        The upstream request is made before this returns, so HTTP errors
+        surface here rather than midway through a streamed response.
+        """
+        resp = self.open_audio_stream(audio_path)
+        return iter_response_chunks(resp, chunk_size=chunk_size)
+
+    def fetch_topics(self) -> list[str]:
         """
-        List all available topics by fetching the root index.
+        Fetch the topic index, raising on any failure.
 
         Note: This requires a topics.json file at the root:
         {BASE_URL}/speaking-practice/topics.json
 
         Format: {"topics": ["alimentation", "environnement", ...]}
         """
+        data = self._fetch_json("speaking-practice/topics.json")
+        return data.get("topics", [])
+
+    def list_topics(self) -> list[str]:
+        """List all available topics, falling back to the known set on failure."""
         try:
-            data = self._fetch_json("speaking-practice/topics.json")
-            return data.get("topics", [])
+            return self.fetch_topics()
         except Exception as e:
             logger.warning(f"[SPEAKING-PRACTICE] Could not fetch topics list: {e}")
-            # Fallback: return known topics
-            return [
-                "alimentation",
-                "collocations",
-                "environnement",
-                "reseaux_sociaux",
-                "sante",
-                "technologie",
-                "travail",
-                "uniforme",
-                "vie_privee",
-            ]
-
-
-__all__ = ["SpeakingPracticeRepository"]
+            return list(FALLBACK_TOPICS)
+
+
+__all__ = ["FALLBACK_TOPICS", "SpeakingPracticeRepository"]
@@ -0,0 +1,109 @@
+"""Fast JSON encoding for API responses.
+
+Uses orjson when it is installed (and ``JSON_ENCODER`` is not ``stdlib``),
+otherwise the standard library. Output matches Flask's default provider:
+``datetime``/``date`` values are written as HTTP dates (RFC 1123, e.g.
+``"Fri, 02 Jan 2026 03:04:05 GMT"``), so payloads that need ISO 8601 convert
+those fields themselves. ``ObjectId``, pydantic models, dataclasses, enums,
+UUIDs, sets and ``Decimal`` are handled as well.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import uuid
+from datetime import date, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+
+from src.config import Config
+
+try:  # Optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+try:
+    from bson import ObjectId
+except ImportError:  # pragma: no cover - pymongo is a hard dependency
+    ObjectId = None
+
+try:
+    from pydantic import BaseModel
+except ImportError:  # pragma: no cover - pydantic is a hard dependency
+    BaseModel = None
+
+# Datetimes go through json_default, as with the stdlib encoder.
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None
+    else 0
+)
+
+
+def json_default(obj: Any) -> Any:
+    """Convert values the JSON encoders do not handle natively."""
+    if isinstance(obj, date):
+        return http_date(obj)
+    if isinstance(obj, time):
+        return obj.isoformat()
+    if ObjectId is not None and isinstance(obj, ObjectId):
+        return str(obj)
+    if BaseModel is not None and isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (uuid.UUID, Decimal)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def use_orjson() -> bool:
+    """Whether the orjson fast path is active."""
+    return orjson is not None and Config.JSON_ENCODER != "stdlib"
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+    if use_orjson():
+        try:
+            return orjson.dumps(obj, default=json_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits: let the stdlib encoder decide.
+            pass
+    return json.dumps(
+        obj, default=json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by ``dumps_bytes`` (used by ``jsonify``)."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            kwargs.setdefault("default", json_default)
+            return json.dumps(obj, **kwargs)
+        return dumps_bytes(obj).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if use_orjson() and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype=self.mimetype)
+
+
+__all__ = ["FastJSONProvider", "dumps_bytes", "json_default", "use_orjson"]